@@ -5,7 +5,7 @@ from .memcfg import MemoryConfig
 from .runcfg import RunConfig
 from .runtime import Runtime
 from .handler import EventHandler
-from .errors import Bare68kException, ConfigError, InternalError
+from .errors import Bare68kException, ConfigError, InternalError, CallError
 from .label import LabelMgr, DummyLabelMgr
 from . import runtime
 from . import api
@@ -0,0 +1,67 @@
+"""asyncio support for the bare68k runtime.
+
+This module needs Python 3.5 or newer. Use it via
+:meth:`bare68k.Runtime.run_async`.
+"""
+
+import asyncio
+import inspect
+import time
+
+import bare68k.api.cpu as cpu
+
+from bare68k.consts import *
+
+
+async def run_async(runtime, reset_end_pc=None, start_pc=None, start_sp=None,
+                    max_cycles=None, max_instructions=None, deadline=None):
+    """run the CPU of the runtime in slices and yield to the event loop
+
+    See :meth:`bare68k.Runtime.run_async`.
+    """
+    catch_kb_intr = runtime._run_cfg._catch_kb_intr
+    cycles_per_run = runtime._run_cfg._cycles_per_run
+    state = runtime._run_begin(reset_end_pc, start_pc, start_sp,
+                               max_cycles, max_instructions, deadline)
+    timer = time.time
+
+    try:
+        while state.stay:
+            try:
+                start = timer()
+                # execute a single slice of CPU code
+                num_events = cpu.execute(cycles_per_run)
+            except KeyboardInterrupt as e:
+                runtime._log.debug("keyboard interrupt")
+                if not catch_kb_intr:
+                    raise e
+                state.results.append((CPU_EVENT_USER_ABORT, None))
+                break
+            finally:
+                end = timer()
+                state.cpu_time += end - start
+
+            # dispatch events
+            if num_events > 0:
+                run_info = cpu.get_info()
+                state.results = []
+                for event in run_info.events:
+                    # a callback returned an awaitable: suspend guest
+                    if inspect.isawaitable(event.data):
+                        state.stats.count(event.ev_type)
+                        await event.data
+                        continue
+                    handler = runtime._run_get_handler(state, event)
+                    if handler is not None:
+                        result = handler(event)
+                        if inspect.isawaitable(result):
+                            result = await result
+                        # handler wants to exit run loop
+                        if runtime._run_result(state, event, result):
+                            break
+
+            # give other tasks a chance
+            await asyncio.sleep(0)
+    finally:
+        ri = runtime._run_end(state)
+    return ri
@@ -2,5 +2,6 @@ from . import cpu
 from . import disasm
 from . import mem
 from . import tools
+from . import irq
 from . import traps
 from . import label
@@ -8,6 +8,10 @@ get_cpu_context = mach.get_cpu_context
 Read the CPU context if you want to save the entire state. You can later
 restore the full CPU state with :func:`set_cpu_context`.
 
+Args:
+    ctx (:obj:`CPUContext`, optional): store the state in this context
+        instead of allocating a new one
+
 Returns:
     :obj:`CPUContext` native context object contains stored state
 """
@@ -38,6 +42,39 @@ w_sp = mach.w_sp
 r_sr = mach.r_sr
 w_sr = mach.w_sr
 
+# batch register access
+r_regs = mach.r_regs
+"""Read a sequence of registers at once.
+
+Args:
+    regs (iterable): ``M68K_REG_`` numbers
+
+Returns:
+    tuple: the unsigned register values in the given order
+"""
+
+rs_regs = mach.rs_regs
+"""Read a sequence of registers at once as signed values."""
+
+w_regs = mach.w_regs
+"""Write several registers at once.
+
+Args:
+    values (dict or iterable): maps ``M68K_REG_`` numbers to values or
+        gives ``(reg, value)`` pairs. Negative values are stored as two's
+        complement.
+"""
+
+get_reg_view = mach.get_reg_view
+"""Return a live view of the data and address registers.
+
+The :obj:`memoryview` of 16 native unsigned ints maps ``D0-D7`` to index
+0-7 and ``A0-A7`` to 8-15, i.e. the index equals the ``M68K_REG_`` number.
+Reads and writes go directly to the register file of the CPU without a
+copy. ``A7`` is the active stack pointer. The view stays valid for the
+lifetime of the machine.
+"""
+
 # debug
 get_sr_str = mach.get_sr_str
 get_regs = mach.get_regs
@@ -51,12 +88,77 @@ set_instr_hook_func = mach.set_instr_hook_func
 set_irq = mach.set_irq
 set_int_ack_func = mach.set_int_ack_func
 
+get_clock = mach.get_clock
+"""Return the number of CPU cycles run since machine init.
+
+Unlike the total cycles in the run info the clock is not reset by
+:func:`pulse_reset`. The irq scheduler uses it as its time base.
+"""
+
 # run
 pulse_reset = mach.pulse_reset
 execute = mach.execute
 execute_to_event = mach.execute
 execute_to_event_checked = mach.execute_to_event_checked
 
+has_callbacks = mach.has_callbacks
+"""Check if CPU execution may call back into Python.
+
+If no instruction hook, int ack function, memory trace function or special
+memory range is installed then :func:`execute_to_event_checked` releases
+the GIL while the CPU runs. Other threads must not access the machine then.
+
+Returns:
+    bool: True if Python callbacks are installed
+"""
+
+is_executing = mach.is_executing
+"""Check if the CPU is currently executing code.
+
+This is True inside of callbacks that are called directly by the CPU
+emulation, e.g. direct call traps, special memory handlers or instruction
+hooks. The CPU must not be run again from there.
+
+Returns:
+    bool: True while the CPU executes
+"""
+
+# budget
+set_budget = mach.set_budget
+"""Limit the execution of the CPU.
+
+If a limit is reached a ``CPU_EVENT_BUDGET`` event is generated. Its value
+tells which limit was hit (``CPU_BUDGET_CYCLES``, ``CPU_BUDGET_INSTR`` or
+``CPU_BUDGET_DEADLINE``). Each limit fires only once. Cycle and time limits
+are checked at slice boundaries. The instruction limit stops the CPU right
+after the last allowed instruction and the event gives its address.
+
+Args:
+    max_cycles (int): number of cycles from now on or 0 for no limit
+    max_instructions (int): number of instructions or 0 for no limit
+    timeout (float): wall clock seconds from now on or 0 for no limit
+"""
+
+clear_budget = mach.clear_budget
+
+get_budget = mach.get_budget
+"""Return the current budget state.
+
+The state holds the remaining limits as absolute values and is only useful
+as an argument for :func:`restore_budget`. Use it to suspend a budget while
+running nested code.
+
+Returns:
+    tuple: opaque budget state
+"""
+
+restore_budget = mach.restore_budget
+"""Restore a budget state returned by :func:`get_budget`.
+
+Args:
+    state (tuple): the budget state
+"""
+
 # run info
 get_info = mach.get_info
 get_num_events = mach.get_num_events
@@ -5,3 +5,7 @@ disassemble_range = mach.disassemble_range
 disassemble_buffer = mach.disassemble_buffer
 disassemble_memory = mach.disassemble_memory
 disassemble_is_valid = mach.disassemble_is_valid
+disassemble_decode = mach.disassemble_decode
+disassemble_decode_range = mach.disassemble_decode_range
+disassemble_range_buffer = mach.disassemble_range_buffer
+disassemble_boundaries = mach.disassemble_boundaries
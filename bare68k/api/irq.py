@@ -0,0 +1,60 @@
+"""The :mod:`bare68k.api.irq` module wraps the native interrupt scheduler.
+
+The scheduler raises interrupt levels at given CPU cycles without calling
+back into Python. Execution slices are cut at the scheduled times so the
+interrupts are raised exactly on time.
+"""
+
+from ._getmach import mach
+
+get_max_irqs = mach.get_max_irqs
+get_num_irqs = mach.get_num_irqs
+
+schedule_irq = mach.schedule_irq
+"""Schedule the assertion of an interrupt level.
+
+Args:
+    level (int): interrupt level 1..7
+    delay (int): number of CPU cycles from now until the irq is asserted
+    duration (int): cycles the level stays asserted. 0 keeps it asserted
+        until the interrupt is acknowledged by the CPU
+    period (int): if not 0 then assert the irq again every period cycles
+    vector (int): vector number returned in the interrupt acknowledge cycle
+        or ``M68K_INT_ACK_AUTOVECTOR``
+
+Returns:
+    int id of the scheduled irq
+
+Raises:
+    ValueError: if the level is invalid
+    MemoryError: if no free irq entry is left
+"""
+
+cancel_irq = mach.cancel_irq
+"""Cancel a scheduled irq and deassert its level.
+
+Args:
+    irq_id (int): id returned by :func:`schedule_irq`
+"""
+
+cancel_all_irqs = mach.cancel_all_irqs
+is_irq_active = mach.is_irq_active
+get_irq_level = mach.get_irq_level
+
+set_int_ack_vector = mach.set_int_ack_vector
+"""Set the native answer of the interrupt acknowledge for a level.
+
+By default all levels are ``INT_ACK_DYNAMIC`` and the function set with
+:func:`bare68k.api.cpu.set_int_ack_func` is called. A level with a fixed
+vector, ``M68K_INT_ACK_AUTOVECTOR`` or ``M68K_INT_ACK_SPURIOUS`` is
+acknowledged without calling Python.
+
+Args:
+    level (int): interrupt level 1..7
+    vector (int): vector number 0..255, ``M68K_INT_ACK_AUTOVECTOR``,
+        ``M68K_INT_ACK_SPURIOUS`` or ``INT_ACK_DYNAMIC``
+    auto_clear (bool): clear the irq level set with
+        :func:`bare68k.api.cpu.set_irq` on acknowledge
+"""
+
+get_int_ack_vector = mach.get_int_ack_vector
@@ -8,6 +8,17 @@ copy_block = mach.copy_block
 r_block = mach.r_block
 w_block = mach.w_block
 
+# typed arrays of big endian values
+r16_array = mach.r16_array
+r32_array = mach.r32_array
+rs16_array = mach.rs16_array
+rs32_array = mach.rs32_array
+w16_array = mach.w16_array
+w32_array = mach.w32_array
+ws16_array = mach.ws16_array
+ws32_array = mach.ws32_array
+r_numpy = mach.r_numpy
+
 # special string/bcpl access
 r_cstr = mach.r_cstr
 w_cstr = mach.w_cstr
@@ -16,6 +27,13 @@ w_bstr = mach.w_bstr
 wb32 = mach.wb32
 rb32 = mach.rb32
 
+# guest structures and lists
+StructLayout = mach.StructLayout
+struct_walk_list = mach.struct_walk_list
+
+# guest heap
+Heap = mach.Heap
+
 # unsigned access
 w8 = mach.w8
 w16 = mach.w16
@@ -38,6 +56,17 @@ add_memory = mach.add_memory
 add_special = mach.add_special
 add_empty = mach.add_empty
 add_mirror = mach.add_mirror
+add_special_sub = mach.add_special_sub
+add_empty_sub = mach.add_empty_sub
+is_split_page = mach.is_split_page
+get_sub_page_shift = mach.get_sub_page_shift
+get_num_page_blocks = mach.get_num_page_blocks
+
+# snapshot of RAM/ROM contents: restore only copies back changed sub pages
+take_snapshot = mach.take_snapshot
+restore_snapshot = mach.restore_snapshot
+free_snapshot = mach.free_snapshot
+has_snapshot = mach.has_snapshot
 
 # trace
 set_mem_cpu_trace_func = mach.set_mem_cpu_trace_func
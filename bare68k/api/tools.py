@@ -6,6 +6,9 @@ get_pc_trace_size = mach.get_pc_trace_size
 setup_pc_trace = mach.setup_pc_trace
 cleanup_pc_trace = mach.cleanup_pc_trace
 get_pc_trace = mach.get_pc_trace
+set_pc_trace_mode = mach.set_pc_trace_mode
+get_pc_trace_mode = mach.get_pc_trace_mode
+get_branch_trace = mach.get_branch_trace
 
 # breakpoints
 
@@ -20,6 +23,9 @@ enable_breakpoint = mach.enable_breakpoint
 disable_breakpoint = mach.disable_breakpoint
 is_breakpoint_enabled = mach.is_breakpoint_enabled
 get_breakpoint_data = mach.get_breakpoint_data
+get_breakpoint_hits = mach.get_breakpoint_hits
+clear_breakpoint_hits = mach.clear_breakpoint_hits
+set_breakpoint_condition = mach.set_breakpoint_condition
 
 # watchpoints
 
@@ -34,6 +40,9 @@ enable_watchpoint = mach.enable_watchpoint
 disable_watchpoint = mach.disable_watchpoint
 is_watchpoint_enabled = mach.is_watchpoint_enabled
 get_watchpoint_data = mach.get_watchpoint_data
+get_watchpoint_hits = mach.get_watchpoint_hits
+clear_watchpoint_hits = mach.clear_watchpoint_hits
+set_watchpoint_condition = mach.set_watchpoint_condition
 
 # timers
 
@@ -48,3 +57,38 @@ enable_timer = mach.enable_timer
 disable_timer = mach.disable_timer
 is_timer_enabled = mach.is_timer_enabled
 get_timer_data = mach.get_timer_data
+get_next_timer = mach.get_next_timer
+
+# idle detection
+
+set_idle_detection = mach.set_idle_detection
+is_idle_detection_enabled = mach.is_idle_detection_enabled
+get_idle_cycles = mach.get_idle_cycles
+
+# opcode stats
+
+setup_opcode_stats = mach.setup_opcode_stats
+is_opcode_stats_enabled = mach.is_opcode_stats_enabled
+clear_opcode_stats = mach.clear_opcode_stats
+get_instr_count = mach.get_instr_count
+get_opcode_stats = mach.get_opcode_stats
+
+# coverage
+
+setup_coverage = mach.setup_coverage
+is_coverage_enabled = mach.is_coverage_enabled
+clear_coverage = mach.clear_coverage
+get_coverage_page_size = mach.get_coverage_page_size
+get_coverage = mach.get_coverage
+merge_coverage = mach.merge_coverage
+
+# edge map
+
+setup_edge_map = mach.setup_edge_map
+is_edge_map_enabled = mach.is_edge_map_enabled
+get_edge_map_size = mach.get_edge_map_size
+clear_edge_map = mach.clear_edge_map
+clear_edge_virgin = mach.clear_edge_virgin
+get_edge_map = mach.get_edge_map
+update_edge_virgin = mach.update_edge_virgin
+get_num_edges = mach.get_num_edges
@@ -6,6 +6,35 @@ trap_setup = mach.trap_setup
 trap_setup_abs = mach.trap_setup_abs
 trap_free = mach.trap_free
 
+trap_setup_call = mach.trap_setup_call
+"""Setup a trap that directly calls a function with register arguments.
+
+The function is called while the CPU executes the trap. It receives the
+unsigned values of the given argument registers as plain ints. A return
+value other than None is written to the return register. No event is
+generated, an exception raised in the function is reported as a
+``CPU_EVENT_CALLBACK_ERROR`` event. Combine with ``TRAP_AUTO_RTS`` for a
+library call. The function must not run the CPU, e.g. with
+:meth:`bare68k.Runtime.call`; use :func:`trap_setup` for this.
+
+Args:
+    flags (int): ``TRAP_`` flags
+    func (callable): the function called with the register values
+    args (iterable): ``M68K_REG_`` numbers of the arguments
+    ret (int, optional): ``M68K_REG_`` number of the return register
+
+Returns:
+    int: the opcode of the trap
+"""
+
+trap_setup_call_abs = mach.trap_setup_call_abs
+"""Setup a direct call trap with a given trap id.
+
+See :func:`trap_setup_call`. The trap id is the first argument.
+"""
+
+TrapCall = mach.TrapCall
+
 traps_get_num_free = mach.traps_get_num_free
 
 trap_enable = mach.trap_enable
@@ -110,6 +110,8 @@ M68K_INT_ACK_AUTOVECTOR = 0xffffffff
 """interrupt acknowledge to perform autovectoring"""
 M68K_INT_ACK_SPURIOUS = 0xfffffffe
 """interrupt acknowledge to cause spurios irq"""
+INT_ACK_DYNAMIC = 0xfffffffd
+"""int ack vector table entry: ask the int ack function"""
 
 
 # memory region flags
@@ -195,6 +197,48 @@ MEM_ACCESS_BCOPY = 0x6400
 """copy a memory block"""
 
 
+# pc trace modes
+
+PC_TRACE_ALL = 0
+"""pc trace records every executed instruction"""
+PC_TRACE_BRANCH = 1
+"""pc trace records only source and target of taken branches and jumps"""
+
+
+# break/watch point flags
+
+POINT_FLAG_COUNT = 0x10000
+"""point only counts its hits and never creates an event"""
+
+# break/watch point condition terms
+
+COND_REG = 0
+"""condition term: compare a CPU register"""
+COND_MEM8 = 1
+"""condition term: compare a byte in RAM"""
+COND_MEM16 = 2
+"""condition term: compare a word in RAM"""
+COND_MEM32 = 3
+"""condition term: compare a long in RAM"""
+COND_VALUE = 4
+"""condition term: compare the value accessed at a watchpoint"""
+COND_HITS = 5
+"""condition term: compare the hit count of the point"""
+
+# break/watch point condition compare ops
+
+COND_EQ = 0
+COND_NE = 1
+COND_LT = 2
+COND_LE = 3
+COND_GT = 4
+COND_GE = 5
+COND_SLT = 6
+COND_SLE = 7
+COND_SGT = 8
+COND_SGE = 9
+
+
 # traps
 
 TRAP_DEFAULT = 0
@@ -234,14 +278,16 @@ CPU_EVENT_WATCHPOINT = 10
 """a watchpoint was hit"""
 CPU_EVENT_TIMER = 11
 """a timer fired"""
+CPU_EVENT_BUDGET = 12
+"""a cycle, instruction or time budget is exhausted"""
 
-CPU_NUM_EVENTS = 12
+CPU_NUM_EVENTS = 13
 """total number of machine CPU events"""
 
 # extra events (created by runtime)
-CPU_EVENT_USER_ABORT = 12
+CPU_EVENT_USER_ABORT = 13
 """runtime flag, user aborted run with a ``KeyboardInterrupt``"""
-CPU_EVENT_DONE = 13
+CPU_EVENT_DONE = 14
 """runtime flag, reached end of processing.
 
 E.g. a RESET opcode was encountered.
@@ -261,6 +307,94 @@ CPU_EVENT_NAMES = (
     "BREAKPOINT",  # 9
     "WATCHPOINT",  # 10
     "TIMER",  # 11
-    "USER_ABORT",  # 12
-    "DONE",  # 13
+    "BUDGET",  # 12
+    "USER_ABORT",  # 13
+    "DONE",  # 14
 )
+
+# budget event values
+
+CPU_BUDGET_CYCLES = 1
+"""budget event value: the cycle limit was reached"""
+CPU_BUDGET_INSTR = 2
+"""budget event value: the instruction limit was reached"""
+CPU_BUDGET_DEADLINE = 3
+"""budget event value: the wall clock deadline passed"""
+
+# edge map update values
+
+EDGE_MAP_NONE = 0
+"""edge map update: no new coverage"""
+EDGE_MAP_NEW_COUNT = 1
+"""edge map update: a known edge was hit with a new hit count bucket"""
+EDGE_MAP_NEW_EDGE = 2
+"""edge map update: a new edge was hit"""
+
+# decoded disassembler operand kinds
+
+DISASM_OP_DREG = 0
+"""operand: data register ``Dn``"""
+DISASM_OP_AREG = 1
+"""operand: address register ``An``"""
+DISASM_OP_AIND = 2
+"""operand: address register indirect ``(An)``"""
+DISASM_OP_APOSTINC = 3
+"""operand: address register indirect with post increment ``(An)+``"""
+DISASM_OP_APREDEC = 4
+"""operand: address register indirect with pre decrement ``-(An)``"""
+DISASM_OP_ADISP = 5
+"""operand: ``(d,An)`` with the displacement in value"""
+DISASM_OP_AINDEX = 6
+"""operand: ``(d,An,Xn)`` with the displacement in value and Xn in index"""
+DISASM_OP_ABSW = 7
+"""operand: absolute short address ``$x.w``, value is sign extended"""
+DISASM_OP_ABSL = 8
+"""operand: absolute long address ``$x.l``"""
+DISASM_OP_PCDISP = 9
+"""operand: ``(d,PC)`` with the target address in value"""
+DISASM_OP_PCINDEX = 10
+"""operand: ``(d,PC,Xn)`` with the displacement in value and Xn in index"""
+DISASM_OP_IMM = 11
+"""operand: immediate value ``#x``"""
+DISASM_OP_ADDR = 12
+"""operand: target address of a branch"""
+DISASM_OP_REGLIST = 13
+"""operand: movem register list with mask in value (D0=bit 0 .. A7=bit 15)"""
+DISASM_OP_CTRL = 14
+"""operand: a control register (``SR``, ``USP``, ``VBR``...), reg is a M68K_REG_ value"""
+DISASM_OP_CCR = 15
+"""operand: the condition code register ``CCR``"""
+DISASM_OP_OTHER = 16
+"""operand: not decoded, see the args string"""
+
+# index byte of decoded AINDEX and PCINDEX operands
+
+DISASM_INDEX_NONE = 0xff
+"""index: no index register given"""
+DISASM_INDEX_REG = 0x0f
+"""index mask: index register 0-7 is D0-D7, 8-15 is A0-A7"""
+DISASM_INDEX_LONG = 0x10
+"""index flag: index register is used with long size"""
+DISASM_INDEX_SCALE = 0x60
+"""index mask: scale factor given as shift value 0..3"""
+DISASM_INDEX_SCALE_SHIFT = 5
+"""index: bit position of the scale shift"""
+
+# field types of guest structures
+
+STRUCT_U8 = 0
+"""struct field: unsigned byte"""
+STRUCT_S8 = 1
+"""struct field: signed byte"""
+STRUCT_U16 = 2
+"""struct field: unsigned word"""
+STRUCT_S16 = 3
+"""struct field: signed word"""
+STRUCT_U32 = 4
+"""struct field: unsigned long"""
+STRUCT_S32 = 5
+"""struct field: signed long"""
+STRUCT_CSTR = 6
+"""struct field: pointer to a C string, read as the string"""
+STRUCT_BSTR = 7
+"""struct field: BCPL pointer to a BCPL string, read as the string"""
@@ -1,3 +1,7 @@
 from . import disassemble
 from . import regdump
 from . import cpusnapshot
+from . import opstats
+from . import coverage
+from . import condition
+from . import listing
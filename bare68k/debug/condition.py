@@ -0,0 +1,119 @@
+import re
+
+import bare68k.api.tools as tools
+from bare68k.consts import *
+
+_reg_names = {
+    "pc": M68K_REG_PC,
+    "sr": M68K_REG_SR,
+    "sp": M68K_REG_SP,
+    "usp": M68K_REG_USP,
+    "isp": M68K_REG_ISP,
+    "msp": M68K_REG_MSP,
+    "vbr": M68K_REG_VBR,
+}
+for _i in range(8):
+    _reg_names["d%d" % _i] = M68K_REG_D0 + _i
+    _reg_names["a%d" % _i] = M68K_REG_A0 + _i
+
+_mem_kinds = {
+    "b": COND_MEM8,
+    "w": COND_MEM16,
+    "l": COND_MEM32,
+}
+
+_ops = {
+    "==": COND_EQ,
+    "!=": COND_NE,
+    "<": COND_LT,
+    "<=": COND_LE,
+    ">": COND_GT,
+    ">=": COND_GE,
+    "s<": COND_SLT,
+    "s<=": COND_SLE,
+    "s>": COND_SGT,
+    "s>=": COND_SGE,
+}
+
+_term_re = re.compile(
+    r"^\s*(?P<lhs>[a-z0-9]+(\[[^\]]+\])?)"
+    r"(\s*&\s*(?P<mask>\S+?))?"
+    r"\s*(?P<op>==|!=|s?<=|s?>=|s?<|s?>)"
+    r"\s*(?P<value>\S+)\s*$")
+_mem_re = re.compile(r"^(?P<size>[bwl])\[(?P<addr>[^\]]+)\]$")
+_and_re = re.compile(r"\s*(?:&&|\band\b)\s*")
+
+
+def _parse_int(txt, expr):
+    try:
+        return int(txt, 0)
+    except ValueError:
+        raise ValueError("invalid number '%s' in condition: %s" % (txt, expr))
+
+
+class Condition(object):
+    """a break or watch point condition evaluated natively
+
+    The expression is a list of terms joined by ``&&`` (or ``and``). A hit
+    is only reported if all terms hold. Each term compares a left hand side
+    with a number::
+
+        d0 == 5 && a7 < 0x1000 && hits >= 10
+        w[0x400] & 0xff00 != 0 && value == 0
+
+    The left hand side is a register (``d0``-``d7``, ``a0``-``a7``, ``pc``,
+    ``sr``, ``sp``, ``usp``, ``isp``, ``msp``, ``vbr``), a byte, word or long
+    in RAM (``b[addr]``, ``w[addr]``, ``l[addr]``), the accessed ``value`` of
+    a watchpoint or the ``hits`` of the point. An optional ``& mask`` is
+    applied before comparing. Compares are unsigned, prefix the operator
+    with ``s`` (e.g. ``s<``) for a signed compare.
+    """
+
+    def __init__(self, expr):
+        self.expr = expr
+        self.terms = self._parse(expr)
+
+    def __repr__(self):
+        return "Condition(%r)" % self.expr
+
+    def __str__(self):
+        return self.expr
+
+    def _parse(self, expr):
+        terms = []
+        for txt in _and_re.split(expr.strip().lower()):
+            m = _term_re.match(txt)
+            if m is None:
+                raise ValueError("invalid term '%s' in condition: %s" %
+                                 (txt, expr))
+            lhs = m.group("lhs")
+            op = _ops[m.group("op")]
+            value = _parse_int(m.group("value"), expr)
+            mask = m.group("mask")
+            if mask is not None:
+                mask = _parse_int(mask, expr)
+            else:
+                mask = 0xffffffff
+            mm = _mem_re.match(lhs)
+            if lhs in _reg_names:
+                kind, arg = COND_REG, _reg_names[lhs]
+            elif mm is not None:
+                kind = _mem_kinds[mm.group("size")]
+                arg = _parse_int(mm.group("addr"), expr)
+            elif lhs == "value":
+                kind, arg = COND_VALUE, 0
+            elif lhs == "hits":
+                kind, arg = COND_HITS, 0
+            else:
+                raise ValueError("invalid operand '%s' in condition: %s" %
+                                 (lhs, expr))
+            terms.append((kind, arg, op, value & 0xffffffff, mask))
+        return terms
+
+    def set_breakpoint(self, bp_id):
+        """attach the condition to the breakpoint"""
+        tools.set_breakpoint_condition(bp_id, self.terms)
+
+    def set_watchpoint(self, wp_id):
+        """attach the condition to the watchpoint"""
+        tools.set_watchpoint_condition(wp_id, self.terms)
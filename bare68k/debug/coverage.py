@@ -0,0 +1,79 @@
+import bare68k.api.tools as tools
+
+PAGE_SHIFT = 16
+
+# number of set bits for each byte value
+_bit_counts = [bin(i).count("1") for i in range(256)]
+
+
+class CoverageMap(object):
+    """a bitmap of executed instruction words
+
+    The map stores a bitmap with one bit per 16 bit word for every page
+    that contains executed code. Maps of several runs can be merged.
+    """
+
+    def __init__(self, pages=None):
+        self._pages = {}
+        if pages is not None:
+            for page_no, data in pages.items():
+                self._pages[page_no] = bytearray(data)
+
+    def __repr__(self):
+        return "CoverageMap(pages={}, covered={})".format(
+            sorted(self._pages.keys()), self.get_num_covered())
+
+    @classmethod
+    def from_machine(cls):
+        """create a map from the coverage recorded by the machine"""
+        pages = tools.get_coverage()
+        if pages is None:
+            raise ValueError("coverage is not enabled")
+        return cls(pages)
+
+    def to_machine(self):
+        """merge this map into the coverage recorded by the machine"""
+        for page_no, data in self._pages.items():
+            tools.merge_coverage(page_no, bytes(data))
+
+    def get_pages(self):
+        """return a dict of page number to bitmap bytes"""
+        return dict((p, bytes(d)) for p, d in self._pages.items())
+
+    def merge(self, other):
+        """add the coverage of another map to this one"""
+        for page_no, data in other._pages.items():
+            own = self._pages.get(page_no)
+            if own is None:
+                self._pages[page_no] = bytearray(data)
+            else:
+                for i, b in enumerate(data):
+                    if b:
+                        own[i] |= b
+
+    def is_covered(self, addr):
+        data = self._pages.get(addr >> PAGE_SHIFT)
+        if data is None:
+            return False
+        word = (addr & 0xffff) >> 1
+        return data[word >> 3] & (1 << (word & 7)) != 0
+
+    def get_num_covered(self):
+        """return the number of executed instruction words"""
+        num = 0
+        for data in self._pages.values():
+            for b in data:
+                num += _bit_counts[b]
+        return num
+
+    def get_addresses(self):
+        """return a sorted list of all executed instruction addresses"""
+        result = []
+        for page_no in sorted(self._pages.keys()):
+            base = page_no << PAGE_SHIFT
+            for i, b in enumerate(self._pages[page_no]):
+                if b:
+                    for bit in range(8):
+                        if b & (1 << bit):
+                            result.append(base + ((i << 3) + bit) * 2)
+        return result
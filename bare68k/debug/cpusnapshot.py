@@ -1,27 +1,115 @@
 from __future__ import print_function
 
+import bisect
+
 import bare68k.api.cpu as cpu
+import bare68k.api.disasm as disasm
 import bare68k.api.mem as mem
 import bare68k.api.tools as tools
+from bare68k.consts import *
 from bare68k.debug.disassemble import *
 from bare68k.debug.regdump import *
 
 
+# longest 68k instruction in bytes
+MAX_INSTR_BYTES = 22
+
+
+class CodeCopy(object):
+    """a copy of the guest code ranges covered by a pc trace
+
+    The ranges are given as (start, end) pairs of instruction addresses.
+    Each range is extended by the longest instruction and overlapping
+    ranges are merged before the code is read from memory. Unreadable
+    parts are left out and read as zero words by the disassembler.
+    """
+
+    def __init__(self, ranges):
+        self._starts = []
+        self._blocks = []
+        for start, end in self._merge(ranges):
+            data = self._read(start, end)
+            if data:
+                self._starts.append(start)
+                self._blocks.append(data)
+
+    def _merge(self, ranges):
+        merged = []
+        for start, end in sorted(ranges):
+            end += MAX_INSTR_BYTES
+            if merged and start <= merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1][1] = end
+            else:
+                merged.append([start, end])
+        return merged
+
+    def _read(self, start, end):
+        try:
+            return mem.r_block(start, end - start)
+        except ValueError:
+            pass
+        # read the valid prefix in 4K steps
+        res = []
+        addr = start
+        while addr < end:
+            size = min(0x1000 - (addr & 0xfff), end - addr)
+            try:
+                res.append(mem.r_block(addr, size))
+            except ValueError:
+                break
+            addr += size
+        return b"".join(res)
+
+    def select(self, pc):
+        """make the block containing pc the source of the disassembler"""
+        i = bisect.bisect_right(self._starts, pc) - 1
+        if i >= 0 and pc < self._starts[i] + len(self._blocks[i]):
+            disasm.disassemble_buffer(self._blocks[i], self._starts[i])
+        else:
+            disasm.disassemble_buffer(b"", pc)
+
+
 class CPUSnapshot(object):
-    """save the current CPU state for debugging purposes"""
+    """save the current CPU state for debugging purposes
 
-    def __init__(self, regs, pc_trace, reason, total_cycles, done_cycles):
+    A snapshot made by :class:`CPUSnapshotCreator` keeps the raw pc trace
+    and a :class:`CodeCopy` of the traced code. It is disassembled when
+    ``pc_trace`` is accessed first, e.g. when the snapshot is formatted.
+    """
+
+    def __init__(self, regs, pc_trace, reason, total_cycles, done_cycles,
+                 creator=None, raw_trace=None):
         self.regs = regs
-        self.pc_trace = pc_trace
+        self._pc_trace = pc_trace
         self.reason = reason
         self.total_cycles = total_cycles
         self.done_cycles = done_cycles
+        self._creator = creator
+        self._raw_trace = raw_trace
+
+    @property
+    def pc_trace(self):
+        """the pc trace as a list of :class:`InstrLine` objects"""
+        if self._creator is not None:
+            regs = self.regs.get_regs()
+            self._pc_trace = self._creator.disassemble_trace(
+                self._raw_trace, regs.r_pc())
+            self._creator = None
+            self._raw_trace = None
+        return self._pc_trace
 
 
 class CPUSnapshotCreator(object):
-    """take snapshots if desired"""
+    """take snapshots if desired
+
+    If the pc trace records only branches (``PC_TRACE_BRANCH``) then the
+    executed instructions between two branches are reconstructed with the
+    disassembler. ``max_walk`` limits the instructions walked from a branch
+    target without reaching the next recorded branch.
+    """
 
-    def __init__(self, disassembler=None, pc_trace_size=0):
+    def __init__(self, disassembler=None, pc_trace_size=0, max_walk=1024):
         if disassembler is None:
             self._disasm = Disassembler()
         else:
@@ -30,26 +118,54 @@ class CPUSnapshotCreator(object):
             self._pc_trace_size = tools.get_pc_trace_size()
         else:
             self._pc_trace_size = pc_trace_size
+        self._max_walk = max_walk
 
     def get_disassembler(self):
         return self._disasm
 
     def create(self, reason=None):
-        """create a snapshot of the current CPU state"""
+        """create a snapshot of the current CPU state
+
+        The registers, the pc trace entries, the code covered by the trace
+        and the cycles are copied. The disassembly is deferred until the
+        snapshot is rendered.
+        """
         regs = cpu.get_regs()
-        pc_trace = self._get_pc_trace(regs, self._pc_trace_size)
-        # disassemble pc trace:
-        pc_il = []
-        for pc in pc_trace:
-            il, _ = self._disasm.disassemble(pc)
-            pc_il.append(il)
+        if tools.get_pc_trace_mode() == PC_TRACE_BRANCH:
+            branches = tools.get_branch_trace()
+            code = CodeCopy(self._get_walk_ranges(branches, regs.r_pc()))
+            raw_trace = (PC_TRACE_BRANCH, branches, code)
+        else:
+            pcs = self._get_pc_trace(regs, self._pc_trace_size)
+            code = CodeCopy([(pc, pc) for pc in pcs])
+            raw_trace = (PC_TRACE_ALL, pcs, code)
         # register dump
         rd = RegisterDump(regs)
         # cycles
         total_cycles = cpu.get_total_cycles()
         done_cycles = cpu.get_done_cycles()
         # create snapshot
-        return CPUSnapshot(rd, pc_il, reason, total_cycles, done_cycles)
+        return CPUSnapshot(rd, None, reason, total_cycles, done_cycles,
+                           self, raw_trace)
+
+    def disassemble_trace(self, raw_trace, pc):
+        """turn a raw pc trace taken by create() into instruction lines
+
+        The instructions are disassembled from the code copied by create()
+        and not from the current memory.
+        """
+        mode, trace, code = raw_trace
+        try:
+            if mode == PC_TRACE_BRANCH:
+                trace = self._get_branch_path(trace, pc, code)
+            disassemble = self._disasm.disassemble
+            res = []
+            for trace_pc in trace:
+                code.select(trace_pc)
+                res.append(disassemble(trace_pc)[0])
+            return res
+        finally:
+            self._disasm.select_source()
 
     def _get_pc_trace(self, regs, size=1):
         pc_trace = tools.get_pc_trace()
@@ -64,6 +180,54 @@ class CPUSnapshotCreator(object):
             off = size - n
             return pc_trace[off:]
 
+    def _can_walk(self, pc, end_pc):
+        return pc <= end_pc <= pc + self._max_walk * MAX_INSTR_BYTES
+
+    def _get_walk_ranges(self, branches, pc):
+        """return the code ranges walked by _get_branch_path()"""
+        if not branches:
+            return [(pc, pc)]
+        ranges = [(branches[0][0], branches[0][0])]
+        ends = [b[0] for b in branches[1:]] + [pc]
+        for (_, start), end in zip(branches, ends):
+            if self._can_walk(start, end):
+                ranges.append((start, end))
+            else:
+                ranges.append((start, start))
+                ranges.append((end, end))
+        return ranges
+
+    def _walk(self, pc, end_pc, path, code):
+        """add the instructions from pc up to end_pc to the path"""
+        if not self._can_walk(pc, end_pc):
+            return False
+        code.select(pc)
+        for _ in range(self._max_walk):
+            if pc == end_pc:
+                return True
+            path.append(pc)
+            il, pc = self._disasm.disassemble(pc)
+        return False
+
+    def _get_branch_path(self, branches, pc, code):
+        """reconstruct the executed instructions from the branch trace"""
+        if not branches:
+            return [pc]
+        path = [branches[0][0]]
+        for i in range(1, len(branches)):
+            src = branches[i][0]
+            # gap: restart the path at the next branch
+            if not self._walk(branches[i - 1][1], src, path, code):
+                path = []
+            path.append(src)
+        # the last branch target runs up to the current pc
+        last = []
+        if self._walk(branches[-1][1], pc, last, code):
+            path += last
+        else:
+            path.append(branches[-1][1])
+        return path
+
 
 class CPUSnapshotFormatter(object):
 
@@ -115,6 +279,8 @@ class CPUSnapshotFormatter(object):
 
     def log(self, cpu_snap, log, level):
         """convenience function to log formatted snapshot"""
+        if not log.isEnabledFor(level):
+            return
         lines = self.format(cpu_snap)
         for l in lines:
             log.log(level, l)
@@ -130,6 +296,8 @@ def print_cpu_snapshot(reason=None):
 
 def log_cpu_snapshot(log, level, reason=None):
     """helper that creates a cpu state and prints it with a formatter"""
+    if not log.isEnabledFor(level):
+        return
     c = CPUSnapshotCreator()
     f = CPUSnapshotFormatter()
     s = c.create(reason)
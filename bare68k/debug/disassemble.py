@@ -103,9 +103,14 @@ class Disassembler(object):
         self._label_mgr = label_mgr
         self._annotator = annotator
         self._buffer = buf
-        # setup disassembler source
-        if buf is not None:
-            disasm.disassemble_buffer(buf, addr_offset)
+        self._addr_offset = addr_offset
+        self.select_source()
+
+    def select_source(self):
+        """make the memory or buffer of this disassembler the source of
+           the native disassembler again"""
+        if self._buffer is not None:
+            disasm.disassemble_buffer(self._buffer, self._addr_offset)
         else:
             disasm.disassemble_memory()
 
@@ -131,55 +136,54 @@ class Disassembler(object):
         """get raw instruction at given pc in memory
            return (opcode,args/None,next_pc)
         """
-        pc, words, line = disasm.disassemble(pc)
-        opcode, args = self._sanitize_line(line)
-        next_pc = pc + len(words) * 2
-        return opcode, args, next_pc
+        di = disasm.disassemble_decode(pc)
+        return di.mnemonic, di.args, di.next_pc
+
+    def decode(self, pc):
+        """return the natively decoded instruction at pc
+
+           The record gives the mnemonic, size, words and the operands as
+           (kind, reg, value, index) tuples without any string parsing.
+        """
+        return disasm.disassemble_decode(pc)
+
+    def decode_range(self, start, end):
+        """return a list of all decoded instructions in the range"""
+        return disasm.disassemble_decode_range(start, end)
+
+    def disassemble_range(self, start, end):
+        """generate the line infos of all instructions in the range
+
+           The whole range is disassembled natively into a single buffer.
+           The line info objects are only created while iterating.
+        """
+        buf = disasm.disassemble_range_buffer(start, end)
+        label_mgr = self._label_mgr
+        annotator = self._annotator
+        get_line = buf.get_line
+        for i in range(len(buf)):
+            pc, words, opcode, args = get_line(i)
+            if label_mgr is not None:
+                label = label_mgr.find_label(pc)
+            else:
+                label = None
+            li = InstrLine(pc, words, opcode, args, label)
+            if annotator is not None:
+                li.annotation = annotator(li)
+            yield li
 
     def disassemble(self, pc, cycles=None):
         """return a dictionary with all disassemble information"""
-        pc, words, line = disasm.disassemble(pc)
-        opcode, args = self._sanitize_line(line)
-        next_pc = pc + len(words) * 2
+        di = disasm.disassemble_decode(pc)
         # add label?
         if self._label_mgr is not None:
             label = self._label_mgr.find_label(pc)
         else:
             label = None
         # add annotation?
-        li = InstrLine(pc, words, opcode, args, label, cycles=cycles)
+        li = InstrLine(pc, di.words, di.mnemonic, di.args, label,
+                       cycles=cycles)
         if self._annotator is not None:
             li.annotation = self._annotator(li)
         # create line info
-        return li, next_pc
-
-    def _sanitize_line(self, line):
-        """do some transformations of musashi's disassembler output.
-           e.g replace a-line calls"""
-        # extract opcode and args
-        elements = line.split()
-        n = len(elements)
-        if n < 1:
-            raise ValueError("invalid disasm line: " + line)
-        opcode = elements[0]
-        if n == 1:
-            args = None
-        elif n == 2:
-            args = elements[1]
-        else:
-            args = "".join(elements[1:])
-        # remove comment
-        if args is not None:
-            pos = args.find(';')
-            if pos != -1:
-                args = args[:pos]
-        # replace (invalid) opcodes
-        if opcode == 'dc.w':
-            if len(args) == 5 and args[0] == '$':
-                opc = int(args[1:], 16)
-                # aline
-                if opc & 0xf000 == 0xa000:
-                    args = "#$%03x" % (opc & 0xfff)
-                    opcode = "aline"
-        # return result
-        return opcode, args
+        return li, di.next_pc
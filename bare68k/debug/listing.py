@@ -0,0 +1,167 @@
+"""create disassembly listings of whole images with a process pool.
+
+The image is split into chunks that start on instruction boundaries. The
+boundaries are found by a serial native pre-pass that runs the full
+disassembler over the image to get each instruction length, so the image
+is decoded twice. The pre-pass creates no Python objects and takes only a
+small part of the time of a listing. Each worker process sets up its own
+machine with the image as disassembler buffer and the labels of the
+caller, disassembles and formats its chunks and returns the text. The
+chunks are written in order while the workers continue.
+"""
+
+import multiprocessing
+
+import bare68k.api.disasm as disasm
+import bare68k.api.label as label
+import bare68k.api.machine as machine
+from bare68k.consts import *
+from bare68k.debug.disassemble import Disassembler, InstrLineFormatter
+from bare68k.label import LabelMgr
+
+PAGE_SHIFT = 16
+
+# state of a worker process
+_worker = None
+
+
+class _ListingWorker(object):
+    """disassemble and format chunks of the image in a worker process"""
+
+    def __init__(self, cpu_type, data, addr_offset, labels, formatter):
+        if machine.is_initialized():
+            # forked from a process with a running machine: start over
+            machine.shutdown()
+        end = addr_offset + len(data)
+        for addr, size, _ in labels:
+            end = max(end, addr + size)
+        num_pages = max(1, ((end - 1) >> PAGE_SHIFT) + 1)
+        with_labels = len(labels) > 0
+        machine.init(cpu_type, num_pages, with_labels)
+        if with_labels:
+            for addr, size, lbl_data in labels:
+                label.add_label(addr, size, lbl_data)
+            label_mgr = LabelMgr()
+        else:
+            label_mgr = None
+        self._disasm = Disassembler(data, addr_offset, label_mgr=label_mgr)
+        self._formatter = formatter
+
+    def find_chunks(self, start, end, chunk_size):
+        return disasm.disassemble_boundaries(start, end, chunk_size)
+
+    def format_chunk(self, start, end):
+        fmt = self._formatter.format
+        lines = [fmt(li) for li in self._disasm.disassemble_range(start, end)]
+        lines.append("")
+        return "\n".join(lines)
+
+
+def _init_worker(cpu_type, data, addr_offset, labels, formatter):
+    global _worker
+    _worker = _ListingWorker(cpu_type, data, addr_offset, labels, formatter)
+
+
+def _find_chunks(args):
+    return _worker.find_chunks(*args)
+
+
+def _format_chunk(args):
+    return _worker.format_chunk(*args)
+
+
+class ListingGenerator(object):
+    """generate the disassembly listing of a code image in parallel
+
+    Args:
+        data (bytes): the code image
+        addr_offset (int): address of the first byte of the image
+        cpu_type (int): the CPU type used for disassembly
+        label_mgr (:obj:`bare68k.label.LabelMgr`, optional): the labels are
+            copied to the workers. The label data must be picklable.
+        formatter (:obj:`InstrLineFormatter`, optional): formats the lines.
+            By default a formatter without cycles is used.
+        chunk_size (int): approximate size of a chunk in bytes
+        num_workers (int, optional): number of worker processes. By default
+            one per CPU core is used. With 0 the listing is created in this
+            process; then the machine must not be initialized.
+    """
+
+    def __init__(self, data, addr_offset=0, cpu_type=M68K_CPU_TYPE_68000,
+                 label_mgr=None, formatter=None, chunk_size=0x10000,
+                 num_workers=None):
+        if chunk_size < 2:
+            raise ValueError("invalid chunk size: %d" % chunk_size)
+        if formatter is None:
+            formatter = InstrLineFormatter(with_cycles=False)
+        if num_workers is None:
+            num_workers = multiprocessing.cpu_count()
+        self._data = bytes(data)
+        self._addr_offset = addr_offset
+        self._cpu_type = cpu_type
+        self._labels = self._get_labels(label_mgr)
+        self._formatter = formatter
+        self._chunk_size = chunk_size
+        self._num_workers = num_workers
+
+    def _get_labels(self, label_mgr):
+        if label_mgr is None:
+            return []
+        labels = label_mgr.get_all_labels()
+        if labels is None:
+            return []
+        return [(lbl.addr(), lbl.size(), lbl.data()) for lbl in labels]
+
+    def _get_jobs(self, chunk_starts):
+        end = self._addr_offset + len(self._data)
+        ends = chunk_starts[1:] + [end]
+        return list(zip(chunk_starts, ends))
+
+    def generate(self):
+        """generate the listing text chunk by chunk in address order"""
+        start = self._addr_offset
+        end = start + len(self._data)
+        init_args = (self._cpu_type, self._data, self._addr_offset,
+                     self._labels, self._formatter)
+        prepass_args = (start, end, self._chunk_size)
+        if self._num_workers == 0:
+            if machine.is_initialized():
+                raise RuntimeError("machine is in use: use workers")
+            _init_worker(*init_args)
+            try:
+                chunks = _find_chunks(prepass_args)
+                for job in self._get_jobs(chunks):
+                    yield _format_chunk(job)
+            finally:
+                global _worker
+                _worker = None
+                machine.shutdown()
+            return
+        pool = multiprocessing.Pool(self._num_workers, _init_worker,
+                                    init_args)
+        try:
+            chunks = pool.apply(_find_chunks, (prepass_args,))
+            for text in pool.imap(_format_chunk, self._get_jobs(chunks)):
+                yield text
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def write(self, fh):
+        """write the listing to an open text file and return its size"""
+        size = 0
+        for text in self.generate():
+            fh.write(text)
+            size += len(text)
+        return size
+
+
+def write_listing(file_name, data, addr_offset=0, **kwargs):
+    """write the listing of a code image to a file
+
+    The keyword arguments are passed on to :class:`ListingGenerator`.
+    Returns the size of the listing.
+    """
+    gen = ListingGenerator(data, addr_offset, **kwargs)
+    with open(file_name, "w") as fh:
+        return gen.write(fh)
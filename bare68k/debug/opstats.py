@@ -0,0 +1,69 @@
+import struct
+
+import bare68k.api.tools as tools
+from bare68k.debug.disassemble import Disassembler
+
+
+class OpcodeStats(object):
+    """collect the frequency of executed opcodes natively in the machine
+       and group them by mnemonic with the disassembler"""
+
+    def __init__(self):
+        self._mnemonics = {}
+
+    def start(self, clear=True):
+        """enable native opcode counting"""
+        tools.setup_opcode_stats(True)
+        if clear:
+            tools.clear_opcode_stats()
+
+    def stop(self):
+        """disable opcode counting and free its histogram"""
+        tools.setup_opcode_stats(False)
+
+    def clear(self):
+        tools.clear_opcode_stats()
+
+    def get_instr_count(self):
+        """return number of counted instructions"""
+        return tools.get_instr_count()
+
+    def get_opcode_counts(self):
+        """return a dict opcode word -> count of all executed opcodes"""
+        counts = tools.get_opcode_stats()
+        if counts is None:
+            return {}
+        return counts
+
+    def get_mnemonics(self, opcodes):
+        """return a dict opcode word -> mnemonic for the given opcodes"""
+        missing = [op for op in opcodes if op not in self._mnemonics]
+        if missing:
+            # disassemble each opcode padded with zero extension words
+            entry = struct.pack(">H", 0) * 4
+            buf = b"".join(struct.pack(">H", op) + entry for op in missing)
+            da = Disassembler(buf)
+            try:
+                for i, op in enumerate(missing):
+                    mnemonic, _, _ = da.disassemble_str(i * 10)
+                    self._mnemonics[op] = mnemonic
+            finally:
+                da.shutdown()
+        return dict((op, self._mnemonics[op]) for op in opcodes)
+
+    def group_by_mnemonic(self, counts=None, with_size=True):
+        """return a list of (mnemonic, count) tuples sorted by count
+
+        If with_size is False then the size suffix of the mnemonic is
+        dropped and e.g. ``move.b`` and ``move.l`` are counted together.
+        """
+        if counts is None:
+            counts = self.get_opcode_counts()
+        mnemonics = self.get_mnemonics(counts.keys())
+        groups = {}
+        for op, num in counts.items():
+            mnemonic = mnemonics[op]
+            if not with_size:
+                mnemonic = mnemonic.split('.')[0]
+            groups[mnemonic] = groups.get(mnemonic, 0) + num
+        return sorted(groups.items(), key=lambda x: (-x[1], x[0]))
@@ -15,3 +15,10 @@ class InternalError(Bare68kException):
 
     def __init__(self, msg=None):
         Bare68kException.__init__(self, msg)
+
+
+class CallError(Bare68kException):
+
+    def __init__(self, msg=None, run_info=None):
+        Bare68kException.__init__(self, msg)
+        self.run_info = run_info
@@ -0,0 +1,222 @@
+"""in-process fuzzing of guest code with native edge coverage.
+
+The :class:`Fuzzer` works like the persistent mode of AFL: the guest code
+under test is called as a subroutine over and over again in the same
+runtime. Between two runs the memory and the CPU registers are reset to a
+baseline taken before the first run. Only the memory pages that were
+changed are copied back, so an iteration costs little more than the guest
+code itself.
+
+The guest entry point is called with the input buffer address in ``A0``
+and the input length in ``D0``. It returns with ``rts`` to an exit stub.
+"""
+
+import random
+
+import bare68k.api.cpu as cpu
+import bare68k.api.mem as mem
+import bare68k.api.tools as tools
+
+from bare68k.consts import *
+
+FUZZ_OK = 0
+"""the guest returned from the entry point"""
+FUZZ_CRASH = 1
+"""the run ended with any other event"""
+FUZZ_HANG = 2
+"""the run exceeded the instruction limit"""
+
+FUZZ_RESULT_NAMES = ("OK", "CRASH", "HANG")
+
+RESET_OPCODE = 0x4e70
+
+_interesting8 = (0, 1, 0x7f, 0x80, 0xff, 0x10, 0x20, 0x40, 0x64)
+_interesting16 = (0x0100, 0x7fff, 0x8000, 0xffff, 0x0200, 0x03e8, 0x1000)
+
+
+class Mutator(object):
+    """derive new inputs from a parent input and the corpus"""
+
+    def __init__(self, max_size, seed=None):
+        self._max_size = max_size
+        self._rnd = random.Random(seed)
+
+    def mutate(self, data, corpus=None):
+        rnd = self._rnd
+        buf = bytearray(data)
+        num = 1 << rnd.randint(0, 2)
+        for _ in range(num):
+            op = rnd.randint(0, 8)
+            size = len(buf)
+            if size == 0:
+                op = 6
+            if op == 0:
+                # flip a bit
+                pos = rnd.randrange(size * 8)
+                buf[pos >> 3] ^= 1 << (pos & 7)
+            elif op == 1:
+                # set an interesting byte
+                buf[rnd.randrange(size)] = rnd.choice(_interesting8)
+            elif op == 2 and size >= 2:
+                # set an interesting big endian word
+                pos = rnd.randrange(size - 1)
+                val = rnd.choice(_interesting16)
+                buf[pos] = val >> 8
+                buf[pos + 1] = val & 0xff
+            elif op == 3:
+                # add or subtract a small value
+                pos = rnd.randrange(size)
+                buf[pos] = (buf[pos] + rnd.randint(-35, 35)) & 0xff
+            elif op == 4:
+                # random byte
+                buf[rnd.randrange(size)] = rnd.randrange(256)
+            elif op == 5:
+                # delete a block
+                pos = rnd.randrange(size)
+                end = min(size, pos + rnd.randint(1, 16))
+                del buf[pos:end]
+            elif op == 6:
+                # insert random bytes
+                pos = rnd.randint(0, size)
+                num_bytes = rnd.randint(1, 16)
+                buf[pos:pos] = bytearray(rnd.randrange(256)
+                                         for _ in range(num_bytes))
+            elif op == 7:
+                # duplicate a block
+                pos = rnd.randrange(size)
+                end = min(size, pos + rnd.randint(1, 16))
+                tgt = rnd.randint(0, size)
+                buf[tgt:tgt] = buf[pos:end]
+            elif op == 8 and corpus:
+                # splice with another corpus entry
+                other = rnd.choice(corpus)
+                if len(other) > 1:
+                    cut = rnd.randrange(1, len(other))
+                    pos = rnd.randint(0, size)
+                    buf = buf[:pos] + bytearray(other[cut:])
+        return bytes(buf[:self._max_size])
+
+
+class Fuzzer(object):
+    """run guest code in a mutation loop and collect interesting inputs
+
+    Args:
+        runtime (:obj:`bare68k.Runtime`): a setup runtime with the guest
+            code already loaded into memory
+        entry_pc (int): address of the guest function to call
+        input_addr (int): address of the input buffer in RAM
+        max_input_size (int): size of the input buffer
+        exit_addr (int): address of a free word in RAM used as exit stub
+        stack (int, optional): initial stack pointer. By default the current
+            stack pointer of the CPU is used.
+        max_instructions (int): a run exceeding this limit is a hang
+        map_size (int): number of entries in the edge map (power of two)
+        seed (int, optional): seed for the mutation random generator
+    """
+
+    def __init__(self, runtime, entry_pc, input_addr, max_input_size,
+                 exit_addr, stack=None, max_instructions=100000,
+                 map_size=0x10000, seed=None):
+        self._runtime = runtime
+        self._entry_pc = entry_pc
+        self._input_addr = input_addr
+        self._max_input_size = max_input_size
+        self._exit_addr = exit_addr
+        self._max_instructions = max_instructions
+        self._mutator = Mutator(max_input_size, seed)
+        self._rnd = random.Random(seed)
+        self.queue = []
+        self.crashes = []
+        self.hangs = []
+        self.num_execs = 0
+        # exit stub and return address
+        mem.w16(exit_addr, RESET_OPCODE)
+        if stack is None:
+            stack = cpu.r_sp()
+        stack -= 4
+        mem.w32(stack, exit_addr)
+        cpu.w_pc(entry_pc)
+        cpu.w_sp(stack)
+        # baseline
+        self._ctx = cpu.get_cpu_context()
+        tools.setup_edge_map(map_size)
+        mem.take_snapshot()
+
+    def shutdown(self):
+        """release the snapshot and the edge map"""
+        mem.free_snapshot()
+        tools.setup_edge_map(0)
+
+    def get_num_edges(self):
+        """return the number of distinct edges seen so far"""
+        return tools.get_num_edges()
+
+    def run_input(self, data):
+        """run the guest once on the given input
+
+        Returns a tuple of the run result (``FUZZ_OK``, ``FUZZ_CRASH`` or
+        ``FUZZ_HANG``) and the edge map update (``EDGE_MAP_NONE``,
+        ``EDGE_MAP_NEW_COUNT`` or ``EDGE_MAP_NEW_EDGE``).
+        """
+        if len(data) > self._max_input_size:
+            raise ValueError("input too large: %d" % len(data))
+        # back to baseline
+        mem.restore_snapshot()
+        cpu.set_cpu_context(self._ctx)
+        # place input
+        mem.w_block(self._input_addr, data)
+        cpu.w_dx(0, len(data))
+        cpu.w_ax(0, self._input_addr)
+        # run
+        tools.clear_edge_map()
+        ri = self._runtime.run(reset_end_pc=self._exit_addr + 2,
+                               max_instructions=self._max_instructions)
+        self.num_execs += 1
+        res = ri.get_last_result()
+        if res == CPU_EVENT_DONE:
+            result = FUZZ_OK
+        elif res == CPU_EVENT_BUDGET:
+            result = FUZZ_HANG
+        else:
+            result = FUZZ_CRASH
+        return result, tools.update_edge_virgin()
+
+    def add_seed(self, data):
+        """run a seed input and always add it to the queue"""
+        result, _ = self.run_input(data)
+        self._store(data, result, True)
+        return result
+
+    def _store(self, data, result, force=False):
+        if result == FUZZ_CRASH:
+            self.crashes.append(data)
+        elif result == FUZZ_HANG:
+            self.hangs.append(data)
+        elif force:
+            self.queue.append(data)
+
+    def fuzz(self, num_execs):
+        """run the mutation loop for the given number of executions
+
+        Inputs that reach new edges or new hit counts are added to the
+        queue. Crashing and hanging inputs are collected separately, but
+        only if they hit new coverage.
+
+        Returns the number of new queue entries.
+        """
+        if not self.queue:
+            self.add_seed(b"")
+        num_new = 0
+        queue = self.queue
+        mutate = self._mutator.mutate
+        choice = self._rnd.choice
+        for _ in range(num_execs):
+            data = mutate(choice(queue), queue)
+            result, edges = self.run_input(data)
+            if edges != EDGE_MAP_NONE:
+                if result == FUZZ_OK:
+                    queue.append(data)
+                    num_new += 1
+                else:
+                    self._store(data, result)
+        return num_new
@@ -5,6 +5,13 @@ from bare68k.consts import *
 import bare68k.api.mem as mem
 from bare68k.debug.cpusnapshot import *
 
+try:
+    from inspect import isawaitable
+except ImportError:
+    # Python 2 has no awaitables
+    def isawaitable(obj):
+        return False
+
 
 class EventHandler(object):
     """define the event handling of the runtime"""
@@ -94,7 +101,10 @@ class EventHandler(object):
             self._log.debug(
                 "bound ALINE handler: @%08x: %04x -> %r",
                 pc, op, bound_handler)
-            bound_handler(event)
+            result = bound_handler(event)
+            # async handlers are awaited by the async run loop
+            if isawaitable(result):
+                return result
         else:
             self._log.warn("unbound ALINE encountered: @%08x: %04x", pc, op)
             return CPU_EVENT_ALINE_TRAP
@@ -161,6 +171,11 @@ class EventHandler(object):
     def handle_timer(self, event):
         self._log.info("TIMER")
 
+    def handle_budget(self, event):
+        """a run budget is exhausted: leave the run loop"""
+        self._log.warn("BUDGET: @%08x kind=%d", event.addr, event.value)
+        return CPU_EVENT_BUDGET
+
     # debug handler
 
     def handle_instr_trace(self, pc):
@@ -0,0 +1,104 @@
+"""allocate guest memory from Python.
+
+A :class:`GuestHeap` manages a range of RAM with a native first fit
+allocator. The bookkeeping is kept in host memory, so the guest memory of
+the heap is never touched except for clearing on request.
+"""
+
+import collections
+
+import bare68k.api.mem as mem
+from bare68k.errors import ConfigError
+from bare68k.memcfg import MEM_RAM
+
+HeapStats = collections.namedtuple("HeapStats", [
+    "total_bytes", "used_bytes", "free_bytes", "peak_used_bytes",
+    "largest_free", "num_allocs", "num_free_blocks", "total_allocs",
+    "failed_allocs"])
+
+
+class GuestHeap(object):
+    """a native allocator for a range of guest RAM
+
+    Args:
+        start (int): first address of the heap
+        size (int): size of the heap in bytes
+        granularity (int): all blocks start at and are sized in multiples
+            of this power of two
+
+    The RAM must be set up before the heap is created. Allocation returns
+    0 if no memory is left, like most guest operating systems do. Therefore
+    a heap can not start at address 0.
+    """
+
+    def __init__(self, start, size, granularity=4):
+        self._heap = mem.Heap(start, size, granularity)
+        self.start = start
+        self.size = self._heap.size
+        self.granularity = granularity
+        # bind the native calls directly
+        self.get_size = self._heap.get_size
+        self.is_allocated = self._heap.is_allocated
+
+    @classmethod
+    def from_range(cls, mem_range, offset=0, size=None, granularity=4):
+        """create a heap in a RAM range of a :class:`bare68k.MemoryConfig`
+
+        Args:
+            mem_range (:obj:`bare68k.memcfg.MemoryRange`): a RAM range of
+                the memory config
+            offset (int): skip the given bytes at the begin of the range
+            size (int, optional): size of the heap. By default the rest of
+                the range is used.
+
+        A heap at address 0 skips its first granule as 0 is the out of
+        memory result of :meth:`alloc`.
+        """
+        if mem_range.mem_type != MEM_RAM:
+            raise ConfigError("heap needs a RAM range: %r" % mem_range)
+        start = mem_range.start_addr + offset
+        range_size = (mem_range.num_pages << 16) - offset
+        if size is None:
+            size = range_size
+        elif size > range_size:
+            raise ConfigError("heap does not fit into range: %r" % mem_range)
+        if start == 0:
+            start = granularity
+            size -= granularity
+        return cls(start, size, granularity)
+
+    def __repr__(self):
+        return "GuestHeap(start=%08x, size=%08x)" % (self.start, self.size)
+
+    def alloc(self, size, align=0, clear=False):
+        """allocate a block and return its address or 0
+
+        Args:
+            size (int): size of the block in bytes
+            align (int): alignment of the block address (power of two).
+                By default the granularity of the heap is used.
+            clear (bool): fill the block with zeros
+        """
+        return self._heap.alloc(size, align, clear)
+
+    def free(self, addr):
+        """free an allocated block and return its size"""
+        return self._heap.free(addr)
+
+    def realloc(self, addr, size, clear=False):
+        """resize a block and return its new address or 0
+
+        The block is resized in place if possible, otherwise it is moved
+        and the contents are copied. If no memory is left then 0 is returned
+        and the old block is still valid. With ``clear`` an added area is
+        filled with zeros.
+        """
+        return self._heap.realloc(addr, size, clear)
+
+    def clear(self):
+        """free all blocks of the heap"""
+        self._heap.clear()
+
+    def get_stats(self):
+        """return the allocation statistics as a :obj:`HeapStats` tuple"""
+        return HeapStats._make(self._heap.get_stats())
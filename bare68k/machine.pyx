@@ -1,18 +1,25 @@
 # cython: c_string_type=str, c_string_encoding=ascii, embedsignature=True
 
-from libc.stdlib cimport malloc, free
+from libc.stdlib cimport malloc, free, realloc
+from libc.string cimport strlen
 from libc.stdint cimport uint64_t, uint32_t, uint16_t, uint8_t, int8_t, int16_t, int32_t
 from cpython cimport Py_INCREF, Py_DECREF
 from cpython cimport bool
 from cpython.exc cimport PyErr_CheckSignals
+from cpython cimport array
 
 cimport musashi
 cimport cpu
 cimport mem
 cimport traps
 cimport tools
+cimport irq
 cimport label
+cimport disasm
+cimport gstruct
+cimport heap
 
+import array
 import sys
 
 # globals
@@ -52,6 +59,7 @@ def init(int cpu_type, int num_pages, bool with_labels=False):
   mem.mem_init(num_pages)
   traps.traps_init()
   tools.tools_init()
+  irq.irq_init()
 
   global got_labels
   got_labels = with_labels
@@ -84,6 +92,7 @@ def shutdown():
   mem.mem_free()
   traps.traps_shutdown()
   tools.tools_free()
+  irq.irq_free()
 
   clear_event_handlers()
 
@@ -95,5 +104,8 @@ include "cpu.pyx"
 include "mem.pyx"
 include "traps.pyx"
 include "tools.pyx"
+include "irq.pyx"
 include "disasm.pyx"
+include "gstruct.pyx"
+include "heap.pyx"
 include "label.pyx"
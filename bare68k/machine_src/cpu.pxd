@@ -16,8 +16,9 @@ cdef extern from "glue/cpu.h":
     CPU_EVENT_BREAKPOINT = 9
     CPU_EVENT_WATCHPOINT = 10
     CPU_EVENT_TIMER = 11
+    CPU_EVENT_BUDGET = 12
 
-    CPU_NUM_EVENTS = 12
+    CPU_NUM_EVENTS = 13
 
   cdef enum:
     CPU_CB_NO_EVENT = 0
@@ -45,6 +46,12 @@ cdef extern from "glue/cpu.h":
     uint32_t     pc
     uint32_t     sr
 
+  ctypedef struct budget_t:
+    uint64_t     end_cycles
+    uint64_t     left_instr
+    int          check_instr
+    uint64_t     deadline
+
   ctypedef void (*cleanup_event_func_t)(event_t *e)
   ctypedef int (*instr_hook_func_t)(uint32_t pc, void **data)
   ctypedef int (*int_ack_func_t)(int level, uint32_t pc, uint32_t *ack_ret, void **data)
@@ -62,14 +69,22 @@ cdef extern from "glue/cpu.h":
 
   int cpu_execute(int num_cycles)
   int cpu_execute_to_event(int cycles_per_run)
+  int cpu_execute_slices(int cycles_per_run, int max_slices) nogil
+  int cpu_has_callbacks()
+  int cpu_is_executing()
 
   void cpu_set_irq(int level)
+  uint64_t cpu_get_clock()
+  void cpu_set_budget(uint64_t max_cycles, uint64_t max_instr, uint32_t timeout_ms)
+  void cpu_get_budget(budget_t *b)
+  void cpu_restore_budget(const budget_t *b)
 
   run_info_t *cpu_get_info()
   void cpu_clear_info()
 
   uint32_t cpu_r_reg(int reg)
   void cpu_w_reg(int reg, uint32_t val)
+  uint32_t *cpu_get_reg_file()
 
   void cpu_r_regs(registers_t *regs)
   void cpu_w_regs(const registers_t *regs)
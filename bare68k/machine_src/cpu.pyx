@@ -162,6 +162,28 @@ cdef class Registers:
   def w_sr(self, uint32_t val):
     self.registers.sr = val
 
+cdef class RegisterFile:
+  cdef Py_ssize_t shape[1]
+  cdef Py_ssize_t strides[1]
+
+  def __getbuffer__(self, Py_buffer *buffer, int flags):
+    self.shape[0] = 16
+    self.strides[0] = sizeof(uint32_t)
+    buffer.buf = <void *>cpu.cpu_get_reg_file()
+    buffer.format = 'I'
+    buffer.internal = NULL
+    buffer.itemsize = sizeof(uint32_t)
+    buffer.len = 16 * sizeof(uint32_t)
+    buffer.ndim = 1
+    buffer.obj = self
+    buffer.readonly = 0
+    buffer.shape = self.shape
+    buffer.strides = self.strides
+    buffer.suboffsets = NULL
+
+  def __releasebuffer__(self, Py_buffer *buffer):
+    pass
+
 # cpu control
 
 def pulse_reset():
@@ -173,13 +195,30 @@ def execute(int num_cycles):
 def execute_to_event(int cycles_per_run=0):
   return cpu.cpu_execute_to_event(cycles_per_run)
 
+# number of slices run without the GIL between signal checks
+cdef int nogil_slices = 16
+
 def execute_to_event_checked(int cycles_per_run=0):
-  cdef int num_events = 0
+  cdef int num_events
+  # first run holds the GIL as it cleans up the events of the last run
+  num_events = cpu.cpu_execute(cycles_per_run)
+  PyErr_CheckSignals()
   while num_events == 0:
-    num_events = cpu.cpu_execute(cycles_per_run)
+    # release GIL if no python callbacks can be triggered
+    if cpu.cpu_has_callbacks():
+      num_events = cpu.cpu_execute(cycles_per_run)
+    else:
+      with nogil:
+        num_events = cpu.cpu_execute_slices(cycles_per_run, nogil_slices)
     PyErr_CheckSignals()
   return num_events
 
+def has_callbacks():
+  return cpu.cpu_has_callbacks() != 0
+
+def is_executing():
+  return cpu.cpu_is_executing() != 0
+
 def get_info():
   cdef cpu.run_info_t *raw_info = cpu.cpu_get_info()
   return create_run_info(raw_info)
@@ -245,6 +284,33 @@ def set_int_ack_func(object cb):
 def set_irq(unsigned int level):
   cpu.cpu_set_irq(level)
 
+def get_clock():
+  return cpu.cpu_get_clock()
+
+# budget
+
+def set_budget(uint64_t max_cycles=0, uint64_t max_instructions=0,
+               double timeout=0):
+  cdef uint32_t timeout_ms = 0
+  if timeout > 0:
+    timeout_ms = max(<uint32_t>(timeout * 1000), 1)
+  cpu.cpu_set_budget(max_cycles, max_instructions, timeout_ms)
+
+def clear_budget():
+  cpu.cpu_set_budget(0, 0, 0)
+
+def get_budget():
+  cdef cpu.budget_t b
+  cpu.cpu_get_budget(&b)
+  return (b.end_cycles, b.left_instr, b.check_instr, b.deadline)
+
+def restore_budget(state):
+  cdef cpu.budget_t b
+  if len(state) != 4:
+    raise ValueError("Invalid budget state!")
+  b.end_cycles, b.left_instr, b.check_instr, b.deadline = state
+  cpu.cpu_restore_budget(&b)
+
 # cpu trace
 
 cdef object instr_hook_func
@@ -297,11 +363,13 @@ def set_instr_hook_func(object cb=None, bool default=False, bool as_str=False):
 
 # cpu context
 
-def get_cpu_context():
+def get_cpu_context(CPUContext ctx=None):
   cdef unsigned int size = musashi.m68k_context_size()
-  cdef CPUContext ctx = CPUContext(size)
-  cdef uint8_t *data = ctx.get_data()
-  musashi.m68k_get_context(data)
+  if ctx is None:
+    ctx = CPUContext(size)
+  elif ctx.size != size:
+    raise ValueError("Invalid CPU context size: %d" % ctx.size)
+  musashi.m68k_get_context(ctx.get_data())
   return ctx
 
 def set_cpu_context(CPUContext ctx):
@@ -357,6 +425,28 @@ def r_sr():
 def w_sr(uint32_t addr, uint32_t val):
   cpu.cpu_w_reg(musashi.M68K_REG_SR, val)
 
+# batch register access
+
+def r_regs(object regs):
+  cdef int reg
+  return tuple([cpu.cpu_r_reg(reg) for reg in regs])
+
+def rs_regs(object regs):
+  cdef int reg
+  return tuple([<int32_t>cpu.cpu_r_reg(reg) for reg in regs])
+
+def w_regs(object values):
+  cdef int reg
+  if isinstance(values, dict):
+    values = values.items()
+  for reg, val in values:
+    if val < -0x80000000 or val > 0xffffffff:
+      raise OverflowError("Invalid register value: %d" % val)
+    cpu.cpu_w_reg(reg, val & 0xffffffff)
+
+def get_reg_view():
+  return memoryview(RegisterFile())
+
 # dump tools
 
 def get_sr_str(uint32_t sr):
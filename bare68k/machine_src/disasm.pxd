@@ -0,0 +1,40 @@
+from libc.stdint cimport uint8_t, uint16_t, uint32_t
+
+# disasm.h
+cdef extern from "glue/disasm.h":
+  int DISASM_MAX_WORDS
+  int DISASM_MAX_OPERANDS
+  int DISASM_MAX_MNEMONIC
+  int DISASM_MAX_ARGS
+  int DISASM_INDEX_NONE
+
+  ctypedef struct disasm_operand_t:
+    uint8_t   kind
+    uint8_t   reg
+    uint8_t   index
+    uint32_t  value
+
+  ctypedef struct disasm_instr_t:
+    uint32_t  pc
+    uint32_t  num_bytes
+    uint8_t   size
+    uint8_t   num_words
+    uint8_t   num_operands
+    uint16_t  words[11]
+    char      mnemonic[16]
+    char      args[96]
+    disasm_operand_t operands[4]
+
+  ctypedef struct disasm_record_t:
+    uint32_t  pc
+    uint16_t  num_bytes
+    uint16_t  num_words
+    uint32_t  text_offset
+    uint16_t  words[11]
+
+  uint32_t disasm_decode(uint32_t pc, unsigned int cpu_type, disasm_instr_t *instr)
+  uint32_t disasm_range(uint32_t *pc, uint32_t end, unsigned int cpu_type,
+                        disasm_record_t *records, uint32_t max_records,
+                        char *text, uint32_t text_size, uint32_t *text_used)
+  uint32_t disasm_boundaries(uint32_t start, uint32_t end, unsigned int cpu_type,
+                             uint32_t chunk_size, uint32_t *pcs, uint32_t max_pcs)
@@ -1,3 +1,114 @@
+# custom types
+
+cdef class DecodedInstr:
+  cdef disasm.disasm_instr_t instr
+
+  @property
+  def pc(self):
+    return self.instr.pc
+
+  @property
+  def length(self):
+    return self.instr.num_bytes
+
+  @property
+  def next_pc(self):
+    return self.instr.pc + self.instr.num_bytes
+
+  @property
+  def opcode(self):
+    return self.instr.words[0]
+
+  @property
+  def mnemonic(self):
+    return <str>self.instr.mnemonic
+
+  @property
+  def size(self):
+    return self.instr.size
+
+  @property
+  def args(self):
+    if self.instr.args[0] == 0:
+      return None
+    return <str>self.instr.args
+
+  @property
+  def words(self):
+    cdef int i
+    return tuple([self.instr.words[i] for i in range(self.instr.num_words)])
+
+  @property
+  def num_operands(self):
+    return self.instr.num_operands
+
+  @property
+  def operands(self):
+    cdef int i
+    cdef disasm.disasm_operand_t *op
+    res = []
+    for i in range(self.instr.num_operands):
+      op = &self.instr.operands[i]
+      res.append((op.kind, op.reg, op.value, op.index))
+    return tuple(res)
+
+  def get_operand(self, int i):
+    cdef disasm.disasm_operand_t *op
+    if i < 0 or i >= self.instr.num_operands:
+      raise IndexError("Invalid operand index")
+    op = &self.instr.operands[i]
+    return (op.kind, op.reg, op.value, op.index)
+
+  def __repr__(self):
+    return "DecodedInstr[@%08x+%d,%s,%s,%s]" % \
+      (self.instr.pc, self.instr.num_bytes, self.mnemonic, self.args,
+       self.operands)
+
+cdef class DisasmBuffer:
+  cdef disasm.disasm_record_t *records
+  cdef char *text
+  cdef uint32_t num_records
+  cdef uint32_t text_used
+
+  def __dealloc__(self):
+    if self.records != NULL:
+      free(self.records)
+    if self.text != NULL:
+      free(self.text)
+
+  def __len__(self):
+    return self.num_records
+
+  cdef disasm.disasm_record_t *_get(self, int i) except NULL:
+    if i < 0 or i >= <int>self.num_records:
+      raise IndexError("Invalid record index")
+    return &self.records[i]
+
+  def get_pc(self, int i):
+    return self._get(i).pc
+
+  def get_length(self, int i):
+    return self._get(i).num_bytes
+
+  def get_words(self, int i):
+    cdef disasm.disasm_record_t *r = self._get(i)
+    cdef int j
+    return tuple([r.words[j] for j in range(r.num_words)])
+
+  def get_line(self, int i):
+    cdef disasm.disasm_record_t *r = self._get(i)
+    cdef char *mnemonic = self.text + r.text_offset
+    cdef char *args = mnemonic + strlen(mnemonic) + 1
+    cdef int j
+    words = tuple([r.words[j] for j in range(r.num_words)])
+    if args[0] == 0:
+      return (r.pc, words, <str>mnemonic, None)
+    else:
+      return (r.pc, words, <str>mnemonic, <str>args)
+
+  def get_text(self):
+    return <bytes>self.text[:self.text_used]
+
 
 def disassemble(uint32_t pc):
   cdef char line[80]
@@ -10,15 +121,19 @@ def disassemble(uint32_t pc):
   return (pc, words, <str>line)
 
 def disassemble_range(uint32_t start, uint32_t end):
+  cdef char line[256]
   cdef uint32_t pc = start
-  cdef tuple d
+  cdef unsigned int num_bytes
+  cdef unsigned int i
+  cdef unsigned int cpu_type = cpu.cpu_get_type()
   cdef list result = []
   while pc < end:
-    d = disassemble(pc)
-    words = d[1]
-    num_words = len(words)
-    pc += num_words * 2
-    result.append(d)
+    num_bytes = musashi.m68k_disassemble(line, pc, cpu_type)
+    if num_bytes == 0:
+      break
+    words = [mem.m68k_read_disassembler_16(pc+i*2) for i in range(num_bytes/2)]
+    result.append((pc, words, <str>line))
+    pc += num_bytes
   return result
 
 def disassemble_buffer(bytes buf, uint32_t offset=0):
@@ -31,3 +146,72 @@ def disassemble_memory():
 
 def disassemble_is_valid(uint16_t opcode):
   return <bint>musashi.m68k_is_valid_instruction(opcode, cpu.cpu_get_type())
+
+def disassemble_decode(uint32_t pc):
+  cdef DecodedInstr di = DecodedInstr()
+  disasm.disasm_decode(pc, cpu.cpu_get_type(), &di.instr)
+  return di
+
+def disassemble_decode_range(uint32_t start, uint32_t end):
+  cdef uint32_t pc = start
+  cdef unsigned int cpu_type = cpu.cpu_get_type()
+  cdef DecodedInstr di
+  cdef list result = []
+  while pc < end:
+    di = DecodedInstr()
+    if disasm.disasm_decode(pc, cpu_type, &di.instr) == 0:
+      break
+    pc += di.instr.num_bytes
+    result.append(di)
+  return result
+
+def disassemble_range_buffer(uint32_t start, uint32_t end):
+  cdef DisasmBuffer buf = DisasmBuffer()
+  cdef uint32_t pc = start
+  cdef uint32_t max_records = (end - start + 1) / 2 if end > start else 0
+  cdef uint32_t text_size = max_records * 24 + 256
+  cdef unsigned int cpu_type = cpu.cpu_get_type()
+  cdef uint32_t n
+  cdef char *new_text
+  buf.records = <disasm.disasm_record_t *>malloc(
+    max_records * sizeof(disasm.disasm_record_t) + 1)
+  buf.text = <char *>malloc(text_size)
+  if buf.records == NULL or buf.text == NULL:
+    raise MemoryError("No disasm buffer memory!")
+  while pc < end:
+    n = disasm.disasm_range(&pc, end, cpu_type,
+                            buf.records + buf.num_records,
+                            max_records - buf.num_records,
+                            buf.text, text_size, &buf.text_used)
+    buf.num_records += n
+    if pc >= end or buf.num_records == max_records:
+      break
+    # text not full: decoding failed
+    if buf.text_used + disasm.DISASM_MAX_MNEMONIC + disasm.DISASM_MAX_ARGS \
+       <= text_size:
+      break
+    # grow text
+    text_size *= 2
+    new_text = <char *>realloc(buf.text, text_size)
+    if new_text == NULL:
+      raise MemoryError("No disasm buffer memory!")
+    buf.text = new_text
+  return buf
+
+def disassemble_boundaries(uint32_t start, uint32_t end, uint32_t chunk_size):
+  cdef uint32_t max_pcs
+  cdef uint32_t *pcs
+  cdef uint32_t n, i
+  if chunk_size == 0:
+    raise ValueError("Invalid chunk size")
+  if end <= start:
+    return []
+  max_pcs = (end - start) / chunk_size + 1
+  pcs = <uint32_t *>malloc(max_pcs * sizeof(uint32_t))
+  if pcs == NULL:
+    raise MemoryError("No boundary memory!")
+  n = disasm.disasm_boundaries(start, end, cpu.cpu_get_type(),
+                               chunk_size, pcs, max_pcs)
+  result = [pcs[i] for i in range(n)]
+  free(pcs)
+  return result
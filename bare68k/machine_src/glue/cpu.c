@@ -7,10 +7,18 @@
 #include <stdio.h>
 #include <string.h>
 #include <stdlib.h>
+#ifdef _WIN32
+#include <windows.h>
+#else
+#include <time.h>
+#endif
 
 #include "cpu.h"
 #include "mem.h"
 #include "tools.h"
+#include "irq.h"
+#include "traps.h"
+#include "m68kcpu.h"
 
 #define DEFAULT_CYCLES 100000
 #define MAX_EVENTS 8
@@ -25,7 +33,11 @@ static cleanup_event_func_t cleanup_func;
 static instr_hook_func_t instr_hook_func;
 static int_ack_func_t int_ack_func;
 static int dont_clear;
-static uint32_t last_cycles;
+static uint64_t last_clock;
+static uint64_t clock_cycles;
+static int in_slice;
+static uint32_t skip_cycles;
+static budget_t budget;
 
 /* public */
 unsigned int cpu_current_fc;
@@ -42,6 +54,17 @@ static void instr_hook_cb(void)
 {
   uint32_t pc = cpu_r_reg(M68K_REG_PC);
 
+  /* instruction budget: the hook runs before the instruction, so count it
+     here and end the time slice when the last allowed one starts. it is
+     still executed and the CPU stops right after it */
+  if(budget.check_instr) {
+    budget.left_instr--;
+    if(budget.left_instr == 0) {
+      budget.check_instr = 0;
+      cpu_add_event(CPU_EVENT_BUDGET, pc, CPU_BUDGET_INSTR, 0, NULL);
+    }
+  }
+
   /* handle function */
   if(instr_hook_func != NULL) {
     void *data = NULL;
@@ -56,9 +79,32 @@ static void instr_hook_cb(void)
     }
   }
 
+  /* count opcode of the instruction at pc. read it directly from memory
+     without triggering special handlers or traces */
+  if(tools_opcode_stats_enabled) {
+    const uint8_t *op = mem_get_range(pc, 2);
+    if(op != NULL) {
+      tools_count_opcode((uint16_t)((op[0] << 8) | op[1]));
+    }
+  }
+
+  /* mark coverage */
+  if(tools_coverage_enabled) {
+    tools_mark_coverage(pc);
+  }
+
+  /* edge coverage of prev/cur pc pairs */
+  if(tools_edge_map_enabled) {
+    tools_mark_edge(pc);
+  }
+
   /* add to pc trace? */
   if(tools_pc_trace_enabled) {
-    tools_update_pc_trace(pc);
+    if(tools_pc_trace_mode == TOOLS_PC_TRACE_BRANCH) {
+      tools_update_branch_trace(pc, m68k_get_reg(NULL, M68K_REG_IR));
+    } else {
+      tools_update_pc_trace(pc);
+    }
   }
 
   /* check for breakpoints */
@@ -73,19 +119,45 @@ static void instr_hook_cb(void)
 
   /* timers? */
   if(tools_timers_enabled) {
-    uint32_t cycles = m68k_cycles_run();
-    uint32_t elapsed = cycles - last_cycles;
-    last_cycles = cycles;
+    uint64_t clock = cpu_get_clock();
+    uint32_t elapsed = (uint32_t)(clock - last_clock);
+    last_clock = clock;
     tools_tick_timers(pc, elapsed);
   }
+
+  /* idle loop? skip the rest of the slice */
+  if(tools_idle_enabled) {
+    int left = m68k_cycles_remaining();
+    if(left > 0) {
+      uint32_t skip = tools_check_idle(pc, left);
+      if(skip > 0) {
+        skip_cycles += skip;
+        m68k_end_timeslice();
+      }
+    }
+  }
 }
 
 static int int_ack_cb(int int_level)
 {
   void *data = NULL;
   uint32_t ack = M68K_INT_ACK_AUTOVECTOR;
-  uint32_t pc = cpu_r_reg(M68K_REG_PC);
-  int res = int_ack_func(int_level, pc, &ack, &data);
+  uint32_t pc;
+  int res;
+
+  /* scheduled irqs and vector table levels are acked natively */
+  if(irq_ack(int_level, &ack)) {
+    return ack;
+  }
+
+  /* no ack function: auto clear irq like Musashi's default does */
+  if(int_ack_func == NULL) {
+    irq_ack_manual();
+    return ack;
+  }
+
+  pc = cpu_r_reg(M68K_REG_PC);
+  res = int_ack_func(int_level, pc, &ack, &data);
   /* res == 0 generates an INT_ACK event */
   if(res == CPU_CB_EVENT) {
     cpu_add_event(CPU_EVENT_INT_ACK, pc, ack, int_level, data);
@@ -134,6 +206,7 @@ void cpu_init(unsigned int cpu_type_)
   m68k_set_reset_instr_callback(reset_instr_cb);
   m68k_set_fc_callback(set_fc_cb);
   m68k_set_instr_hook_callback(instr_hook_cb);
+  m68k_set_int_ack_callback(int_ack_cb);
 
   /* clear regs */
   for(i=0;i<8;i++) {
@@ -146,7 +219,11 @@ void cpu_init(unsigned int cpu_type_)
   run_info.events = events;
   run_info.total_cycles = 0;
   dont_clear = 0;
-  last_cycles = 0;
+  last_clock = 0;
+  clock_cycles = 0;
+  in_slice = 0;
+  skip_cycles = 0;
+  memset(&budget, 0, sizeof(budget_t));
 }
 
 int cpu_get_type(void)
@@ -161,7 +238,6 @@ void cpu_free(void)
 
 void cpu_reset(void)
 {
-  last_cycles = 0;
   run_info.total_cycles = 0;
   m68k_pulse_reset();
 }
@@ -180,21 +256,30 @@ void cpu_set_instr_hook_func(instr_hook_func_t func)
 void cpu_set_int_ack_func(int_ack_func_t func)
 {
   int_ack_func = func;
-  if(func != NULL) {
-    m68k_set_int_ack_callback(int_ack_cb);
-  } else {
-    m68k_set_int_ack_callback(NULL);
-  }
+  /* callback is always setup */
 }
 
 uint32_t cpu_r_reg(int reg)
 {
+  /* data and address registers are read directly from the register file */
+  if((reg >= M68K_REG_D0) && (reg <= M68K_REG_A7)) {
+    return m68ki_cpu.dar[reg];
+  }
   return m68k_get_reg(NULL, reg);
 }
 
-  void cpu_w_reg(int reg, uint32_t val)
+void cpu_w_reg(int reg, uint32_t val)
+{
+  if((reg >= M68K_REG_D0) && (reg <= M68K_REG_A7)) {
+    m68ki_cpu.dar[reg] = val;
+  } else {
+    m68k_set_reg(reg, val);
+  }
+}
+
+uint32_t *cpu_get_reg_file(void)
 {
-  m68k_set_reg(reg, val);
+  return (uint32_t *)m68ki_cpu.dar;
 }
 
 void cpu_r_regs(registers_t *regs)
@@ -353,10 +438,128 @@ void cpu_clear_info(void)
 void cpu_set_irq(int level)
 {
   cpu_clear_info();
-  m68k_set_irq(level);
+  irq_set_manual_level(level);
   dont_clear = 1;
 }
 
+uint64_t cpu_get_clock(void)
+{
+  if(in_slice) {
+    return clock_cycles + m68k_cycles_run();
+  } else {
+    return clock_cycles;
+  }
+}
+
+/* a monotonic wall clock in ms */
+static uint64_t get_time_ms(void)
+{
+#ifdef _WIN32
+  return GetTickCount64();
+#else
+  struct timespec ts;
+  clock_gettime(CLOCK_MONOTONIC, &ts);
+  return (uint64_t)ts.tv_sec * 1000 + ts.tv_nsec / 1000000;
+#endif
+}
+
+void cpu_set_budget(uint64_t max_cycles, uint64_t max_instr, uint32_t timeout_ms)
+{
+  if(max_cycles > 0) {
+    budget.end_cycles = clock_cycles + max_cycles;
+  } else {
+    budget.end_cycles = 0;
+  }
+  budget.left_instr = max_instr;
+  budget.check_instr = (max_instr > 0);
+  if(timeout_ms > 0) {
+    budget.deadline = get_time_ms() + timeout_ms;
+  } else {
+    budget.deadline = 0;
+  }
+}
+
+void cpu_get_budget(budget_t *b)
+{
+  *b = budget;
+}
+
+void cpu_restore_budget(const budget_t *b)
+{
+  budget = *b;
+}
+
+static void check_budget(void)
+{
+  int kind = 0;
+  if((budget.end_cycles > 0) && (clock_cycles >= budget.end_cycles)) {
+    budget.end_cycles = 0;
+    kind = CPU_BUDGET_CYCLES;
+  }
+  else if((budget.deadline > 0) && (get_time_ms() >= budget.deadline)) {
+    budget.deadline = 0;
+    kind = CPU_BUDGET_DEADLINE;
+  }
+  if(kind != 0) {
+    cpu_add_event(CPU_EVENT_BUDGET, cpu_r_reg(M68K_REG_PC), kind, 0, NULL);
+  }
+}
+
+static void tick_timers(void)
+{
+  uint32_t elapsed = (uint32_t)(clock_cycles - last_clock);
+  last_clock = clock_cycles;
+  if(elapsed > 0) {
+    tools_tick_timers(cpu_r_reg(M68K_REG_PC), elapsed);
+  }
+}
+
+/* run the CPU for num_cycles but stop at each change of the irq scheduler
+   and at each timer expiry so that both fire on time even if the CPU is
+   stopped or idle */
+static int run_slice(int num_cycles)
+{
+  int done = 0;
+
+  while(done < num_cycles) {
+    int cycles = num_cycles - done;
+    int run;
+    if(irq_scheduler_enabled) {
+      cycles = irq_update(clock_cycles, cycles);
+    }
+    if(tools_timers_enabled) {
+      uint32_t next = tools_get_next_timer();
+      if((next > 0) && (next < (uint32_t)cycles)) {
+        cycles = next;
+      }
+    }
+    if((budget.end_cycles > clock_cycles) &&
+       (budget.end_cycles - clock_cycles < (uint64_t)cycles)) {
+      cycles = (int)(budget.end_cycles - clock_cycles);
+    }
+    in_slice = 1;
+    run = m68k_execute(cycles);
+    in_slice = 0;
+    /* add cycles skipped in an idle loop */
+    run += skip_cycles;
+    skip_cycles = 0;
+    clock_cycles += run;
+    done += run;
+    if(tools_timers_enabled) {
+      tick_timers();
+    } else {
+      last_clock = clock_cycles;
+    }
+    if((budget.end_cycles > 0) || (budget.deadline > 0)) {
+      check_budget();
+    }
+    if(run_info.num_events > 0) {
+      break;
+    }
+  }
+  return done;
+}
+
 int cpu_execute(int num_cycles)
 {
   if(num_cycles == 0) {
@@ -373,7 +576,7 @@ int cpu_execute(int num_cycles)
   event_func = m68k_end_timeslice;
 
   /* run 68k! */
-  run_info.done_cycles = m68k_execute(num_cycles);
+  run_info.done_cycles = run_slice(num_cycles);
   run_info.total_cycles += run_info.done_cycles;
 
   /* remove event func */
@@ -401,7 +604,7 @@ int cpu_execute_to_event(int cycles_per_run)
 
   /* run 68k! */
   while(run_info.num_events == 0) {
-    done_cycles += m68k_execute(cycles_per_run);
+    done_cycles += run_slice(cycles_per_run);
   }
 
   /* account cycles */
@@ -414,4 +617,60 @@ int cpu_execute_to_event(int cycles_per_run)
   return run_info.num_events;
 }
 
+int cpu_execute_slices(int cycles_per_run, int max_slices)
+{
+  int done_cycles = 0;
+  int i;
+
+  if(cycles_per_run == 0) {
+    cycles_per_run = DEFAULT_CYCLES;
+  }
+
+  if(!dont_clear) {
+    cpu_clear_info();
+  } else {
+    dont_clear = 0;
+  }
+
+  /* set event function */
+  event_func = m68k_end_timeslice;
+
+  /* run 68k for some slices or until an event occurs */
+  for(i=0;i<max_slices;i++) {
+    done_cycles += run_slice(cycles_per_run);
+    if(run_info.num_events > 0) {
+      break;
+    }
+  }
+
+  /* account cycles */
+  run_info.done_cycles = done_cycles;
+  run_info.total_cycles += run_info.done_cycles;
+
+  event_func = NULL;
+
+  return run_info.num_events;
+}
+
+/* return true while m68k_execute() runs, i.e. inside of a callback */
+int cpu_is_executing(void)
+{
+  return in_slice;
+}
+
+/* return true if execution may call external functions */
+int cpu_has_callbacks(void)
+{
+  if((instr_hook_func != NULL) && (instr_hook_func != cpu_default_instr_hook_func)) {
+    return 1;
+  }
+  if((int_ack_func != NULL) && irq_has_dynamic_ack()) {
+    return 1;
+  }
+  if(traps_has_calls()) {
+    return 1;
+  }
+  return mem_has_callbacks();
+}
+
 /* ----- PC Trace ----- */
@@ -22,8 +22,14 @@
 #define CPU_EVENT_BREAKPOINT 9
 #define CPU_EVENT_WATCHPOINT 10
 #define CPU_EVENT_TIMER 11
+#define CPU_EVENT_BUDGET 12
 
-#define CPU_NUM_EVENTS 12
+#define CPU_NUM_EVENTS 13
+
+/* value of a budget event */
+#define CPU_BUDGET_CYCLES 1
+#define CPU_BUDGET_INSTR 2
+#define CPU_BUDGET_DEADLINE 3
 
 #define CPU_CB_EVENT 0
 #define CPU_CB_NO_EVENT 1
@@ -57,6 +63,14 @@ typedef struct {
   uint32_t     vbr;
 } registers_t;
 
+/* absolute limits of a run. saved and restored for nested runs */
+typedef struct {
+  uint64_t end_cycles;  /* 0 = no limit */
+  uint64_t left_instr;
+  int      check_instr;
+  uint64_t deadline;    /* in ms, 0 = no limit */
+} budget_t;
+
 typedef void (*cleanup_event_func_t)(event_t *e);
 typedef int (*instr_hook_func_t)(uint32_t pc, void **data);
 typedef int (*int_ack_func_t)(int level, uint32_t pc, uint32_t *ack_ret, void **data);
@@ -74,10 +88,19 @@ extern int cpu_default_instr_hook_func(uint32_t pc, void **data);
 
 extern int cpu_execute(int num_cycles);
 extern int cpu_execute_to_event(int cycles_per_run);
+extern int cpu_execute_slices(int cycles_per_run, int max_slices);
+extern int cpu_has_callbacks(void);
+extern int cpu_is_executing(void);
 extern void cpu_set_irq(int level);
+extern uint64_t cpu_get_clock(void);
+extern void cpu_set_budget(uint64_t max_cycles, uint64_t max_instr, uint32_t timeout_ms);
+extern void cpu_get_budget(budget_t *b);
+extern void cpu_restore_budget(const budget_t *b);
 
 extern uint32_t cpu_r_reg(int reg);
 extern void cpu_w_reg(int reg, uint32_t val);
+/* live D0-D7/A0-A7 of the CPU. A7 is the active stack pointer */
+extern uint32_t *cpu_get_reg_file(void);
 
 extern void cpu_r_regs(registers_t *regs);
 extern void cpu_w_regs(const registers_t *regs);
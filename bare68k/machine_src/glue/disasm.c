@@ -0,0 +1,513 @@
+/* Disasm
+ *
+ * written by Christian Vogelgsang <chris@vogelgsang.org>
+ * under the GNU Public License V2
+ */
+
+#include <stdio.h>
+#include <string.h>
+
+#include "disasm.h"
+#include "m68k.h"
+#include "mem.h"
+
+typedef struct {
+  const char *name;
+  uint8_t reg;
+} ctrl_reg_t;
+
+static const ctrl_reg_t ctrl_regs[] = {
+  { "SR", M68K_REG_SR },
+  { "USP", M68K_REG_USP },
+  { "VBR", M68K_REG_VBR },
+  { "SFC", M68K_REG_SFC },
+  { "DFC", M68K_REG_DFC },
+  { "CACR", M68K_REG_CACR },
+  { "CAAR", M68K_REG_CAAR },
+  { "MSP", M68K_REG_MSP },
+  { "ISP", M68K_REG_ISP },
+  { NULL, 0 }
+};
+
+/* parse "$hex", "-$hex" or decimal number. return end or NULL */
+static const char *parse_num(const char *s, const char *e, uint32_t *val)
+{
+  int neg = 0;
+  uint32_t v = 0;
+  const char *start;
+
+  if((s < e) && (*s == '-')) {
+    neg = 1;
+    s++;
+  }
+  if((s < e) && (*s == '$')) {
+    s++;
+    start = s;
+    while(s < e) {
+      char c = *s;
+      if((c >= '0') && (c <= '9')) {
+        v = (v << 4) | (c - '0');
+      } else if((c >= 'a') && (c <= 'f')) {
+        v = (v << 4) | (c - 'a' + 10);
+      } else if((c >= 'A') && (c <= 'F')) {
+        v = (v << 4) | (c - 'A' + 10);
+      } else {
+        break;
+      }
+      s++;
+    }
+  } else {
+    start = s;
+    while((s < e) && (*s >= '0') && (*s <= '9')) {
+      v = v * 10 + (*s - '0');
+      s++;
+    }
+  }
+  if(s == start) {
+    return NULL;
+  }
+  *val = neg ? (0 - v) : v;
+  return s;
+}
+
+/* parse "Dn" or "An": reg 0-7 is Dn, 8-15 is An */
+static const char *parse_reg(const char *s, const char *e, uint8_t *reg)
+{
+  if(((e - s) < 2) || (s[1] < '0') || (s[1] > '7')) {
+    return NULL;
+  }
+  if(s[0] == 'D') {
+    *reg = s[1] - '0';
+  } else if(s[0] == 'A') {
+    *reg = 8 + s[1] - '0';
+  } else {
+    return NULL;
+  }
+  return s + 2;
+}
+
+/* parse index register "Xn[.w|.l][*scale]" */
+static const char *parse_index(const char *s, const char *e, uint8_t *index)
+{
+  uint8_t idx;
+
+  s = parse_reg(s, e, &idx);
+  if(s == NULL) {
+    return NULL;
+  }
+  if(((e - s) >= 2) && (s[0] == '.')) {
+    if(s[1] == 'l') {
+      idx |= DISASM_INDEX_LONG;
+    } else if(s[1] != 'w') {
+      return NULL;
+    }
+    s += 2;
+  }
+  if(((e - s) >= 2) && (s[0] == '*')) {
+    switch(s[1]) {
+      case '1': break;
+      case '2': idx |= 1 << DISASM_INDEX_SCALE_SHIFT; break;
+      case '4': idx |= 2 << DISASM_INDEX_SCALE_SHIFT; break;
+      case '8': idx |= 3 << DISASM_INDEX_SCALE_SHIFT; break;
+      default: return NULL;
+    }
+    s += 2;
+  }
+  *index = idx;
+  return s;
+}
+
+/* parse movem register list "D0-D3/A0/A5-A6" */
+static int parse_reglist(const char *s, const char *e, uint32_t *mask)
+{
+  uint8_t r, last;
+  uint32_t m = 0;
+  const char *q;
+
+  while(s < e) {
+    q = parse_reg(s, e, &r);
+    if(q == NULL) {
+      return 0;
+    }
+    last = r;
+    s = q;
+    if((s < e) && (*s == '-')) {
+      q = parse_reg(s + 1, e, &last);
+      if((q == NULL) || (last < r)) {
+        return 0;
+      }
+      s = q;
+    }
+    for(; r <= last; r++) {
+      m |= 1 << r;
+    }
+    if(s < e) {
+      if(*s != '/') {
+        return 0;
+      }
+      s++;
+    }
+  }
+  *mask = m;
+  return 1;
+}
+
+/* parse "(...)" contents: [disp,]base[,index] */
+static void parse_indirect(const char *s, const char *e, disasm_operand_t *op,
+                           uint32_t target, int has_target)
+{
+  uint32_t disp = 0;
+  int has_disp = 0;
+  int is_pc = 0;
+  uint8_t reg = 0;
+  uint8_t index = DISASM_INDEX_NONE;
+  const char *q;
+
+  /* displacement */
+  if((*s == '$') || (*s == '-') || ((*s >= '0') && (*s <= '9'))) {
+    q = parse_num(s, e, &disp);
+    if(q == NULL) {
+      return;
+    }
+    has_disp = 1;
+    s = q;
+    if((s < e) && (*s == ',')) {
+      s++;
+    }
+  }
+  /* base register */
+  if(((e - s) >= 2) && (s[0] == 'P') && (s[1] == 'C')) {
+    is_pc = 1;
+    s += 2;
+  } else {
+    q = parse_reg(s, e, &reg);
+    if((q == NULL) || (reg < 8)) {
+      return;
+    }
+    reg -= 8;
+    s = q;
+  }
+  /* index register */
+  if(s < e) {
+    if(*s != ',') {
+      return;
+    }
+    q = parse_index(s + 1, e, &index);
+    if(q != e) {
+      return;
+    }
+  }
+
+  op->reg = reg;
+  op->value = disp;
+  op->index = index;
+  if(is_pc) {
+    if(index != DISASM_INDEX_NONE) {
+      op->kind = DISASM_OP_PCINDEX;
+    } else {
+      op->kind = DISASM_OP_PCDISP;
+      if(has_target) {
+        op->value = target;
+      }
+    }
+  } else if(index != DISASM_INDEX_NONE) {
+    op->kind = DISASM_OP_AINDEX;
+  } else if(has_disp) {
+    op->kind = DISASM_OP_ADISP;
+  } else {
+    op->kind = DISASM_OP_AIND;
+  }
+}
+
+static void parse_operand(const char *s, const char *e, disasm_operand_t *op,
+                          uint32_t target, int has_target)
+{
+  uint32_t v;
+  uint8_t r;
+  const char *q;
+  const ctrl_reg_t *cr;
+  size_t n = e - s;
+
+  op->kind = DISASM_OP_OTHER;
+  op->reg = 0;
+  op->index = DISASM_INDEX_NONE;
+  op->value = 0;
+  if(n == 0) {
+    return;
+  }
+
+  switch(*s) {
+    case '#':
+      if(parse_num(s + 1, e, &v) == e) {
+        op->kind = DISASM_OP_IMM;
+        op->value = v;
+      }
+      return;
+    case '$':
+      q = parse_num(s, e, &v);
+      if(q == e) {
+        op->kind = DISASM_OP_ADDR;
+        op->value = v;
+      } else if((q != NULL) && ((e - q) == 2) && (q[0] == '.')) {
+        if(q[1] == 'w') {
+          op->kind = DISASM_OP_ABSW;
+          op->value = (v & 0x8000) ? (v | 0xffff0000) : (v & 0xffff);
+        } else if(q[1] == 'l') {
+          op->kind = DISASM_OP_ABSL;
+          op->value = v;
+        }
+      }
+      return;
+    case '-':
+      if((n == 5) && (s[1] == '(') && (s[4] == ')') &&
+         (parse_reg(s + 2, e, &r) == s + 4) && (r >= 8)) {
+        op->kind = DISASM_OP_APREDEC;
+        op->reg = r - 8;
+      }
+      return;
+    case '(':
+      if((n == 5) && (s[3] == ')') && (s[4] == '+')) {
+        if((parse_reg(s + 1, e, &r) == s + 3) && (r >= 8)) {
+          op->kind = DISASM_OP_APOSTINC;
+          op->reg = r - 8;
+        }
+      } else if((e[-1] == ')') && (memchr(s, '[', n) == NULL)) {
+        parse_indirect(s + 1, e - 1, op, target, has_target);
+      }
+      return;
+    case 'D':
+    case 'A':
+      q = parse_reg(s, e, &r);
+      if(q == e) {
+        op->kind = (r < 8) ? DISASM_OP_DREG : DISASM_OP_AREG;
+        op->reg = r & 7;
+        return;
+      }
+      if(parse_reglist(s, e, &v)) {
+        op->kind = DISASM_OP_REGLIST;
+        op->value = v;
+        return;
+      }
+      break;
+  }
+
+  /* branch targets are plain lower case hex numbers */
+  v = 0;
+  for(q = s; q < e; q++) {
+    if((*q >= '0') && (*q <= '9')) {
+      v = (v << 4) | (*q - '0');
+    } else if((*q >= 'a') && (*q <= 'f')) {
+      v = (v << 4) | (*q - 'a' + 10);
+    } else {
+      break;
+    }
+  }
+  if(q == e) {
+    op->kind = DISASM_OP_ADDR;
+    op->value = v;
+    return;
+  }
+
+  /* named registers */
+  if((n == 3) && (strncmp(s, "CCR", 3) == 0)) {
+    op->kind = DISASM_OP_CCR;
+    return;
+  }
+  for(cr = ctrl_regs; cr->name != NULL; cr++) {
+    if((strlen(cr->name) == n) && (strncmp(s, cr->name, n) == 0)) {
+      op->kind = DISASM_OP_CTRL;
+      op->reg = cr->reg;
+      return;
+    }
+  }
+}
+
+static uint8_t get_size(const char *mnemonic)
+{
+  const char *dot = strrchr(mnemonic, '.');
+  if((dot == NULL) || (dot[1] == 0) || (dot[2] != 0)) {
+    return 0;
+  }
+  switch(dot[1]) {
+    case 'b': return 1;
+    case 'w': return 2;
+    case 'l': return 4;
+    default: return 0;
+  }
+}
+
+static uint32_t decode(uint32_t pc, unsigned int cpu_type, disasm_instr_t *instr,
+                       int with_operands)
+{
+  char line[256];
+  const char *p, *q, *s;
+  char *a;
+  uint32_t num_bytes, v;
+  uint32_t target = 0;
+  int has_target = 0;
+  int depth = 0;
+  uint i, n;
+
+  num_bytes = m68k_disassemble(line, pc, cpu_type);
+  instr->pc = pc;
+  instr->num_bytes = num_bytes;
+
+  /* words */
+  n = num_bytes / 2;
+  if(n > DISASM_MAX_WORDS) {
+    n = DISASM_MAX_WORDS;
+  }
+  for(i = 0; i < n; i++) {
+    instr->words[i] = m68k_read_disassembler_16(pc + i * 2);
+  }
+  instr->num_words = n;
+
+  /* mnemonic */
+  p = line;
+  while(*p == ' ') {
+    p++;
+  }
+  i = 0;
+  while((*p != 0) && (*p != ' ') && (*p != ';')) {
+    if(i < (DISASM_MAX_MNEMONIC - 1)) {
+      instr->mnemonic[i++] = *p;
+    }
+    p++;
+  }
+  instr->mnemonic[i] = 0;
+
+  /* args without blanks and comment */
+  a = instr->args;
+  i = 0;
+  while((*p != 0) && (*p != ';')) {
+    if((*p != ' ') && (i < (DISASM_MAX_ARGS - 1))) {
+      a[i++] = *p;
+    }
+    p++;
+  }
+  a[i] = 0;
+
+  /* comment holds target of pc relative access: "; ($1234)" */
+  if(*p == ';') {
+    q = strstr(p, "($");
+    if((q != NULL) && (parse_num(q + 1, q + strlen(q), &target) != NULL)) {
+      has_target = 1;
+    }
+  }
+
+  /* a-line opcodes are shown as invalid words: rewrite them */
+  if((strcmp(instr->mnemonic, "dc.w") == 0) && (i == 5) && (a[0] == '$') &&
+     (parse_num(a, a + 5, &v) != NULL) && ((v & 0xf000) == 0xa000)) {
+    strcpy(instr->mnemonic, "aline");
+    sprintf(a, "#$%03x", v & 0xfff);
+    instr->size = 0;
+    instr->num_operands = 1;
+    instr->operands[0].kind = DISASM_OP_IMM;
+    instr->operands[0].reg = 0;
+    instr->operands[0].index = DISASM_INDEX_NONE;
+    instr->operands[0].value = v & 0xfff;
+    return num_bytes;
+  }
+
+  instr->size = get_size(instr->mnemonic);
+
+  /* split operands at top level commas */
+  instr->num_operands = 0;
+  if(with_operands && (*a != 0)) {
+    s = a;
+    for(q = a; ; q++) {
+      char c = *q;
+      if((c == '(') || (c == '[') || (c == '{')) {
+        depth++;
+      } else if((c == ')') || (c == ']') || (c == '}')) {
+        depth--;
+      } else if(((c == ',') && (depth == 0)) || (c == 0)) {
+        if(instr->num_operands < DISASM_MAX_OPERANDS) {
+          parse_operand(s, q, &instr->operands[instr->num_operands++],
+                        target, has_target);
+        }
+        if(c == 0) {
+          break;
+        }
+        s = q + 1;
+      }
+    }
+  }
+
+  /* data words are no addresses */
+  if((strcmp(instr->mnemonic, "dc.w") == 0) && (instr->num_operands == 1) &&
+     (instr->operands[0].kind == DISASM_OP_ADDR)) {
+    instr->operands[0].kind = DISASM_OP_IMM;
+  }
+  return num_bytes;
+}
+
+uint32_t disasm_decode(uint32_t pc, unsigned int cpu_type, disasm_instr_t *instr)
+{
+  return decode(pc, cpu_type, instr, 1);
+}
+
+uint32_t disasm_range(uint32_t *pc, uint32_t end, unsigned int cpu_type,
+                      disasm_record_t *records, uint32_t max_records,
+                      char *text, uint32_t text_size, uint32_t *text_used)
+{
+  disasm_instr_t instr;
+  disasm_record_t *r = records;
+  uint32_t num = 0;
+  uint32_t addr = *pc;
+  uint32_t used = *text_used;
+  uint32_t num_bytes;
+  size_t mn_len, args_len;
+
+  while((addr < end) && (num < max_records)) {
+    /* worst case text of next instruction must fit */
+    if((used + DISASM_MAX_MNEMONIC + DISASM_MAX_ARGS) > text_size) {
+      break;
+    }
+    num_bytes = decode(addr, cpu_type, &instr, 0);
+    if(num_bytes == 0) {
+      break;
+    }
+    r->pc = addr;
+    r->num_bytes = num_bytes;
+    r->num_words = instr.num_words;
+    r->text_offset = used;
+    memcpy(r->words, instr.words, instr.num_words * sizeof(uint16_t));
+    /* text: "mnemonic\0args\0" */
+    mn_len = strlen(instr.mnemonic) + 1;
+    args_len = strlen(instr.args) + 1;
+    memcpy(text + used, instr.mnemonic, mn_len);
+    memcpy(text + used + mn_len, instr.args, args_len);
+    used += mn_len + args_len;
+    addr += num_bytes;
+    r++;
+    num++;
+  }
+
+  *pc = addr;
+  *text_used = used;
+  return num;
+}
+
+uint32_t disasm_boundaries(uint32_t start, uint32_t end, unsigned int cpu_type,
+                           uint32_t chunk_size, uint32_t *pcs, uint32_t max_pcs)
+{
+  char line[256];
+  uint64_t pc = start;
+  uint64_t next = start;
+  uint32_t num = 0;
+  uint32_t num_bytes;
+
+  while((pc < end) && (num < max_pcs)) {
+    if(pc >= next) {
+      pcs[num++] = (uint32_t)pc;
+      next = pc + chunk_size;
+    }
+    num_bytes = m68k_disassemble(line, (uint32_t)pc, cpu_type);
+    if(num_bytes == 0) {
+      break;
+    }
+    pc += num_bytes;
+  }
+  return num;
+}
@@ -0,0 +1,85 @@
+/* Disasm
+ *
+ * decode an instruction with musashi's disassembler into a compact record
+ * with mnemonic, size and typed operands
+ *
+ * written by Christian Vogelgsang <chris@vogelgsang.org>
+ * under the GNU Public License V2
+ */
+
+#ifndef _DISASM_H
+#define _DISASM_H
+
+#include <stdint.h>
+
+#define DISASM_MAX_WORDS      11  /* longest 68020 instruction: 22 bytes */
+#define DISASM_MAX_OPERANDS   4
+#define DISASM_MAX_MNEMONIC   16
+#define DISASM_MAX_ARGS       96
+
+/* operand kinds */
+#define DISASM_OP_DREG        0   /* Dn */
+#define DISASM_OP_AREG        1   /* An */
+#define DISASM_OP_AIND        2   /* (An) */
+#define DISASM_OP_APOSTINC    3   /* (An)+ */
+#define DISASM_OP_APREDEC     4   /* -(An) */
+#define DISASM_OP_ADISP       5   /* (d,An): value=d */
+#define DISASM_OP_AINDEX      6   /* (d,An,Xn): value=d, index=Xn */
+#define DISASM_OP_ABSW        7   /* $x.w: value=sign extended address */
+#define DISASM_OP_ABSL        8   /* $x.l: value=address */
+#define DISASM_OP_PCDISP      9   /* (d,PC): value=target address */
+#define DISASM_OP_PCINDEX     10  /* (d,PC,Xn): value=d, index=Xn */
+#define DISASM_OP_IMM         11  /* #x: value=x */
+#define DISASM_OP_ADDR        12  /* branch target: value=address */
+#define DISASM_OP_REGLIST     13  /* movem list: value=mask D0=bit0..A7=bit15 */
+#define DISASM_OP_CTRL        14  /* SR, USP, VBR,...: reg=M68K_REG_* */
+#define DISASM_OP_CCR         15  /* CCR */
+#define DISASM_OP_OTHER       16  /* not decoded: see args string */
+
+/* index byte of AINDEX/PCINDEX operands */
+#define DISASM_INDEX_NONE     0xff
+#define DISASM_INDEX_REG      0x0f  /* 0-7: D0-D7, 8-15: A0-A7 */
+#define DISASM_INDEX_LONG     0x10
+#define DISASM_INDEX_SCALE    0x60  /* scale as shift 0..3 */
+#define DISASM_INDEX_SCALE_SHIFT  5
+
+typedef struct disasm_operand
+{
+  uint8_t   kind;
+  uint8_t   reg;
+  uint8_t   index;
+  uint32_t  value;
+} disasm_operand_t;
+
+typedef struct disasm_instr
+{
+  uint32_t  pc;
+  uint32_t  num_bytes;
+  uint8_t   size;           /* 1, 2, 4 or 0 if no size suffix is given */
+  uint8_t   num_words;
+  uint8_t   num_operands;
+  uint16_t  words[DISASM_MAX_WORDS];
+  char      mnemonic[DISASM_MAX_MNEMONIC];
+  char      args[DISASM_MAX_ARGS];  /* without blanks and comment */
+  disasm_operand_t operands[DISASM_MAX_OPERANDS];
+} disasm_instr_t;
+
+/* fixed size record of a bulk disassembly: text is "mnemonic\0args\0" */
+typedef struct disasm_record
+{
+  uint32_t  pc;
+  uint16_t  num_bytes;
+  uint16_t  num_words;
+  uint32_t  text_offset;
+  uint16_t  words[DISASM_MAX_WORDS];
+} disasm_record_t;
+
+extern uint32_t disasm_decode(uint32_t pc, unsigned int cpu_type, disasm_instr_t *instr);
+extern uint32_t disasm_range(uint32_t *pc, uint32_t end, unsigned int cpu_type,
+                             disasm_record_t *records, uint32_t max_records,
+                             char *text, uint32_t text_size, uint32_t *text_used);
+/* store the pc of the first instruction of each chunk of given size */
+extern uint32_t disasm_boundaries(uint32_t start, uint32_t end, unsigned int cpu_type,
+                                  uint32_t chunk_size, uint32_t *pcs, uint32_t max_pcs);
+
+#endif
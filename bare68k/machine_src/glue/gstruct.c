@@ -0,0 +1,121 @@
+/* GStruct
+ *
+ * written by Christian Vogelgsang <chris@vogelgsang.org>
+ * under the GNU Public License V2
+ */
+
+#include "gstruct.h"
+#include "mem.h"
+
+static const int type_sizes[GSTRUCT_NUM_TYPES] = {
+  1, 1, 2, 2, 4, 4, 4, 4
+};
+
+int gstruct_get_type_size(int type)
+{
+  if((type < 0) || (type >= GSTRUCT_NUM_TYPES)) {
+    return 0;
+  }
+  return type_sizes[type];
+}
+
+int gstruct_read(uint32_t addr, const gstruct_field_t *fields, int num_fields,
+                 uint32_t *values)
+{
+  int i;
+  uint8_t v8;
+  uint16_t v16;
+  uint32_t v32;
+
+  for(i = 0; i < num_fields; i++) {
+    uint32_t field_addr = addr + fields[i].offset;
+    switch(fields[i].type) {
+      case GSTRUCT_U8:
+      case GSTRUCT_S8:
+        if(!mem_r8(field_addr, &v8)) {
+          return 0;
+        }
+        values[i] = v8;
+        break;
+      case GSTRUCT_U16:
+      case GSTRUCT_S16:
+        if(!mem_r16(field_addr, &v16)) {
+          return 0;
+        }
+        values[i] = v16;
+        break;
+      case GSTRUCT_U32:
+      case GSTRUCT_S32:
+      case GSTRUCT_CSTR:
+      case GSTRUCT_BSTR:
+        if(!mem_r32(field_addr, &v32)) {
+          return 0;
+        }
+        values[i] = v32;
+        break;
+      default:
+        return 0;
+    }
+  }
+  return 1;
+}
+
+int gstruct_write(uint32_t addr, const gstruct_field_t *fields, int num_fields,
+                  const uint32_t *values, const uint8_t *valid)
+{
+  int i;
+  int ok;
+
+  for(i = 0; i < num_fields; i++) {
+    uint32_t field_addr = addr + fields[i].offset;
+    if(!valid[i]) {
+      continue;
+    }
+    switch(fields[i].type) {
+      case GSTRUCT_U8:
+      case GSTRUCT_S8:
+        ok = mem_w8(field_addr, (uint8_t)values[i]);
+        break;
+      case GSTRUCT_U16:
+      case GSTRUCT_S16:
+        ok = mem_w16(field_addr, (uint16_t)values[i]);
+        break;
+      case GSTRUCT_U32:
+      case GSTRUCT_S32:
+      case GSTRUCT_CSTR:
+      case GSTRUCT_BSTR:
+        ok = mem_w32(field_addr, values[i]);
+        break;
+      default:
+        ok = 0;
+        break;
+    }
+    if(!ok) {
+      return 0;
+    }
+  }
+  return 1;
+}
+
+int gstruct_walk(uint32_t first, uint32_t next_offset, int skip_tail,
+                 uint32_t *nodes, int max_nodes)
+{
+  int num = 0;
+  uint32_t node = first;
+  uint32_t next;
+
+  while(node != 0) {
+    if(!mem_r32(node + next_offset, &next)) {
+      return GSTRUCT_WALK_INVALID;
+    }
+    if(skip_tail && (next == 0)) {
+      break;
+    }
+    if(num == max_nodes) {
+      return GSTRUCT_WALK_TOO_LONG;
+    }
+    nodes[num++] = node;
+    node = next;
+  }
+  return num;
+}
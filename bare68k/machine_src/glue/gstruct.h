@@ -0,0 +1,50 @@
+/* GStruct
+ *
+ * read and write guest structures and walk linked lists of them
+ *
+ * written by Christian Vogelgsang <chris@vogelgsang.org>
+ * under the GNU Public License V2
+ */
+
+#ifndef _GSTRUCT_H
+#define _GSTRUCT_H
+
+#include <stdint.h>
+
+/* field types */
+#define GSTRUCT_U8      0
+#define GSTRUCT_S8      1
+#define GSTRUCT_U16     2
+#define GSTRUCT_S16     3
+#define GSTRUCT_U32     4
+#define GSTRUCT_S32     5
+#define GSTRUCT_CSTR    6   /* pointer to a C string */
+#define GSTRUCT_BSTR    7   /* BCPL pointer to a BCPL string */
+#define GSTRUCT_NUM_TYPES 8
+
+/* walk errors */
+#define GSTRUCT_WALK_INVALID  -1
+#define GSTRUCT_WALK_TOO_LONG -2
+
+typedef struct gstruct_field
+{
+  uint32_t  offset;
+  int       type;
+} gstruct_field_t;
+
+extern int gstruct_get_type_size(int type);
+
+/* values are returned and given as raw 32 bit values. return 0 on error */
+extern int gstruct_read(uint32_t addr, const gstruct_field_t *fields, int num_fields,
+                        uint32_t *values);
+/* only write fields with a non zero entry in valid */
+extern int gstruct_write(uint32_t addr, const gstruct_field_t *fields, int num_fields,
+                         const uint32_t *values, const uint8_t *valid);
+
+/* follow next pointers starting with first node until a NULL pointer.
+   with skip_tail the last node (whose next pointer is NULL) is not returned
+   as in exec lists. return number of nodes or a GSTRUCT_WALK error */
+extern int gstruct_walk(uint32_t first, uint32_t next_offset, int skip_tail,
+                        uint32_t *nodes, int max_nodes);
+
+#endif
@@ -0,0 +1,549 @@
+/* Heap
+ *
+ * written by Christian Vogelgsang <chris@vogelgsang.org>
+ * under the GNU Public License V2
+ */
+
+#include <string.h>
+#include <stdlib.h>
+
+#include "heap.h"
+#include "mem.h"
+
+/* ----- types ----- */
+
+typedef struct heap_block
+{
+  struct heap_block  *prev;       /* address order */
+  struct heap_block  *next;
+  struct heap_block  *free_prev;  /* free list (free blocks only) */
+  struct heap_block  *free_next;
+  struct heap_block  *hash_next;  /* used block hash chain */
+  uint32_t            addr;
+  uint32_t            size;
+  int                 used;
+} heap_block_t;
+
+struct heap
+{
+  uint32_t            start;
+  uint32_t            size;
+  uint32_t            gran_mask;
+  heap_block_t       *first;
+  heap_block_t       *free_list;
+  heap_block_t       *pool;       /* recycled block nodes */
+  heap_block_t      **buckets;
+  uint32_t            num_buckets;
+  heap_stats_t        stats;
+};
+
+#define MIN_BUCKETS   256
+
+/* ----- block nodes ----- */
+
+static heap_block_t *new_block(heap_t *heap, uint32_t addr, uint32_t size)
+{
+  heap_block_t *b = heap->pool;
+  if(b != NULL) {
+    heap->pool = b->next;
+  } else {
+    b = (heap_block_t *)malloc(sizeof(heap_block_t));
+    if(b == NULL) {
+      return NULL;
+    }
+  }
+  memset(b, 0, sizeof(heap_block_t));
+  b->addr = addr;
+  b->size = size;
+  return b;
+}
+
+static void recycle_block(heap_t *heap, heap_block_t *b)
+{
+  b->next = heap->pool;
+  heap->pool = b;
+}
+
+static void free_nodes(heap_block_t *b)
+{
+  while(b != NULL) {
+    heap_block_t *next = b->next;
+    free(b);
+    b = next;
+  }
+}
+
+/* ----- free list ----- */
+
+/* the free list is kept in address order so first fit prefers low addresses */
+
+static void free_list_link(heap_t *heap, heap_block_t *b,
+                           heap_block_t *prev, heap_block_t *next)
+{
+  b->free_prev = prev;
+  b->free_next = next;
+  if(prev != NULL) {
+    prev->free_next = b;
+  } else {
+    heap->free_list = b;
+  }
+  if(next != NULL) {
+    next->free_prev = b;
+  }
+}
+
+static void free_list_add(heap_t *heap, heap_block_t *b)
+{
+  /* search the nearest free block in both directions */
+  heap_block_t *p = b->prev;
+  heap_block_t *n = b->next;
+  while(1) {
+    if(p != NULL) {
+      if(!p->used) {
+        free_list_link(heap, b, p, p->free_next);
+        break;
+      }
+      p = p->prev;
+    }
+    if(n != NULL) {
+      if(!n->used) {
+        free_list_link(heap, b, n->free_prev, n);
+        break;
+      }
+      n = n->next;
+    }
+    if((p == NULL) && (n == NULL)) {
+      free_list_link(heap, b, NULL, heap->free_list);
+      break;
+    }
+  }
+  heap->stats.num_free_blocks++;
+}
+
+static void free_list_remove(heap_t *heap, heap_block_t *b)
+{
+  if(b->free_prev != NULL) {
+    b->free_prev->free_next = b->free_next;
+  } else {
+    heap->free_list = b->free_next;
+  }
+  if(b->free_next != NULL) {
+    b->free_next->free_prev = b->free_prev;
+  }
+  heap->stats.num_free_blocks--;
+}
+
+/* block b takes the place of free block o in the free list */
+static void free_list_replace(heap_t *heap, heap_block_t *o, heap_block_t *b)
+{
+  free_list_link(heap, b, o->free_prev, o->free_next);
+  o->free_prev = o->free_next = NULL;
+}
+
+/* ----- used block hash ----- */
+
+static uint32_t hash_addr(heap_t *heap, uint32_t addr)
+{
+  return ((addr >> 2) * 2654435761u) & (heap->num_buckets - 1);
+}
+
+static int hash_resize(heap_t *heap, uint32_t num_buckets)
+{
+  heap_block_t **buckets = (heap_block_t **)calloc(num_buckets, sizeof(heap_block_t *));
+  heap_block_t **old = heap->buckets;
+  uint32_t old_num = heap->num_buckets;
+  uint32_t i;
+
+  if(buckets == NULL) {
+    return 0;
+  }
+  heap->buckets = buckets;
+  heap->num_buckets = num_buckets;
+  for(i = 0; i < old_num; i++) {
+    heap_block_t *b = old[i];
+    while(b != NULL) {
+      heap_block_t *next = b->hash_next;
+      uint32_t h = hash_addr(heap, b->addr);
+      b->hash_next = buckets[h];
+      buckets[h] = b;
+      b = next;
+    }
+  }
+  free(old);
+  return 1;
+}
+
+static void hash_add(heap_t *heap, heap_block_t *b)
+{
+  uint32_t h;
+  if(heap->stats.num_allocs > heap->num_buckets * 2) {
+    /* on failure keep the longer chains */
+    hash_resize(heap, heap->num_buckets * 4);
+  }
+  h = hash_addr(heap, b->addr);
+  b->hash_next = heap->buckets[h];
+  heap->buckets[h] = b;
+}
+
+static heap_block_t *hash_find(heap_t *heap, uint32_t addr)
+{
+  heap_block_t *b = heap->buckets[hash_addr(heap, addr)];
+  while(b != NULL) {
+    if(b->addr == addr) {
+      return b;
+    }
+    b = b->hash_next;
+  }
+  return NULL;
+}
+
+static void hash_remove(heap_t *heap, heap_block_t *b)
+{
+  heap_block_t **link = &heap->buckets[hash_addr(heap, b->addr)];
+  while(*link != NULL) {
+    if(*link == b) {
+      *link = b->hash_next;
+      return;
+    }
+    link = &(*link)->hash_next;
+  }
+}
+
+/* ----- block list ----- */
+
+/* split off the front of block b as a new block of given size.
+   the new block is free and not in the free list */
+static heap_block_t *split_front(heap_t *heap, heap_block_t *b, uint32_t size)
+{
+  heap_block_t *f = new_block(heap, b->addr, size);
+  if(f == NULL) {
+    return NULL;
+  }
+  f->prev = b->prev;
+  f->next = b;
+  if(b->prev != NULL) {
+    b->prev->next = f;
+  } else {
+    heap->first = f;
+  }
+  b->prev = f;
+  b->addr += size;
+  b->size -= size;
+  return f;
+}
+
+/* unlink block n (the successor of b) and add its range to b */
+static void merge_next(heap_t *heap, heap_block_t *b)
+{
+  heap_block_t *n = b->next;
+  b->size += n->size;
+  b->next = n->next;
+  if(n->next != NULL) {
+    n->next->prev = b;
+  }
+  recycle_block(heap, n);
+}
+
+/* turn free block into used block of given size at offset */
+static heap_block_t *take_block(heap_t *heap, heap_block_t *b, uint32_t pad, uint32_t size)
+{
+  heap_block_t *f = NULL;
+  heap_block_t *u;
+
+  /* leading free fragment takes the place of b in the free list */
+  if(pad > 0) {
+    f = split_front(heap, b, pad);
+    if(f == NULL) {
+      return NULL;
+    }
+    free_list_replace(heap, b, f);
+  }
+
+  u = b;
+  if(b->size > size) {
+    /* the trailing part of b stays free */
+    u = split_front(heap, b, size);
+  }
+  if(u != b) {
+    if(f != NULL) {
+      free_list_link(heap, b, f, f->free_next);
+      heap->stats.num_free_blocks++;
+    }
+    if(u == NULL) {
+      return NULL;
+    }
+  } else if(f == NULL) {
+    free_list_remove(heap, b);
+  }
+  u->used = 1;
+  return u;
+}
+
+static void account_alloc(heap_t *heap, heap_block_t *u)
+{
+  hash_add(heap, u);
+  heap->stats.num_allocs++;
+  heap->stats.total_allocs++;
+  heap->stats.used_bytes += u->size;
+  heap->stats.free_bytes -= u->size;
+  if(heap->stats.used_bytes > heap->stats.peak_used_bytes) {
+    heap->stats.peak_used_bytes = heap->stats.used_bytes;
+  }
+}
+
+/* ----- API ----- */
+
+heap_t *heap_create(uint32_t start, uint32_t size, uint32_t granularity)
+{
+  heap_t *heap;
+  heap_block_t *b;
+
+  /* granularity must be a power of two and range aligned to it */
+  if((granularity == 0) || (granularity & (granularity - 1))) {
+    return NULL;
+  }
+  size &= ~(granularity - 1);
+  if((size == 0) || (start & (granularity - 1))) {
+    return NULL;
+  }
+  /* address 0 is the out of memory result of heap_alloc() */
+  if(start == 0) {
+    return NULL;
+  }
+  if(mem_get_range(start, size) == NULL) {
+    return NULL;
+  }
+
+  heap = (heap_t *)malloc(sizeof(heap_t));
+  if(heap == NULL) {
+    return NULL;
+  }
+  memset(heap, 0, sizeof(heap_t));
+  heap->start = start;
+  heap->size = size;
+  heap->gran_mask = granularity - 1;
+  if(!hash_resize(heap, MIN_BUCKETS)) {
+    free(heap);
+    return NULL;
+  }
+  b = new_block(heap, start, size);
+  if(b == NULL) {
+    free(heap->buckets);
+    free(heap);
+    return NULL;
+  }
+  heap->first = b;
+  free_list_add(heap, b);
+  heap->stats.total_bytes = size;
+  heap->stats.free_bytes = size;
+  return heap;
+}
+
+void heap_destroy(heap_t *heap)
+{
+  free_nodes(heap->first);
+  free_nodes(heap->pool);
+  free(heap->buckets);
+  free(heap);
+}
+
+uint32_t heap_alloc(heap_t *heap, uint32_t size, uint32_t align, int flags)
+{
+  heap_block_t *b;
+  heap_block_t *u;
+  uint32_t mask;
+
+  if(align == 0) {
+    align = heap->gran_mask + 1;
+  }
+  if((size == 0) || (align & (align - 1)) || (size > heap->size)) {
+    heap->stats.failed_allocs++;
+    return 0;
+  }
+  size = (size + heap->gran_mask) & ~heap->gran_mask;
+  mask = (align - 1) | heap->gran_mask;
+
+  /* first fit */
+  for(b = heap->free_list; b != NULL; b = b->free_next) {
+    uint32_t pad = ((b->addr + mask) & ~mask) - b->addr;
+    if((b->size >= size) && (b->size - size >= pad)) {
+      u = take_block(heap, b, pad, size);
+      if(u == NULL) {
+        break;
+      }
+      account_alloc(heap, u);
+      if(flags & HEAP_FLAG_CLEAR) {
+        mem_set_block(u->addr, size, 0);
+      }
+      return u->addr;
+    }
+  }
+  heap->stats.failed_allocs++;
+  return 0;
+}
+
+uint32_t heap_free(heap_t *heap, uint32_t addr)
+{
+  heap_block_t *b = hash_find(heap, addr);
+  heap_block_t *p;
+  heap_block_t *n;
+  uint32_t size;
+
+  if(b == NULL) {
+    return 0;
+  }
+  size = b->size;
+  hash_remove(heap, b);
+  b->used = 0;
+  heap->stats.num_allocs--;
+  heap->stats.used_bytes -= size;
+  heap->stats.free_bytes += size;
+
+  /* coalesce with free neighbours */
+  n = b->next;
+  p = b->prev;
+  if((n != NULL) && !n->used) {
+    if((p != NULL) && !p->used) {
+      free_list_remove(heap, n);
+      merge_next(heap, b);
+      merge_next(heap, p);
+    } else {
+      free_list_replace(heap, n, b);
+      merge_next(heap, b);
+    }
+  } else if((p != NULL) && !p->used) {
+    merge_next(heap, p);
+  } else {
+    free_list_add(heap, b);
+  }
+  return size;
+}
+
+uint32_t heap_realloc(heap_t *heap, uint32_t addr, uint32_t size, int flags)
+{
+  heap_block_t *b;
+  heap_block_t *n;
+  uint32_t old_size;
+  uint32_t new_addr;
+
+  if(addr == 0) {
+    return heap_alloc(heap, size, 0, flags);
+  }
+  b = hash_find(heap, addr);
+  if((b == NULL) || (size == 0) || (size > heap->size)) {
+    return 0;
+  }
+  size = (size + heap->gran_mask) & ~heap->gran_mask;
+  old_size = b->size;
+  n = b->next;
+
+  if(size <= old_size) {
+    /* shrink in place: give the tail back */
+    uint32_t tail = old_size - size;
+    if(tail > 0) {
+      if((n != NULL) && !n->used) {
+        n->addr -= tail;
+        n->size += tail;
+      } else {
+        heap_block_t *f = new_block(heap, b->addr + size, tail);
+        if(f == NULL) {
+          return addr;
+        }
+        f->prev = b;
+        f->next = n;
+        if(n != NULL) {
+          n->prev = f;
+        }
+        b->next = f;
+        free_list_add(heap, f);
+      }
+      b->size = size;
+      heap->stats.used_bytes -= tail;
+      heap->stats.free_bytes += tail;
+    }
+    return addr;
+  }
+
+  if((n != NULL) && !n->used && (old_size + n->size >= size)) {
+    /* grow in place into the following free block */
+    uint32_t extra = size - old_size;
+    if(n->size == extra) {
+      free_list_remove(heap, n);
+      merge_next(heap, b);
+    } else {
+      n->addr += extra;
+      n->size -= extra;
+      b->size = size;
+    }
+    heap->stats.used_bytes += extra;
+    heap->stats.free_bytes -= extra;
+    if(heap->stats.used_bytes > heap->stats.peak_used_bytes) {
+      heap->stats.peak_used_bytes = heap->stats.used_bytes;
+    }
+    if(flags & HEAP_FLAG_CLEAR) {
+      mem_set_block(addr + old_size, extra, 0);
+    }
+    return addr;
+  }
+
+  /* move */
+  new_addr = heap_alloc(heap, size, 0, 0);
+  if(new_addr == 0) {
+    return 0;
+  }
+  mem_copy_block(addr, new_addr, old_size);
+  if(flags & HEAP_FLAG_CLEAR) {
+    mem_set_block(new_addr + old_size, size - old_size, 0);
+  }
+  heap_free(heap, addr);
+  heap->stats.total_allocs--;
+  return new_addr;
+}
+
+uint32_t heap_get_size(heap_t *heap, uint32_t addr)
+{
+  heap_block_t *b = hash_find(heap, addr);
+  if(b == NULL) {
+    return 0;
+  }
+  return b->size;
+}
+
+void heap_clear(heap_t *heap)
+{
+  heap_block_t *b;
+
+  /* recycle all nodes but the first */
+  b = heap->first;
+  if(b->next != NULL) {
+    heap_block_t *last = b->next;
+    while(last->next != NULL) {
+      last = last->next;
+    }
+    last->next = heap->pool;
+    heap->pool = b->next;
+  }
+  memset(heap->buckets, 0, heap->num_buckets * sizeof(heap_block_t *));
+  memset(b, 0, sizeof(heap_block_t));
+  b->addr = heap->start;
+  b->size = heap->size;
+  heap->free_list = NULL;
+  heap->stats.num_free_blocks = 0;
+  free_list_add(heap, b);
+  heap->stats.used_bytes = 0;
+  heap->stats.free_bytes = heap->size;
+  heap->stats.num_allocs = 0;
+}
+
+void heap_get_stats(heap_t *heap, heap_stats_t *stats)
+{
+  heap_block_t *b;
+  uint32_t largest = 0;
+  for(b = heap->free_list; b != NULL; b = b->free_next) {
+    if(b->size > largest) {
+      largest = b->size;
+    }
+  }
+  heap->stats.largest_free = largest;
+  *stats = heap->stats;
+}
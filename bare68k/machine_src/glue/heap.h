@@ -0,0 +1,49 @@
+/* Heap
+ *
+ * allocate guest memory from a RAM range. all meta data is kept
+ * out of band in host memory so the guest memory stays untouched.
+ *
+ * written by Christian Vogelgsang <chris@vogelgsang.org>
+ * under the GNU Public License V2
+ */
+
+#ifndef _HEAP_H
+#define _HEAP_H
+
+#include <stdint.h>
+
+#define HEAP_FLAG_CLEAR   1   /* fill new memory with zeros */
+
+typedef struct heap_stats
+{
+  uint32_t  total_bytes;
+  uint32_t  used_bytes;
+  uint32_t  free_bytes;
+  uint32_t  peak_used_bytes;
+  uint32_t  largest_free;
+  uint32_t  num_allocs;       /* currently allocated blocks */
+  uint32_t  num_free_blocks;
+  uint32_t  total_allocs;     /* successful allocations since creation */
+  uint32_t  failed_allocs;
+} heap_stats_t;
+
+struct heap;
+typedef struct heap heap_t;
+
+/* create a heap for [start, start+size). granularity is a power of two */
+extern heap_t *heap_create(uint32_t start, uint32_t size, uint32_t granularity);
+extern void heap_destroy(heap_t *heap);
+
+/* return address or 0 if no memory is available. align=0: granularity */
+extern uint32_t heap_alloc(heap_t *heap, uint32_t size, uint32_t align, int flags);
+/* return size of freed block or 0 if address was not allocated */
+extern uint32_t heap_free(heap_t *heap, uint32_t addr);
+/* return new address or 0. on failure the old block stays valid */
+extern uint32_t heap_realloc(heap_t *heap, uint32_t addr, uint32_t size, int flags);
+/* return size of allocated block or 0 */
+extern uint32_t heap_get_size(heap_t *heap, uint32_t addr);
+/* free all blocks */
+extern void heap_clear(heap_t *heap);
+extern void heap_get_stats(heap_t *heap, heap_stats_t *stats);
+
+#endif
@@ -0,0 +1,306 @@
+/* Interrupt Scheduler
+ *
+ * written by Christian Vogelgsang <chris@vogelgsang.org>
+ * under the GNU Public License V2
+ */
+
+#include <string.h>
+
+#include "irq.h"
+#include "m68kcpu.h"
+
+typedef struct {
+  int      level;     /* 0 if entry is free */
+  int      pending;   /* another assertion is scheduled at next */
+  int      asserted;
+  uint32_t vector;
+  uint32_t duration;  /* 0 = deassert on int ack */
+  uint32_t period;    /* 0 = one shot */
+  uint64_t next;
+  uint64_t end;
+  uint64_t assert_cycle;
+} irq_entry_t;
+
+static irq_entry_t entries[IRQ_MAX_ENTRIES];
+static int num_entries;
+static int level_count[8];
+static int manual_level;
+static int cur_level;
+static uint32_t ack_vectors[8];
+static int ack_clear[8];
+
+int irq_scheduler_enabled;
+
+static int calc_level(void)
+{
+  int level;
+  for(level=7;level>manual_level;level--) {
+    if(level_count[level] > 0) {
+      return level;
+    }
+  }
+  return manual_level;
+}
+
+/* sync the irq line of the CPU with our state.
+   in the int ack callback we must not re-enter Musashi's irq check */
+static void update_level(int in_ack)
+{
+  int level = calc_level();
+  if(level != cur_level) {
+    cur_level = level;
+    if(in_ack) {
+      CPU_INT_LEVEL = level << 8;
+    } else {
+      m68k_set_irq(level);
+    }
+  }
+}
+
+static void assert_entry(irq_entry_t *e, uint64_t cycle)
+{
+  if(!e->asserted) {
+    e->asserted = 1;
+    e->assert_cycle = cycle;
+    level_count[e->level]++;
+  }
+  e->end = cycle + e->duration;
+}
+
+static void deassert_entry(irq_entry_t *e)
+{
+  if(e->asserted) {
+    e->asserted = 0;
+    level_count[e->level]--;
+  }
+}
+
+static void free_entry(irq_entry_t *e)
+{
+  deassert_entry(e);
+  e->level = 0;
+  num_entries--;
+  irq_scheduler_enabled = (num_entries > 0);
+}
+
+/* ----- API ----- */
+
+void irq_init(void)
+{
+  int i;
+
+  for(i=0;i<8;i++) {
+    ack_vectors[i] = IRQ_ACK_DYNAMIC;
+    ack_clear[i] = 0;
+  }
+  memset(entries, 0, sizeof(entries));
+  memset(level_count, 0, sizeof(level_count));
+  num_entries = 0;
+  manual_level = 0;
+  cur_level = 0;
+  irq_scheduler_enabled = 0;
+}
+
+void irq_free(void)
+{
+  irq_cancel_all();
+}
+
+int irq_schedule(int level, uint64_t cycle, uint32_t duration,
+                 uint32_t period, uint32_t vector)
+{
+  int i;
+
+  if((level < 1) || (level > 7)) {
+    return IRQ_INVALID;
+  }
+
+  for(i=0;i<IRQ_MAX_ENTRIES;i++) {
+    irq_entry_t *e = &entries[i];
+    if(e->level == 0) {
+      e->level = level;
+      e->pending = 1;
+      e->asserted = 0;
+      e->vector = vector;
+      e->duration = duration;
+      e->period = period;
+      e->next = cycle;
+      e->end = 0;
+      num_entries++;
+      irq_scheduler_enabled = 1;
+      return i;
+    }
+  }
+  return IRQ_INVALID;
+}
+
+int irq_cancel(int id)
+{
+  if((id < 0) || (id >= IRQ_MAX_ENTRIES)) {
+    return IRQ_INVALID;
+  }
+  if(entries[id].level == 0) {
+    return IRQ_INVALID;
+  }
+  free_entry(&entries[id]);
+  update_level(0);
+  return id;
+}
+
+void irq_cancel_all(void)
+{
+  int i;
+  for(i=0;i<IRQ_MAX_ENTRIES;i++) {
+    if(entries[i].level != 0) {
+      free_entry(&entries[i]);
+    }
+  }
+  update_level(0);
+}
+
+int irq_get_num_entries(void)
+{
+  return num_entries;
+}
+
+int irq_is_active(int id)
+{
+  if((id < 0) || (id >= IRQ_MAX_ENTRIES)) {
+    return 0;
+  }
+  return entries[id].level != 0;
+}
+
+void irq_set_manual_level(int level)
+{
+  manual_level = level & 7;
+  cur_level = calc_level();
+  m68k_set_irq(cur_level);
+}
+
+int irq_get_level(void)
+{
+  return cur_level;
+}
+
+int irq_set_ack_vector(int level, uint32_t vector, int auto_clear)
+{
+  if((level < 1) || (level > 7)) {
+    return IRQ_INVALID;
+  }
+  ack_vectors[level] = vector;
+  ack_clear[level] = auto_clear;
+  return level;
+}
+
+uint32_t irq_get_ack_vector(int level)
+{
+  return ack_vectors[level & 7];
+}
+
+int irq_has_dynamic_ack(void)
+{
+  int i;
+  for(i=1;i<8;i++) {
+    if(ack_vectors[i] == IRQ_ACK_DYNAMIC) {
+      return 1;
+    }
+  }
+  return 0;
+}
+
+/* assert and deassert all entries due at the given cycle and return the
+   number of cycles until the next change (at most max_cycles) */
+int irq_update(uint64_t cycle, int max_cycles)
+{
+  uint64_t next_change = cycle + max_cycles;
+  int i;
+
+  for(i=0;i<IRQ_MAX_ENTRIES;i++) {
+    irq_entry_t *e = &entries[i];
+    if(e->level == 0) {
+      continue;
+    }
+
+    /* end of assertion reached? */
+    if(e->asserted && (e->duration > 0) && (e->end <= cycle)) {
+      deassert_entry(e);
+    }
+
+    /* assertion due? */
+    if(e->pending && (e->next <= cycle)) {
+      assert_entry(e, cycle);
+      if(e->period > 0) {
+        while(e->next <= cycle) {
+          e->next += e->period;
+        }
+      } else {
+        e->pending = 0;
+      }
+    }
+
+    /* one shot is done */
+    if(!e->pending && !e->asserted) {
+      free_entry(e);
+      continue;
+    }
+
+    if(e->pending && (e->next < next_change)) {
+      next_change = e->next;
+    }
+    if(e->asserted && (e->duration > 0) && (e->end < next_change)) {
+      next_change = e->end;
+    }
+  }
+
+  update_level(0);
+  return (int)(next_change - cycle);
+}
+
+/* called from int ack: return 1 if the ack was answered natively */
+int irq_ack(int level, uint32_t *vector)
+{
+  irq_entry_t *found = NULL;
+  int i;
+
+  if(level_count[level] > 0) {
+    /* pick the oldest assertion on this level */
+    for(i=0;i<IRQ_MAX_ENTRIES;i++) {
+      irq_entry_t *e = &entries[i];
+      if((e->level == level) && e->asserted) {
+        if((found == NULL) || (e->assert_cycle < found->assert_cycle)) {
+          found = e;
+        }
+      }
+    }
+  }
+
+  /* not scheduled: answer from vector table */
+  if(found == NULL) {
+    uint32_t ack = ack_vectors[level];
+    if(ack == IRQ_ACK_DYNAMIC) {
+      return 0;
+    }
+    *vector = ack;
+    if(ack_clear[level]) {
+      irq_ack_manual();
+    }
+    return 1;
+  }
+
+  *vector = found->vector;
+  if(found->duration == 0) {
+    deassert_entry(found);
+    if(!found->pending) {
+      free_entry(found);
+    }
+    update_level(1);
+  }
+  return 1;
+}
+
+void irq_ack_manual(void)
+{
+  manual_level = 0;
+  update_level(1);
+}
@@ -0,0 +1,41 @@
+/* Interrupt Scheduler
+ *
+ * written by Christian Vogelgsang <chris@vogelgsang.org>
+ * under the GNU Public License V2
+ */
+
+#ifndef _IRQ_H
+#define _IRQ_H
+
+#include <stdint.h>
+
+#define IRQ_MAX_ENTRIES 32
+#define IRQ_INVALID     -1
+
+/* int ack of a level is answered by the int ack function */
+#define IRQ_ACK_DYNAMIC 0xfffffffd
+
+extern void irq_init(void);
+extern void irq_free(void);
+
+extern int irq_schedule(int level, uint64_t cycle, uint32_t duration,
+                        uint32_t period, uint32_t vector);
+extern int irq_cancel(int id);
+extern void irq_cancel_all(void);
+extern int irq_get_num_entries(void);
+extern int irq_is_active(int id);
+
+extern void irq_set_manual_level(int level);
+extern int irq_get_level(void);
+
+extern int irq_set_ack_vector(int level, uint32_t vector, int auto_clear);
+extern uint32_t irq_get_ack_vector(int level);
+extern int irq_has_dynamic_ack(void);
+
+extern int irq_update(uint64_t cycle, int max_cycles);
+extern int irq_ack(int level, uint32_t *vector);
+extern void irq_ack_manual(void);
+
+extern int irq_scheduler_enabled;
+
+#endif
@@ -13,8 +13,11 @@
 
 /* ----- Data ----- */
 
-static page_entry_t *pages;
+/* page directory. unused blocks point to the shared unmapped block */
+static page_entry_t **page_dir;
+static page_entry_t unmapped_pages[MEM_DIR_PAGES];
 static uint total_pages;
+static uint total_dirs;
 static memory_entry_t *first_mem_entry;
 static special_entry_t *first_special_entry;
 static cpu_trace_func_t cpu_trace_func;
@@ -22,11 +25,15 @@ static api_trace_func_t api_trace_func;
 static special_cleanup_func_t special_cleanup_func;
 
 static uint32_t invalid_value = 0xffffffff;
+static int snapshot_active;
 
 static const uint8_t *disasm_buffer;
 static uint32_t disasm_size;
 static uint32_t disasm_offset;
 
+#define PAGE(page_no) \
+  (&page_dir[(page_no) >> MEM_DIR_SHIFT][(page_no) & MEM_DIR_MASK])
+
 /* ----- Event Helper ----- */
 #define memory_access(access, addr, val) \
   cpu_add_event(CPU_EVENT_MEM_ACCESS, addr, val, access, NULL)
@@ -67,8 +74,8 @@ static void wx_empty(page_entry_t *page, uint32_t addr, uint32_t val)
 /* ----- Mirror Range ----- */
 static uint32_t r8_mirror(struct page_entry *page, uint32_t addr)
 {
-  uint32_t mirror_page = page->byte_left;
-  struct page_entry *mirror = &pages[mirror_page];
+  uint32_t mirror_page = page->mirror_page;
+  struct page_entry *mirror = PAGE(mirror_page);
   read_func_t r_func = mirror->r_func[0];
   if(r_func != NULL) {
     return r_func(mirror, addr);
@@ -82,8 +89,8 @@ static uint32_t r8_mirror(struct page_entry *page, uint32_t addr)
 
 static uint32_t r16_mirror(struct page_entry *page, uint32_t addr)
 {
-  uint32_t mirror_page = page->byte_left;
-  struct page_entry *mirror = &pages[mirror_page];
+  uint32_t mirror_page = page->mirror_page;
+  struct page_entry *mirror = PAGE(mirror_page);
   read_func_t r_func = mirror->r_func[1];
   if(r_func != NULL) {
     return r_func(mirror, addr);
@@ -97,8 +104,8 @@ static uint32_t r16_mirror(struct page_entry *page, uint32_t addr)
 
 static uint32_t r32_mirror(struct page_entry *page, uint32_t addr)
 {
-  uint32_t mirror_page = page->byte_left;
-  struct page_entry *mirror = &pages[mirror_page];
+  uint32_t mirror_page = page->mirror_page;
+  struct page_entry *mirror = PAGE(mirror_page);
   read_func_t r_func = mirror->r_func[2];
   if(r_func != NULL) {
     return r_func(mirror, addr);
@@ -112,8 +119,8 @@ static uint32_t r32_mirror(struct page_entry *page, uint32_t addr)
 
 static void w8_mirror(page_entry_t *page, uint32_t addr, uint32_t val)
 {
-  uint32_t mirror_page = page->byte_left;
-  struct page_entry *mirror = &pages[mirror_page];
+  uint32_t mirror_page = page->mirror_page;
+  struct page_entry *mirror = PAGE(mirror_page);
   write_func_t w_func = mirror->w_func[0];
   if(w_func != NULL) {
     w_func(mirror, addr, val);
@@ -125,8 +132,8 @@ static void w8_mirror(page_entry_t *page, uint32_t addr, uint32_t val)
 
 static void w16_mirror(page_entry_t *page, uint32_t addr, uint32_t val)
 {
-  uint32_t mirror_page = page->byte_left;
-  struct page_entry *mirror = &pages[mirror_page];
+  uint32_t mirror_page = page->mirror_page;
+  struct page_entry *mirror = PAGE(mirror_page);
   write_func_t w_func = mirror->w_func[1];
   if(w_func != NULL) {
     w_func(mirror, addr, val);
@@ -138,8 +145,8 @@ static void w16_mirror(page_entry_t *page, uint32_t addr, uint32_t val)
 
 static void w32_mirror(page_entry_t *page, uint32_t addr, uint32_t val)
 {
-  uint32_t mirror_page = page->byte_left;
-  struct page_entry *mirror = &pages[mirror_page];
+  uint32_t mirror_page = page->mirror_page;
+  struct page_entry *mirror = PAGE(mirror_page);
   write_func_t w_func = mirror->w_func[2];
   if(w_func != NULL) {
     w_func(mirror, addr, val);
@@ -149,6 +156,92 @@ static void w32_mirror(page_entry_t *page, uint32_t addr, uint32_t val)
   }
 }
 
+/* ----- Split Page ----- */
+#define SUB_PAGE(page, addr) \
+  (&(page)->sub_pages[((addr) >> MEM_SUB_PAGE_SHIFT) & (MEM_SUB_PAGES - 1)])
+
+static uint32_t r8_sub(struct page_entry *page, uint32_t addr)
+{
+  struct page_entry *sub = SUB_PAGE(page, addr);
+  read_func_t r_func = sub->r_func[0];
+  if(r_func != NULL) {
+    return r_func(sub, addr);
+  } else {
+    int access = MEM_ACCESS_R8 | cpu_current_fc;
+    int value = invalid_value & 0xff;
+    memory_access(access, addr, value);
+    return value;
+  }
+}
+
+static uint32_t r16_sub(struct page_entry *page, uint32_t addr)
+{
+  struct page_entry *sub = SUB_PAGE(page, addr);
+  read_func_t r_func = sub->r_func[1];
+  if(r_func != NULL) {
+    return r_func(sub, addr);
+  } else {
+    int access = MEM_ACCESS_R16 | cpu_current_fc;
+    int value = invalid_value & 0xffff;
+    memory_access(access, addr, value);
+    return value;
+  }
+}
+
+static uint32_t r32_sub(struct page_entry *page, uint32_t addr)
+{
+  struct page_entry *sub = SUB_PAGE(page, addr);
+  read_func_t r_func = sub->r_func[2];
+  if(r_func != NULL) {
+    return r_func(sub, addr);
+  } else {
+    int access = MEM_ACCESS_R32 | cpu_current_fc;
+    int value = invalid_value;
+    memory_access(access, addr, value);
+    return value;
+  }
+}
+
+static void w8_sub(page_entry_t *page, uint32_t addr, uint32_t val)
+{
+  struct page_entry *sub = SUB_PAGE(page, addr);
+  write_func_t w_func = sub->w_func[0];
+  if(w_func != NULL) {
+    w_func(sub, addr, val);
+  } else {
+    int access = MEM_ACCESS_W8 | cpu_current_fc;
+    memory_access(access, addr, val);
+  }
+}
+
+static void w16_sub(page_entry_t *page, uint32_t addr, uint32_t val)
+{
+  struct page_entry *sub = SUB_PAGE(page, addr);
+  write_func_t w_func = sub->w_func[1];
+  if(w_func != NULL) {
+    w_func(sub, addr, val);
+  } else {
+    int access = MEM_ACCESS_W16 | cpu_current_fc;
+    memory_access(access, addr, val);
+  }
+}
+
+static void w32_sub(page_entry_t *page, uint32_t addr, uint32_t val)
+{
+  struct page_entry *sub = SUB_PAGE(page, addr);
+  write_func_t w_func = sub->w_func[2];
+  if(w_func != NULL) {
+    w_func(sub, addr, val);
+  } else {
+    int access = MEM_ACCESS_W32 | cpu_current_fc;
+    memory_access(access, addr, val);
+  }
+}
+
+/* count CPU writes and special reads: if it does not change then the
+   CPU can not have altered (or seen a change of) its environment */
+uint32_t mem_cpu_changes;
+
 /* ----- Special Access ----- */
 static uint32_t r8_special(struct page_entry *page, uint32_t addr)
 {
@@ -156,6 +249,7 @@ static uint32_t r8_special(struct page_entry *page, uint32_t addr)
   void *out_data = NULL;
   special_entry_t *se = page->special_entry;
   int access = MEM_ACCESS_R8 | cpu_current_fc;
+  mem_cpu_changes++;
   int res = se->r_func(access, addr, &result, se->r_data, &out_data);
   if(res == CPU_CB_EVENT) {
     cpu_add_event(CPU_EVENT_MEM_SPECIAL, addr, result, access, out_data);
@@ -172,6 +266,7 @@ static uint32_t r16_special(struct page_entry *page, uint32_t addr)
   void *out_data = NULL;
   special_entry_t *se = page->special_entry;
   int access = MEM_ACCESS_R16 | cpu_current_fc;
+  mem_cpu_changes++;
   int res = se->r_func(access, addr, &result, se->r_data, &out_data);
   if(res == CPU_CB_EVENT) {
     cpu_add_event(CPU_EVENT_MEM_SPECIAL, addr, result, access, out_data);
@@ -188,6 +283,7 @@ static uint32_t r32_special(struct page_entry *page, uint32_t addr)
   void *out_data = NULL;
   special_entry_t *se = page->special_entry;
   int access = MEM_ACCESS_R32 | cpu_current_fc;
+  mem_cpu_changes++;
   int res = se->r_func(access, addr, &result, se->r_data, &out_data);
   if(res == CPU_CB_EVENT) {
     cpu_add_event(CPU_EVENT_MEM_SPECIAL, addr, result, access, out_data);
@@ -269,11 +365,29 @@ static uint32_t r32_mem(page_entry_t *page, uint32_t addr)
 }
 
 /* Write */
+/* flag the sub pages of a memory entry touched by a write */
+static void snapshot_mark(page_entry_t *page, uint32_t off, uint32_t size)
+{
+  memory_entry_t *me = page->memory_entry;
+  if((me != NULL) && (me->dirty != NULL)) {
+    uint32_t pos = (uint32_t)(page->data - me->data) + off;
+    uint32_t sub = pos >> MEM_SUB_PAGE_SHIFT;
+    uint32_t last = (pos + size - 1) >> MEM_SUB_PAGE_SHIFT;
+    for(;sub<=last;sub++) {
+      me->dirty[sub] = 1;
+    }
+  }
+}
+
+#define SNAPSHOT_MARK(page, off, size) \
+  if(snapshot_active) { snapshot_mark(page, off, size); }
+
 static void w8_mem(page_entry_t *page, uint32_t addr, uint32_t val)
 {
   uint8_t *data = page->data;
   uint32_t off = addr & MEM_PAGE_MASK;
 
+  SNAPSHOT_MARK(page, off, 1)
   data[off] = val;
 }
 
@@ -282,6 +396,7 @@ static void w16_mem(page_entry_t *page, uint32_t addr, uint32_t val)
   uint8_t *data = page->data;
   uint32_t off = addr & MEM_PAGE_MASK;
 
+  SNAPSHOT_MARK(page, off, 2)
   data[off] = val >> 8;
   data[off+1] = val & 0xff;
 }
@@ -291,6 +406,7 @@ static void w32_mem(page_entry_t *page, uint32_t addr, uint32_t val)
   uint8_t *data = page->data;
   uint32_t off = addr & MEM_PAGE_MASK;
 
+  SNAPSHOT_MARK(page, off, 4)
   data[off]   = val >> 24;
   data[off+1] = (val >> 16) & 0xff;
   data[off+2] = (val >> 8) & 0xff;
@@ -313,9 +429,9 @@ static void w32_mem(page_entry_t *page, uint32_t addr, uint32_t val)
     } \
   }
 
-#define WATCHPOINT_CHECK() \
+#define WATCHPOINT_CHECK(the_value) \
   if(tools_watchpoints_enabled) { \
-    int id = tools_check_watchpoint(address, access); \
+    int id = tools_check_watchpoint(address, access, the_value); \
     if(id != NO_POINT) { \
       void *data = tools_get_watchpoint_data(id); \
       watchpoint_event(access, address, id, data); \
@@ -333,7 +449,7 @@ uint m68k_read_memory_8(uint address)
     result = invalid_value & 0xff;
     memory_bounds(access, address, result);
   } else {
-    page_entry_t *page = &pages[page_no];
+    page_entry_t *page = PAGE(page_no);
     read_func_t rf = page->r_func[0];
     if(rf == NULL) {
       result = invalid_value & 0xff;
@@ -343,7 +459,7 @@ uint m68k_read_memory_8(uint address)
     }
   }
   TRACE_FUNC(result)
-  WATCHPOINT_CHECK()
+  WATCHPOINT_CHECK(result)
   return result;
 }
 
@@ -356,7 +472,7 @@ uint m68k_read_memory_16(uint address)
     result = invalid_value & 0xffff;
     memory_bounds(access, address, result);
   } else {
-    page_entry_t *page = &pages[page_no];
+    page_entry_t *page = PAGE(page_no);
     read_func_t rf = page->r_func[1];
     if(rf == NULL) {
       result = invalid_value & 0xffff;
@@ -366,7 +482,7 @@ uint m68k_read_memory_16(uint address)
     }
   }
   TRACE_FUNC(result)
-  WATCHPOINT_CHECK()
+  WATCHPOINT_CHECK(result)
   return result;
 }
 
@@ -379,7 +495,7 @@ uint m68k_read_memory_32(uint address)
     result = invalid_value;
     memory_bounds(access, address, result);
   } else {
-    page_entry_t *page = &pages[page_no];
+    page_entry_t *page = PAGE(page_no);
     read_func_t rf = page->r_func[2];
     if(rf == NULL) {
       result = invalid_value;
@@ -389,7 +505,7 @@ uint m68k_read_memory_32(uint address)
     }
   }
   TRACE_FUNC(result)
-  WATCHPOINT_CHECK()
+  WATCHPOINT_CHECK(result)
   return result;
 }
 
@@ -402,7 +518,7 @@ void m68k_write_memory_8(uint address, uint value)
   if(page_no >= total_pages) {
     memory_bounds(access, address, value);
   } else {
-    page_entry_t *page = &pages[page_no];
+    page_entry_t *page = PAGE(page_no);
     write_func_t wf = page->w_func[0];
     if(wf == NULL) {
       memory_access(access, address, value);
@@ -410,8 +526,9 @@ void m68k_write_memory_8(uint address, uint value)
       wf(page, address, value);
     }
   }
+  mem_cpu_changes++;
   TRACE_FUNC(value)
-  WATCHPOINT_CHECK()
+  WATCHPOINT_CHECK(value)
 }
 
 void m68k_write_memory_16(uint address, uint value)
@@ -421,7 +538,7 @@ void m68k_write_memory_16(uint address, uint value)
   if(page_no >= total_pages) {
     memory_bounds(access, address, value);
   } else {
-    page_entry_t *page = &pages[page_no];
+    page_entry_t *page = PAGE(page_no);
     write_func_t wf = page->w_func[1];
     if(wf == NULL) {
       memory_access(access, address, value);
@@ -429,8 +546,9 @@ void m68k_write_memory_16(uint address, uint value)
       wf(page, address, value);
     }
   }
+  mem_cpu_changes++;
   TRACE_FUNC(value)
-  WATCHPOINT_CHECK()
+  WATCHPOINT_CHECK(value)
 }
 
 void m68k_write_memory_32(uint address, uint value)
@@ -440,7 +558,7 @@ void m68k_write_memory_32(uint address, uint value)
   if(page_no >= total_pages) {
     memory_bounds(access, address, value);
   } else {
-    page_entry_t *page = &pages[page_no];
+    page_entry_t *page = PAGE(page_no);
     write_func_t wf = page->w_func[2];
     if(wf == NULL) {
       memory_access(access, address, value);
@@ -448,8 +566,9 @@ void m68k_write_memory_32(uint address, uint value)
       wf(page, address, value);
     }
   }
+  mem_cpu_changes++;
   TRACE_FUNC(value)
-  WATCHPOINT_CHECK()
+  WATCHPOINT_CHECK(value)
 }
 
 /* Disassemble */
@@ -503,16 +622,351 @@ void mem_disasm_memory(void)
 
 /* ---------- API ---------- */
 
+/* return the page entry or sub page entry that serves the address */
+static page_entry_t *get_page(uint32_t address)
+{
+  page_entry_t *page;
+  uint page_no = address >> MEM_PAGE_SHIFT;
+  if(page_no >= total_pages) {
+    return NULL;
+  }
+  page = PAGE(page_no);
+  if(page->sub_pages != NULL) {
+    page = SUB_PAGE(page, address);
+  }
+  return page;
+}
+
+/* return a page entry for setup. allocates its block if necessary */
+static page_entry_t *setup_page(uint page_no)
+{
+  uint dir = page_no >> MEM_DIR_SHIFT;
+  page_entry_t *block = page_dir[dir];
+  if(block == unmapped_pages) {
+    size_t bytes = sizeof(page_entry_t) * MEM_DIR_PAGES;
+    block = (page_entry_t *)malloc(bytes);
+    if(block == NULL) {
+      return NULL;
+    }
+    memset(block, 0, bytes);
+    page_dir[dir] = block;
+  }
+  return &block[page_no & MEM_DIR_MASK];
+}
+
+/* make sure all blocks of a page range are allocated */
+static int setup_page_range(uint start_page, uint num_pages)
+{
+  uint page_no = start_page;
+  uint end_page = start_page + num_pages;
+  while(page_no < end_page) {
+    if(setup_page(page_no) == NULL) {
+      return 0;
+    }
+    page_no = (page_no | MEM_DIR_MASK) + 1;
+  }
+  return 1;
+}
+
+static void free_sub_pages(page_entry_t *page)
+{
+  if(page->sub_pages != NULL) {
+    free(page->sub_pages);
+    page->sub_pages = NULL;
+  }
+}
+
+static void setup_mirror_funcs(page_entry_t *page, int flags)
+{
+  /* setup read pointers */
+  if((flags & MEM_FLAGS_READ) == MEM_FLAGS_READ) {
+    page->r_func[0] = r8_mirror;
+    page->r_func[1] = r16_mirror;
+    page->r_func[2] = r32_mirror;
+  } else {
+    page->r_func[0] = NULL;
+    page->r_func[1] = NULL;
+    page->r_func[2] = NULL;
+  }
+
+  /* setup write pointers */
+  if((flags & MEM_FLAGS_WRITE) == MEM_FLAGS_WRITE) {
+    page->w_func[0] = w8_mirror;
+    page->w_func[1] = w16_mirror;
+    page->w_func[2] = w32_mirror;
+  } else {
+    page->w_func[0] = NULL;
+    page->w_func[1] = NULL;
+    page->w_func[2] = NULL;
+  }
+}
+
+/* turn a uniform page into a split page with identical sub pages */
+static int split_page(page_entry_t *page)
+{
+  page_entry_t *sub;
+  int i;
+
+  if(page->sub_pages != NULL) {
+    return 1;
+  }
+  sub = (page_entry_t *)malloc(sizeof(page_entry_t) * MEM_SUB_PAGES);
+  if(sub == NULL) {
+    return 0;
+  }
+  for(i=0;i<MEM_SUB_PAGES;i++) {
+    sub[i] = *page;
+  }
+  /* sub pages of a mirror always access the base page */
+  if((page->mirror_flags & MEM_FLAGS_MIRROR) == MEM_FLAGS_MIRROR) {
+    for(i=0;i<MEM_SUB_PAGES;i++) {
+      setup_mirror_funcs(&sub[i], page->mirror_flags);
+      sub[i].data = NULL;
+      sub[i].memory_entry = NULL;
+      sub[i].mirror_flags = 0;
+    }
+  }
+
+  page->r_func[0] = r8_sub;
+  page->r_func[1] = r16_sub;
+  page->r_func[2] = r32_sub;
+  page->w_func[0] = w8_sub;
+  page->w_func[1] = w16_sub;
+  page->w_func[2] = w32_sub;
+  page->data = NULL;
+  page->byte_left = 0;
+  page->memory_entry = NULL;
+  page->special_entry = NULL;
+  page->mirror_flags = 0;
+  page->sub_pages = sub;
+  return 1;
+}
+
+/* split all pages touched by a sub page range that are not fully covered */
+static int split_sub_range(uint start_sub, uint num_subs)
+{
+  uint sub = start_sub;
+  uint end_sub = start_sub + num_subs;
+  while(sub < end_sub) {
+    uint page_no = sub / MEM_SUB_PAGES;
+    uint page_end = (page_no + 1) * MEM_SUB_PAGES;
+    page_entry_t *page = setup_page(page_no);
+    if(page == NULL) {
+      return 0;
+    }
+    if(((sub % MEM_SUB_PAGES) != 0) || (page_end > end_sub)) {
+      if(!split_page(page)) {
+        return 0;
+      }
+    }
+    sub = page_end;
+  }
+  return 1;
+}
+
+/* return the entry to setup for a sub page. whole pages are returned if
+   the range covers them completely to keep the fast path */
+static page_entry_t *get_sub_setup(uint sub, uint end_sub, uint *step)
+{
+  page_entry_t *page = PAGE(sub / MEM_SUB_PAGES);
+  if(((sub % MEM_SUB_PAGES) == 0) && ((sub + MEM_SUB_PAGES) <= end_sub)) {
+    free_sub_pages(page);
+    *step = MEM_SUB_PAGES;
+    return page;
+  } else {
+    *step = 1;
+    return &page->sub_pages[sub % MEM_SUB_PAGES];
+  }
+}
+
+/* recalc the remaining bytes of all memory pages. a memory run ends where
+   another kind of page or non-contiguous memory starts */
+static void update_memory_runs(void)
+{
+  memory_entry_t *last_me = NULL;
+  uint8_t *last_data = NULL;
+  uint32_t run = 0;
+  int p, s;
+
+  for(p=total_pages-1;p>=0;p--) {
+    page_entry_t *page;
+    /* skip unmapped blocks */
+    if(page_dir[p >> MEM_DIR_SHIFT] == unmapped_pages) {
+      last_me = NULL;
+      run = 0;
+      p &= ~MEM_DIR_MASK;
+      continue;
+    }
+    page = PAGE(p);
+    if(page->sub_pages != NULL) {
+      for(s=MEM_SUB_PAGES-1;s>=0;s--) {
+        page_entry_t *sub = &page->sub_pages[s];
+        memory_entry_t *me = sub->memory_entry;
+        if(me == NULL) {
+          run = 0;
+        } else {
+          uint8_t *data = sub->data + s * MEM_SUB_PAGE_SIZE;
+          if((me == last_me) && ((data + MEM_SUB_PAGE_SIZE) == last_data)) {
+            run += MEM_SUB_PAGE_SIZE;
+          } else {
+            run = MEM_SUB_PAGE_SIZE;
+          }
+          /* byte_left is always relative to the page start */
+          sub->byte_left = run + s * MEM_SUB_PAGE_SIZE;
+          last_data = data;
+        }
+        last_me = me;
+      }
+    } else {
+      memory_entry_t *me = page->memory_entry;
+      if(me == NULL) {
+        run = 0;
+      } else {
+        if((me == last_me) && ((page->data + MEM_PAGE_SIZE) == last_data)) {
+          run += MEM_PAGE_SIZE;
+        } else {
+          run = MEM_PAGE_SIZE;
+        }
+        page->byte_left = run;
+        last_data = page->data;
+      }
+      last_me = me;
+    }
+  }
+}
+
+/* a mirror of a memory, empty or unmapped page directly aliases the base
+   page. only mirrors of special, split or mirror pages use the indirect
+   access via the base page */
+static void resolve_mirror_page(page_entry_t *page)
+{
+  page_entry_t *base = PAGE(page->mirror_page);
+  int flags = page->mirror_flags;
+  int i;
+
+  if((base->special_entry != NULL) || (base->sub_pages != NULL) ||
+     ((base->mirror_flags & MEM_FLAGS_MIRROR) == MEM_FLAGS_MIRROR)) {
+    setup_mirror_funcs(page, flags);
+    page->data = NULL;
+    page->byte_left = 0;
+    page->memory_entry = NULL;
+  } else {
+    for(i=0;i<3;i++) {
+      if((flags & MEM_FLAGS_READ) == MEM_FLAGS_READ) {
+        page->r_func[i] = base->r_func[i];
+      } else {
+        page->r_func[i] = NULL;
+      }
+      if((flags & MEM_FLAGS_WRITE) == MEM_FLAGS_WRITE) {
+        page->w_func[i] = base->w_func[i];
+      } else {
+        page->w_func[i] = NULL;
+      }
+    }
+    page->data = base->data;
+    page->byte_left = base->byte_left;
+    page->memory_entry = base->memory_entry;
+  }
+  page->special_entry = NULL;
+}
+
+/* bring all pages up to date after the layout changed. mirrors are
+   resolved again as their base may have changed */
+static void update_pages(void)
+{
+  uint d, i;
+  for(d=0;d<total_dirs;d++) {
+    page_entry_t *block = page_dir[d];
+    if(block == unmapped_pages) {
+      continue;
+    }
+    for(i=0;i<MEM_DIR_PAGES;i++) {
+      page_entry_t *page = &block[i];
+      if((page->mirror_flags & MEM_FLAGS_MIRROR) == MEM_FLAGS_MIRROR) {
+        resolve_mirror_page(page);
+      }
+    }
+  }
+  update_memory_runs();
+}
+
+static void setup_special_page(page_entry_t *page, special_entry_t *se)
+{
+  /* setup read pointers */
+  if(se->r_func != NULL) {
+    page->r_func[0] = r8_special;
+    page->r_func[1] = r16_special;
+    page->r_func[2] = r32_special;
+  } else {
+    page->r_func[0] = NULL;
+    page->r_func[1] = NULL;
+    page->r_func[2] = NULL;
+  }
+
+  /* setup write pointers */
+  if(se->w_func != NULL) {
+    page->w_func[0] = w8_special;
+    page->w_func[1] = w16_special;
+    page->w_func[2] = w32_special;
+  } else {
+    page->w_func[0] = NULL;
+    page->w_func[1] = NULL;
+    page->w_func[2] = NULL;
+  }
+
+  page->data = NULL;
+  page->byte_left = 0;
+  page->memory_entry = NULL;
+  page->special_entry = se;
+  page->mirror_flags = 0;
+}
+
+static void setup_empty_page(page_entry_t *page, int flags, uint32_t value)
+{
+  /* setup read pointers */
+  if((flags & MEM_FLAGS_READ) == MEM_FLAGS_READ) {
+    page->r_func[0] = r8_empty;
+    page->r_func[1] = r16_empty;
+    page->r_func[2] = r32_empty;
+  } else {
+    page->r_func[0] = NULL;
+    page->r_func[1] = NULL;
+    page->r_func[2] = NULL;
+  }
+
+  /* setup write pointers */
+  if((flags & MEM_FLAGS_WRITE) == MEM_FLAGS_WRITE) {
+    page->w_func[0] = wx_empty;
+    page->w_func[1] = wx_empty;
+    page->w_func[2] = wx_empty;
+  } else {
+    page->w_func[0] = NULL;
+    page->w_func[1] = NULL;
+    page->w_func[2] = NULL;
+  }
+
+  page->data = NULL;
+  page->byte_left = value;
+  page->memory_entry = NULL;
+  page->special_entry = NULL;
+  page->mirror_flags = 0;
+}
+
 int mem_init(uint num_pages)
 {
-  /* allocate page entries */
-  size_t bytes = sizeof(page_entry_t) * num_pages;
-  pages = (page_entry_t *)malloc(bytes);
-  if(pages == NULL) {
+  /* allocate page directory. all blocks are unmapped */
+  uint i;
+  uint num_dirs = (num_pages + MEM_DIR_MASK) >> MEM_DIR_SHIFT;
+  size_t bytes = sizeof(page_entry_t *) * num_dirs;
+  page_dir = (page_entry_t **)malloc(bytes);
+  if(page_dir == NULL) {
     return 0;
   }
+  for(i=0;i<num_dirs;i++) {
+    page_dir[i] = unmapped_pages;
+  }
   total_pages = num_pages;
-  memset(pages, 0, bytes);
+  total_dirs = num_dirs;
 
   mem_set_invalid_value(0xffffffff);
   return 1;
@@ -523,13 +977,26 @@ void mem_free(void)
   memory_entry_t *me;
   special_entry_t *se;
 
-  /* free pages */
-  if(pages != NULL) {
-    free(pages);
+  /* free page blocks */
+  if(page_dir != NULL) {
+    uint i, j;
+    for(i=0;i<total_dirs;i++) {
+      page_entry_t *block = page_dir[i];
+      if(block != unmapped_pages) {
+        for(j=0;j<MEM_DIR_PAGES;j++) {
+          free_sub_pages(&block[j]);
+        }
+        free(block);
+      }
+    }
+    free(page_dir);
+    page_dir = NULL;
   }
   total_pages = 0;
+  total_dirs = 0;
 
   /* free memory entries and associated memory */
+  mem_snapshot_free();
   me = first_mem_entry;
   while(me != NULL) {
     memory_entry_t *next = me->next;
@@ -561,11 +1028,28 @@ uint mem_get_num_pages(void)
   return total_pages;
 }
 
+uint mem_get_num_page_blocks(void)
+{
+  uint i;
+  uint num = 0;
+  for(i=0;i<total_dirs;i++) {
+    if(page_dir[i] != unmapped_pages) {
+      num++;
+    }
+  }
+  return num;
+}
+
 uint mem_get_page_shift(void)
 {
   return MEM_PAGE_SHIFT;
 }
 
+uint mem_get_sub_page_shift(void)
+{
+  return MEM_SUB_PAGE_SHIFT;
+}
+
 void mem_set_invalid_value(uint32_t val)
 {
   invalid_value = val;
@@ -580,7 +1064,7 @@ memory_entry_t *mem_add_memory(uint start_page, uint num_pages, int flags)
   page_entry_t *page;
   uint32_t offset;
   uint32_t remain;
-  int i;
+  uint32_t i;
 
   /* check parameters */
   if((start_page + num_pages) > total_pages) {
@@ -589,6 +1073,9 @@ memory_entry_t *mem_add_memory(uint start_page, uint num_pages, int flags)
   if(num_pages == 0) {
     return NULL;
   }
+  if(!setup_page_range(start_page, num_pages)) {
+    return NULL;
+  }
 
   /* alloc memory */
   byte_size = num_pages * MEM_PAGE_SIZE;
@@ -621,10 +1108,12 @@ memory_entry_t *mem_add_memory(uint start_page, uint num_pages, int flags)
   me->flags = flags;
 
   /* fill in page entries */
-  page = &pages[start_page];
   offset = 0;
   remain = byte_size;
   for(i=0;i<num_pages;i++) {
+    page = PAGE(start_page + i);
+    free_sub_pages(page);
+
     /* setup read pointers */
     if((flags & MEM_FLAGS_READ) == MEM_FLAGS_READ) {
       page->r_func[0] = r8_mem;
@@ -649,14 +1138,14 @@ memory_entry_t *mem_add_memory(uint start_page, uint num_pages, int flags)
 
     page->memory_entry = me;
     page->special_entry = NULL;
+    page->mirror_flags = 0;
     page->data = &data[offset];
     page->byte_left = remain;
     offset += MEM_PAGE_SIZE;
     remain -= MEM_PAGE_SIZE;
-
-    page++;
   }
 
+  update_pages();
   return me;
 }
 
@@ -672,7 +1161,7 @@ special_entry_t *mem_add_special(uint start_page, uint num_pages,
   size_t se_size;
   special_entry_t *se;
   page_entry_t *page;
-  int i;
+  uint32_t i;
 
   /* check parameters */
   if((start_page + num_pages) > total_pages) {
@@ -681,6 +1170,9 @@ special_entry_t *mem_add_special(uint start_page, uint num_pages,
   if(num_pages == 0) {
     return NULL;
   }
+  if(!setup_page_range(start_page, num_pages)) {
+    return NULL;
+  }
 
   /* first alloc special entry */
   se_size = sizeof(special_entry_t);
@@ -701,43 +1193,19 @@ special_entry_t *mem_add_special(uint start_page, uint num_pages,
   se->w_data = write_data;
 
   /* setup pages */
-  page = &pages[start_page];
   for(i=0;i<num_pages;i++) {
-    /* setup read pointers */
-    if(read_func != NULL) {
-      page->r_func[0] = r8_special;
-      page->r_func[1] = r16_special;
-      page->r_func[2] = r32_special;
-    } else {
-      page->r_func[0] = NULL;
-      page->r_func[1] = NULL;
-      page->r_func[2] = NULL;
-    }
-
-    /* setup write pointers */
-    if(write_func != NULL) {
-      page->w_func[0] = w8_special;
-      page->w_func[1] = w16_special;
-      page->w_func[2] = w32_special;
-    } else {
-      page->w_func[0] = NULL;
-      page->w_func[1] = NULL;
-      page->w_func[2] = NULL;
-    }
-
-    page->data = NULL;
-    page->byte_left = 0;
-    page->memory_entry = NULL;
-    page->special_entry = se;
-    page++;
+    page = PAGE(start_page + i);
+    free_sub_pages(page);
+    setup_special_page(page, se);
   }
+  update_pages();
   return se;
 }
 
 int mem_add_empty(uint start_page, uint num_pages, int flags, uint32_t value)
 {
   page_entry_t *page;
-  int i;
+  uint32_t i;
 
   /* check parameters */
   if((start_page + num_pages) > total_pages) {
@@ -746,45 +1214,24 @@ int mem_add_empty(uint start_page, uint num_pages, int flags, uint32_t value)
   if(num_pages == 0) {
     return 0;
   }
+  if(!setup_page_range(start_page, num_pages)) {
+    return 0;
+  }
 
   /* setup pages */
-  page = &pages[start_page];
   for(i=0;i<num_pages;i++) {
-    /* setup read pointers */
-    if((flags & MEM_FLAGS_READ) == MEM_FLAGS_READ) {
-      page->r_func[0] = r8_empty;
-      page->r_func[1] = r16_empty;
-      page->r_func[2] = r32_empty;
-    } else {
-      page->r_func[0] = NULL;
-      page->r_func[1] = NULL;
-      page->r_func[2] = NULL;
-    }
-
-    /* setup write pointers */
-    if((flags & MEM_FLAGS_WRITE) == MEM_FLAGS_WRITE) {
-      page->w_func[0] = wx_empty;
-      page->w_func[1] = wx_empty;
-      page->w_func[2] = wx_empty;
-    } else {
-      page->w_func[0] = NULL;
-      page->w_func[1] = NULL;
-      page->w_func[2] = NULL;
-    }
-
-    page->data = NULL;
-    page->byte_left = value;
-    page->memory_entry = NULL;
-    page->special_entry = NULL;
-    page++;
+    page = PAGE(start_page + i);
+    free_sub_pages(page);
+    setup_empty_page(page, flags, value);
   }
+  update_pages();
   return 1;
 }
 
 int mem_add_mirror(uint start_page, uint num_pages, int flags, uint base_page)
 {
   page_entry_t *page;
-  int i;
+  uint32_t i;
 
   /* check parameters */
   if((start_page + num_pages) > total_pages) {
@@ -799,41 +1246,105 @@ int mem_add_mirror(uint start_page, uint num_pages, int flags, uint base_page)
   if(start_page == base_page) {
     return 0;
   }
+  if(!setup_page_range(start_page, num_pages)) {
+    return 0;
+  }
 
   /* setup pages */
-  page = &pages[start_page];
   for(i=0;i<num_pages;i++) {
-    /* setup read pointers */
-    if((flags & MEM_FLAGS_READ) == MEM_FLAGS_READ) {
-      page->r_func[0] = r8_mirror;
-      page->r_func[1] = r16_mirror;
-      page->r_func[2] = r32_mirror;
-    } else {
-      page->r_func[0] = NULL;
-      page->r_func[1] = NULL;
-      page->r_func[2] = NULL;
-    }
+    page = PAGE(start_page + i);
+    free_sub_pages(page);
+    page->mirror_page = base_page + i;
+    page->mirror_flags = flags | MEM_FLAGS_MIRROR;
+  }
+  update_pages();
+  return 1;
+}
 
-    /* setup write pointers */
-    if((flags & MEM_FLAGS_WRITE) == MEM_FLAGS_WRITE) {
-      page->w_func[0] = w8_mirror;
-      page->w_func[1] = w16_mirror;
-      page->w_func[2] = w32_mirror;
-    } else {
-      page->w_func[0] = NULL;
-      page->w_func[1] = NULL;
-      page->w_func[2] = NULL;
-    }
+special_entry_t *mem_add_special_sub(uint start_sub, uint num_subs,
+                    special_read_func_t read_func, void *read_data,
+                    special_write_func_t write_func, void *write_data)
+{
+  size_t se_size;
+  special_entry_t *se;
+  uint sub, end_sub, step;
 
-    page->data = NULL;
-    page->byte_left = base_page + i;
-    page->memory_entry = NULL;
-    page->special_entry = NULL;
-    page++;
+  /* check parameters */
+  end_sub = start_sub + num_subs;
+  if(end_sub > (total_pages * MEM_SUB_PAGES)) {
+    return NULL;
+  }
+  if(num_subs == 0) {
+    return NULL;
+  }
+  if(!split_sub_range(start_sub, num_subs)) {
+    return NULL;
+  }
+
+  /* first alloc special entry */
+  se_size = sizeof(special_entry_t);
+  se = (special_entry_t *)malloc(se_size);
+  if(se == NULL) {
+    return NULL;
+  }
+  memset(se, 0, se_size);
+
+  /* link to mem list */
+  se->next = first_special_entry;
+  first_special_entry = se;
+
+  /* fill special entry */
+  se->r_func = read_func;
+  se->r_data = read_data;
+  se->w_func = write_func;
+  se->w_data = write_data;
+
+  /* setup sub pages */
+  sub = start_sub;
+  while(sub < end_sub) {
+    page_entry_t *page = get_sub_setup(sub, end_sub, &step);
+    setup_special_page(page, se);
+    sub += step;
+  }
+  update_pages();
+  return se;
+}
+
+int mem_add_empty_sub(uint start_sub, uint num_subs, int flags, uint32_t value)
+{
+  uint sub, end_sub, step;
+
+  /* check parameters */
+  end_sub = start_sub + num_subs;
+  if(end_sub > (total_pages * MEM_SUB_PAGES)) {
+    return 0;
+  }
+  if(num_subs == 0) {
+    return 0;
+  }
+  if(!split_sub_range(start_sub, num_subs)) {
+    return 0;
+  }
+
+  /* setup sub pages */
+  sub = start_sub;
+  while(sub < end_sub) {
+    page_entry_t *page = get_sub_setup(sub, end_sub, &step);
+    setup_empty_page(page, flags, value);
+    sub += step;
   }
+  update_pages();
   return 1;
 }
 
+int mem_is_split_page(uint page_no)
+{
+  if(page_no >= total_pages) {
+    return 0;
+  }
+  return PAGE(page_no)->sub_pages != NULL;
+}
+
 void mem_set_cpu_trace_func(cpu_trace_func_t func)
 {
   cpu_trace_func = func;
@@ -844,13 +1355,25 @@ void mem_set_api_trace_func(api_trace_func_t func)
   api_trace_func = func;
 }
 
+/* return true if cpu memory access may call external functions */
+int mem_has_callbacks(void)
+{
+  if((cpu_trace_func != NULL) && (cpu_trace_func != mem_default_cpu_trace_func)) {
+    return 1;
+  }
+  /* the disassembler of the instr hook reads with the api functions */
+  if((api_trace_func != NULL) && (api_trace_func != mem_default_api_trace_func)) {
+    return 1;
+  }
+  return first_special_entry != NULL;
+}
+
 uint8_t *mem_get_range(uint32_t address, uint32_t size)
 {
-  uint page_no = address >> MEM_PAGE_SHIFT;
-  if(page_no >= total_pages) {
+  page_entry_t *page = get_page(address);
+  if(page == NULL) {
     return NULL;
   } else {
-    page_entry_t *page = &pages[page_no];
     if(page->memory_entry != NULL) {
       /* check size */
       uint32_t offset = address & MEM_PAGE_MASK;
@@ -868,11 +1391,10 @@ uint8_t *mem_get_range(uint32_t address, uint32_t size)
 
 uint8_t *mem_get_max_range(uint32_t address, uint32_t *size)
 {
-  uint page_no = address >> MEM_PAGE_SHIFT;
-  if(page_no >= total_pages) {
+  page_entry_t *page = get_page(address);
+  if(page == NULL) {
     return NULL;
   } else {
-    page_entry_t *page = &pages[page_no];
     if(page->memory_entry != NULL) {
       uint32_t offset = address & MEM_PAGE_MASK;
       *size = page->byte_left - offset;
@@ -885,11 +1407,10 @@ uint8_t *mem_get_max_range(uint32_t address, uint32_t *size)
 
 int mem_get_memory_flags(uint32_t address)
 {
-  uint page_no = address >> MEM_PAGE_SHIFT;
-  if(page_no >= total_pages) {
+  page_entry_t *page = get_page(address);
+  if(page == NULL) {
     return 0;
   } else {
-    page_entry_t *page = &pages[page_no];
     memory_entry_t *mem = page->memory_entry;
     if(mem != NULL) {
       return mem->flags;
@@ -899,6 +1420,83 @@ int mem_get_memory_flags(uint32_t address)
   }
 }
 
+/* ----- Snapshot ----- */
+
+int mem_snapshot_take(void)
+{
+  memory_entry_t *me = first_mem_entry;
+  while(me != NULL) {
+    uint32_t num_subs = me->byte_size >> MEM_SUB_PAGE_SHIFT;
+    if(me->snapshot == NULL) {
+      me->snapshot = (uint8_t *)malloc(me->byte_size);
+      me->dirty = (uint8_t *)malloc(num_subs);
+      if((me->snapshot == NULL) || (me->dirty == NULL)) {
+        mem_snapshot_free();
+        return 0;
+      }
+    }
+    memcpy(me->snapshot, me->data, me->byte_size);
+    memset(me->dirty, 0, num_subs);
+    me = me->next;
+  }
+  snapshot_active = 1;
+  return 1;
+}
+
+uint32_t mem_snapshot_restore(void)
+{
+  uint32_t num = 0;
+  memory_entry_t *me = first_mem_entry;
+  if(!snapshot_active) {
+    return 0;
+  }
+  while(me != NULL) {
+    uint32_t num_subs = me->byte_size >> MEM_SUB_PAGE_SHIFT;
+    uint32_t i;
+    /* memory added after the snapshot is not tracked */
+    if(me->dirty == NULL) {
+      num_subs = 0;
+    }
+    for(i=0;i<num_subs;i++) {
+      if(me->dirty[i]) {
+        uint32_t off = i << MEM_SUB_PAGE_SHIFT;
+        memcpy(me->data + off, me->snapshot + off, MEM_SUB_PAGE_SIZE);
+        me->dirty[i] = 0;
+        num++;
+      }
+    }
+    me = me->next;
+  }
+  return num;
+}
+
+void mem_snapshot_free(void)
+{
+  memory_entry_t *me = first_mem_entry;
+  while(me != NULL) {
+    free(me->snapshot);
+    free(me->dirty);
+    me->snapshot = NULL;
+    me->dirty = NULL;
+    me = me->next;
+  }
+  snapshot_active = 0;
+}
+
+int mem_has_snapshot(void)
+{
+  return snapshot_active;
+}
+
+/* API block writes bypass the page functions */
+static void snapshot_mark_range(uint32_t address, uint32_t size)
+{
+  if(snapshot_active && (size > 0)) {
+    page_entry_t *page = get_page(address);
+    snapshot_mark(page, address & MEM_PAGE_MASK, size);
+  }
+}
+
 /* ----- API mem access ----- */
 
 int mem_set_block(uint32_t address, uint32_t size, uint8_t value)
@@ -907,6 +1505,7 @@ int mem_set_block(uint32_t address, uint32_t size, uint8_t value)
   if(data == NULL) {
     return 0;
   }
+  snapshot_mark_range(address, size);
   memset(data, value, size);
   if(api_trace_func != NULL) {
     api_trace_func(MEM_ACCESS_BSET, address, size, value);
@@ -921,6 +1520,7 @@ int mem_copy_block(uint32_t src_addr, uint32_t tgt_addr, uint32_t size)
   if((src_data == NULL)||(tgt_data == NULL)) {
     return 0;
   }
+  snapshot_mark_range(tgt_addr, size);
   memcpy(tgt_data, src_data, size);
   if(api_trace_func != NULL) {
     api_trace_func(MEM_ACCESS_BCOPY, tgt_addr, size, src_addr);
@@ -948,6 +1548,7 @@ int mem_w_block(uint32_t address, uint32_t size, const uint8_t *src_data)
   if(tgt_data == NULL) {
     return 0;
   }
+  snapshot_mark_range(address, size);
   memcpy(tgt_data, src_data, size);
   if(api_trace_func != NULL) {
     api_trace_func(MEM_ACCESS_W_BLOCK, address, size, 0);
@@ -955,6 +1556,80 @@ int mem_w_block(uint32_t address, uint32_t size, const uint8_t *src_data)
   return 1;
 }
 
+int mem_r_array(uint32_t address, uint32_t count, int width, void *values)
+{
+  const uint8_t *src;
+  uint32_t i;
+
+  if((width != 2) && (width != 4)) {
+    return 0;
+  }
+  if(count > (0xffffffffU / width)) {
+    return 0;
+  }
+  src = mem_get_range(address, count * width);
+  if(src == NULL) {
+    return 0;
+  }
+  if(width == 2) {
+    uint16_t *tgt = (uint16_t *)values;
+    for(i = 0; i < count; i++) {
+      tgt[i] = (uint16_t)((src[0] << 8) | src[1]);
+      src += 2;
+    }
+  } else {
+    uint32_t *tgt = (uint32_t *)values;
+    for(i = 0; i < count; i++) {
+      tgt[i] = ((uint32_t)src[0] << 24) | ((uint32_t)src[1] << 16) |
+               ((uint32_t)src[2] << 8) | (uint32_t)src[3];
+      src += 4;
+    }
+  }
+  if(api_trace_func != NULL) {
+    api_trace_func(MEM_ACCESS_R_BLOCK, address, count * width, 0);
+  }
+  return 1;
+}
+
+int mem_w_array(uint32_t address, uint32_t count, int width, const void *values)
+{
+  uint8_t *tgt;
+  uint32_t i;
+
+  if((values == NULL) || ((width != 2) && (width != 4))) {
+    return 0;
+  }
+  if(count > (0xffffffffU / width)) {
+    return 0;
+  }
+  tgt = mem_get_range(address, count * width);
+  if(tgt == NULL) {
+    return 0;
+  }
+  snapshot_mark_range(address, count * width);
+  if(width == 2) {
+    const uint16_t *src = (const uint16_t *)values;
+    for(i = 0; i < count; i++) {
+      tgt[0] = (uint8_t)(src[i] >> 8);
+      tgt[1] = (uint8_t)src[i];
+      tgt += 2;
+    }
+  } else {
+    const uint32_t *src = (const uint32_t *)values;
+    for(i = 0; i < count; i++) {
+      tgt[0] = (uint8_t)(src[i] >> 24);
+      tgt[1] = (uint8_t)(src[i] >> 16);
+      tgt[2] = (uint8_t)(src[i] >> 8);
+      tgt[3] = (uint8_t)src[i];
+      tgt += 4;
+    }
+  }
+  if(api_trace_func != NULL) {
+    api_trace_func(MEM_ACCESS_W_BLOCK, address, count * width, 0);
+  }
+  return 1;
+}
+
 const uint8_t *mem_r_cstr(uint32_t address, uint32_t *ret_length)
 {
   uint32_t length;
@@ -998,6 +1673,7 @@ int mem_w_cstr(uint32_t address, const uint8_t *str, uint32_t length)
   }
   /* does string fit */
   if((length+1) <= size) {
+    snapshot_mark_range(address, length + 1);
     memcpy(data, str, length);
     data[length] = '\0';
     if(api_trace_func != NULL) {
@@ -1050,6 +1726,7 @@ int mem_w_bstr(uint32_t address, const uint8_t *str, uint32_t length)
     return 0;
   }
   if((length +1) <= size) {
+    snapshot_mark_range(address, length + 1);
     *data = (uint8_t)length;
     memcpy(data+1, str, length);
     if(api_trace_func != NULL) {
@@ -1065,11 +1742,10 @@ int mem_w_bstr(uint32_t address, const uint8_t *str, uint32_t length)
 
 int mem_r8(uint32_t address, uint8_t *value)
 {
-  uint page_no = address >> MEM_PAGE_SHIFT;
-  if(page_no >= total_pages) {
+  page_entry_t *page = get_page(address);
+  if(page == NULL) {
     return 0;
   } else {
-    page_entry_t *page = &pages[page_no];
     read_func_t func = page->r_func[0];
     if(func != NULL) {
       *value = (uint8_t)func(page, address);
@@ -1087,11 +1763,10 @@ int mem_r8(uint32_t address, uint8_t *value)
 
 int mem_r16(uint32_t address, uint16_t *value)
 {
-  uint page_no = address >> MEM_PAGE_SHIFT;
-  if(page_no >= total_pages) {
+  page_entry_t *page = get_page(address);
+  if(page == NULL) {
     return 0;
   } else {
-    page_entry_t *page = &pages[page_no];
     read_func_t func = page->r_func[1];
     if(func != NULL) {
       *value = (uint16_t)func(page, address);
@@ -1109,11 +1784,10 @@ int mem_r16(uint32_t address, uint16_t *value)
 
 int mem_r32(uint32_t address, uint32_t *value)
 {
-  uint page_no = address >> MEM_PAGE_SHIFT;
-  if(page_no >= total_pages) {
+  page_entry_t *page = get_page(address);
+  if(page == NULL) {
     return 0;
   } else {
-    page_entry_t *page = &pages[page_no];
     read_func_t func = page->r_func[2];
     if(func != NULL) {
       *value = func(page, address);
@@ -1131,11 +1805,10 @@ int mem_r32(uint32_t address, uint32_t *value)
 
 int mem_rb32(uint32_t address, uint32_t *value)
 {
-  uint page_no = address >> MEM_PAGE_SHIFT;
-  if(page_no >= total_pages) {
+  page_entry_t *page = get_page(address);
+  if(page == NULL) {
     return 0;
   } else {
-    page_entry_t *page = &pages[page_no];
     read_func_t func = page->r_func[2];
     uint32_t v;
     if(func != NULL) {
@@ -1155,11 +1828,10 @@ int mem_rb32(uint32_t address, uint32_t *value)
 
 int mem_w8(uint32_t address, uint8_t value)
 {
-  uint page_no = address >> MEM_PAGE_SHIFT;
-  if(page_no >= total_pages) {
+  page_entry_t *page = get_page(address);
+  if(page == NULL) {
     return 0;
   } else {
-    page_entry_t *page = &pages[page_no];
     write_func_t func = page->w_func[0];
     if(func != NULL) {
       func(page, address, value);
@@ -1177,11 +1849,10 @@ int mem_w8(uint32_t address, uint8_t value)
 
 int mem_w16(uint32_t address, uint16_t value)
 {
-  uint page_no = address >> MEM_PAGE_SHIFT;
-  if(page_no >= total_pages) {
+  page_entry_t *page = get_page(address);
+  if(page == NULL) {
     return 0;
   } else {
-    page_entry_t *page = &pages[page_no];
     write_func_t func = page->w_func[1];
     if(func != NULL) {
       func(page, address, value);
@@ -1199,11 +1870,10 @@ int mem_w16(uint32_t address, uint16_t value)
 
 int mem_w32(uint32_t address, uint32_t value)
 {
-  uint page_no = address >> MEM_PAGE_SHIFT;
-  if(page_no >= total_pages) {
+  page_entry_t *page = get_page(address);
+  if(page == NULL) {
     return 0;
   } else {
-    page_entry_t *page = &pages[page_no];
     write_func_t func = page->w_func[2];
     if(func != NULL) {
       func(page, address, value);
@@ -1221,11 +1891,10 @@ int mem_w32(uint32_t address, uint32_t value)
 
 int mem_wb32(uint32_t address, uint32_t value)
 {
-  uint page_no = address >> MEM_PAGE_SHIFT;
-  if(page_no >= total_pages) {
+  page_entry_t *page = get_page(address);
+  if(page == NULL) {
     return 0;
   } else {
-    page_entry_t *page = &pages[page_no];
     write_func_t func = page->w_func[2];
     if(func != NULL) {
       func(page, address, value >> 2);
@@ -21,9 +21,21 @@ typedef unsigned int uint;
 #define MEM_PAGE_MASK 0x0ffff
 #define MEM_PAGE_SHIFT 16
 
+/* pages mixing kinds are split into sub pages */
+#define MEM_SUB_PAGE_SIZE  0x1000
+#define MEM_SUB_PAGE_MASK  0x00fff
+#define MEM_SUB_PAGE_SHIFT 12
+#define MEM_SUB_PAGES      (MEM_PAGE_SIZE / MEM_SUB_PAGE_SIZE)
+
+/* the page table is sparse: a directory of page blocks */
+#define MEM_DIR_SHIFT      8
+#define MEM_DIR_PAGES      (1 << MEM_DIR_SHIFT)
+#define MEM_DIR_MASK       (MEM_DIR_PAGES - 1)
+
 #define MEM_FLAGS_READ    1
 #define MEM_FLAGS_WRITE   2
 #define MEM_FLAGS_TRAPS   4
+#define MEM_FLAGS_MIRROR  0x100 /* internal: page mirrors another page */
 
 /* Use Bits 0,1,2 to signal 8, 16, 32 bit access.
    Bit 4 is set for read operations.
@@ -88,6 +100,8 @@ typedef struct memory_entry
   int      flags;
   uint32_t byte_size;
   uint8_t  *data;
+  uint8_t  *snapshot; /* copy of data taken by mem_snapshot_take() */
+  uint8_t  *dirty;    /* one flag per sub page changed since snapshot */
 } memory_entry_t;
 
 struct page_entry;
@@ -116,6 +130,9 @@ typedef struct page_entry {
   special_entry_t *special_entry;
   uint8_t        *data; /* if memory then pointer to mem of this page */
   uint32_t       byte_left; /* if memory then remaining bytes */
+  struct page_entry *sub_pages; /* if split then MEM_SUB_PAGES entries */
+  uint           mirror_page; /* if mirror then base page */
+  int            mirror_flags; /* if mirror then its flags */
 } page_entry_t;
 
 
@@ -124,6 +141,7 @@ extern int  mem_init(uint num_pages);
 extern void mem_free(void);
 
 extern uint mem_get_page_shift(void);
+extern uint mem_get_sub_page_shift(void);
 extern uint mem_get_num_pages(void);
 
 extern void mem_set_invalid_value(uint32_t value);
@@ -138,9 +156,19 @@ extern special_entry_t *mem_add_special(uint start_page, uint num_pages,
 extern int mem_add_empty(uint start_page, uint num_pages, int flags, uint32_t value);
 extern int mem_add_mirror(uint start_page, uint num_pages, int flags, uint base_page);
 
+extern special_entry_t *mem_add_special_sub(uint start_sub, uint num_subs,
+                           special_read_func_t read_func, void *read_data,
+                           special_write_func_t write_func, void *write_data);
+extern int mem_add_empty_sub(uint start_sub, uint num_subs, int flags, uint32_t value);
+extern int mem_is_split_page(uint page_no);
+extern uint mem_get_num_page_blocks(void);
+
 extern void mem_set_cpu_trace_func(cpu_trace_func_t func);
 extern void mem_set_api_trace_func(api_trace_func_t func);
 
+extern int mem_has_callbacks(void);
+extern uint32_t mem_cpu_changes;
+
 extern int mem_default_cpu_trace_func(int access, uint32_t addr, uint32_t val, void **data);
 extern void mem_default_api_trace_func(int access, uint32_t addr, uint32_t val, uint32_t extra);
 
@@ -154,6 +182,10 @@ extern int mem_copy_block(uint32_t src_addr, uint32_t tgt_addr, uint32_t size);
 extern const uint8_t *mem_r_block(uint32_t address, uint32_t size);
 extern int mem_w_block(uint32_t address, uint32_t size, const uint8_t *src_data);
 
+/* arrays of big endian 16 (width=2) or 32 (width=4) bit values in host order */
+extern int mem_r_array(uint32_t address, uint32_t count, int width, void *values);
+extern int mem_w_array(uint32_t address, uint32_t count, int width, const void *values);
+
 extern const char *mem_get_cpu_access_str(int access);
 extern const char *mem_get_cpu_fc_str(int access);
 extern const char *mem_get_cpu_mem_str(int access, uint32_t address, uint32_t value);
@@ -178,6 +210,12 @@ extern int mem_w_bstr(uint32_t address, const uint8_t *str, uint32_t length);
 extern int mem_rb32(uint32_t address, uint32_t *value);
 extern int mem_wb32(uint32_t address, uint32_t value);
 
+/* snapshot of all memory entries: restore only copies back changed sub pages */
+extern int mem_snapshot_take(void);
+extern uint32_t mem_snapshot_restore(void);
+extern void mem_snapshot_free(void);
+extern int mem_has_snapshot(void);
+
 /* support disassembling a buffer */
 extern void mem_disasm_buffer(const uint8_t *buf, uint32_t size, uint32_t offset);
 extern void mem_disasm_memory(void);
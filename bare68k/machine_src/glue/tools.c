@@ -9,6 +9,7 @@
 
 #include "tools.h"
 #include "cpu.h"
+#include "mem.h"
 
 typedef struct {
   uint32_t *entries;
@@ -26,6 +27,9 @@ typedef struct {
   node_t node;
   uint32_t addr;
   int flags;
+  uint64_t hits;
+  tools_cond_term_t *cond; /* all terms must hold to report a hit */
+  int num_terms;
 } point_t;
 
 typedef struct {
@@ -34,15 +38,36 @@ typedef struct {
   uint32_t elapsed;
 } my_timer_t;
 
+/* an idle loop has at most this many instructions */
+#define IDLE_MAX_INSTR 16
+#define IDLE_NUM_REGS 17
+
+typedef struct {
+  uint32_t loop_pc;
+  uint32_t last_pc;
+  int num_instr; /* -1 if no loop candidate */
+  uint32_t changes;
+  uint32_t regs[IDLE_NUM_REGS];
+  uint64_t cycles;
+} idle_t;
+
 typedef struct {
   node_t *nodes;
   size_t node_size;
   int num;
   int max;
+  uint8_t *filter; /* points: bitmap of hashed addresses of enabled points */
 } array_t;
 
+/* the address filter lets point_check() skip the scan on most addresses */
+#define POINT_FILTER_BITS 0x10000
+#define POINT_FILTER_HASH(addr) (((addr) ^ ((addr) >> 16)) & (POINT_FILTER_BITS - 1))
+
 int tools_pc_trace_enabled;
+int tools_pc_trace_mode;
 static pc_trace_t pc_trace;
+static uint32_t branch_last_pc;
+static int branch_last_valid;
 
 int tools_breakpoints_enabled;
 static free_func_t breakpoints_free_func;
@@ -56,12 +81,30 @@ int tools_timers_enabled;
 static free_func_t timers_free_func;
 static array_t timers;
 
+int tools_idle_enabled;
+static idle_t idle;
+
+int tools_opcode_stats_enabled;
+static uint64_t *opcode_stats;
+static uint64_t instr_count;
+
+int tools_coverage_enabled;
+static uint8_t **coverage_pages;
+static uint32_t coverage_num_pages;
+
+int tools_edge_map_enabled;
+static uint8_t *edge_map;
+static uint8_t *edge_virgin;
+static uint32_t edge_map_size;
+static uint32_t edge_prev;
+
 #define FLAG_ENABLE 1
 #define FLAG_SETUP 2
 
 void tools_init(void)
 {
   tools_pc_trace_enabled = 0;
+  tools_pc_trace_mode = TOOLS_PC_TRACE_ALL;
   tools_breakpoints_enabled = 0;
   tools_watchpoints_enabled = 0;
   tools_timers_enabled = 0;
@@ -76,6 +119,24 @@ void tools_init(void)
 
   timers_free_func = NULL;
   memset(&timers, 0, sizeof(array_t));
+
+  tools_idle_enabled = 0;
+  memset(&idle, 0, sizeof(idle_t));
+  idle.num_instr = -1;
+
+  tools_opcode_stats_enabled = 0;
+  opcode_stats = NULL;
+  instr_count = 0;
+
+  tools_coverage_enabled = 0;
+  coverage_pages = NULL;
+  coverage_num_pages = 0;
+
+  tools_edge_map_enabled = 0;
+  edge_map = NULL;
+  edge_virgin = NULL;
+  edge_map_size = 0;
+  edge_prev = 0;
 }
 
 void tools_free(void)
@@ -84,6 +145,9 @@ void tools_free(void)
   tools_setup_breakpoints(0, NULL);
   tools_setup_watchpoints(0, NULL);
   tools_setup_timers(0, NULL);
+  tools_setup_opcode_stats(0);
+  tools_setup_coverage(0);
+  tools_setup_edge_map(0);
 }
 
 /* ----- PC Trace ----- */
@@ -99,6 +163,14 @@ int tools_setup_pc_trace(int num)
     return -1;
   }
 
+  /* same size: only clear the trace */
+  if((num > 0) && (num == pc_trace.max) && (pc_trace.entries != NULL)) {
+    pc_trace.offset = 0;
+    pc_trace.num = 0;
+    branch_last_valid = 0;
+    return num;
+  }
+
   /* cleanup old */
   if(pc_trace.entries != NULL) {
     free(pc_trace.entries);
@@ -108,6 +180,7 @@ int tools_setup_pc_trace(int num)
   pc_trace.max = num;
   pc_trace.offset = 0;
   pc_trace.num = 0;
+  branch_last_valid = 0;
 
   tools_pc_trace_enabled = (num > 0);
 
@@ -127,6 +200,11 @@ uint32_t *tools_get_pc_trace(int *size)
   int pos;
   int n = pc_trace.num;
 
+  /* branch records are pairs: skip a target whose source was overwritten */
+  if((tools_pc_trace_mode == TOOLS_PC_TRACE_BRANCH) && (n & 1)) {
+    n--;
+  }
+
   if(n == 0) {
     *size = 0;
     return NULL;
@@ -140,7 +218,7 @@ uint32_t *tools_get_pc_trace(int *size)
   }
 
   /* copy values */
-  pos = (pc_trace.offset + pc_trace.max - pc_trace.num) % pc_trace.max;
+  pos = (pc_trace.offset + pc_trace.max - n) % pc_trace.max;
   for(i=0;i<n;i++) {
     result[i] = pc_trace.entries[pos];
     pos = (pos + 1) % pc_trace.max;
@@ -168,6 +246,64 @@ void tools_update_pc_trace(uint32_t pc)
   }
 }
 
+void tools_set_pc_trace_mode(int mode)
+{
+  tools_pc_trace_mode = mode;
+  pc_trace.offset = 0;
+  pc_trace.num = 0;
+  branch_last_valid = 0;
+}
+
+/* the longest 680x0 instruction has 22 bytes */
+#define MAX_INSTR_BYTES 22
+
+static int is_jump_opcode(uint16_t ir)
+{
+  /* jmp, jsr */
+  if(((ir & 0xffc0) == 0x4ec0) || ((ir & 0xffc0) == 0x4e80)) {
+    return 1;
+  }
+  /* trap #n */
+  if((ir & 0xfff0) == 0x4e40) {
+    return 1;
+  }
+  /* rte, rtd, rts, rtr */
+  return (ir == 0x4e73) || (ir == 0x4e74) || (ir == 0x4e75) || (ir == 0x4e77);
+}
+
+void tools_update_branch_trace(uint32_t pc, uint16_t ir)
+{
+  uint32_t from = branch_last_pc;
+  int jump;
+
+  branch_last_pc = pc;
+  if(!branch_last_valid) {
+    branch_last_valid = 1;
+    return;
+  }
+
+  /* the IR still holds the opcode of the previous instruction */
+  if((ir & 0xf000) == 0x6000) {
+    /* bra, bsr, bcc: taken if not at the fall through address */
+    uint32_t disp = ir & 0xff;
+    uint32_t size = (disp == 0) ? 4 : ((disp == 0xff) ? 6 : 2);
+    jump = (pc != from + size);
+  } else if((ir & 0xf0f8) == 0x50c8) {
+    /* dbcc */
+    jump = (pc != from + 4);
+  } else if(is_jump_opcode(ir)) {
+    jump = 1;
+  } else {
+    /* exceptions and interrupts leave the range of the next instruction */
+    jump = (pc <= from) || (pc > from + MAX_INSTR_BYTES);
+  }
+
+  if(jump) {
+    tools_update_pc_trace(from);
+    tools_update_pc_trace(pc);
+  }
+}
+
 /* ----- Nodes ----- */
 
 static int array_setup(array_t *a, int num, size_t node_size)
@@ -252,8 +388,11 @@ static void array_cleanup(array_t *a, free_func_t free_func)
         node_free(a, i, free_func);
       }
     }
+    free(a->nodes);
   }
 
+  free(a->filter);
+  a->filter = NULL;
   a->max = 0;
   a->num = 0;
   a->nodes = NULL;
@@ -326,6 +465,37 @@ static int node_get_next_free(array_t *a)
 
 /* ----- Points ------ */
 
+static int point_setup(array_t *a, int num)
+{
+  int res = array_setup(a, num, sizeof(point_t));
+  if(res > 0) {
+    a->filter = (uint8_t *)calloc(POINT_FILTER_BITS / 8, 1);
+    if(a->filter == NULL) {
+      array_cleanup(a, NULL);
+      return -1;
+    }
+  }
+  return res;
+}
+
+/* rebuild the address filter after a point changed */
+static int point_update(array_t *a, int res)
+{
+  int i;
+  if((res < 0) || (a->filter == NULL)) {
+    return res;
+  }
+  memset(a->filter, 0, POINT_FILTER_BITS / 8);
+  for(i=0;i<a->max;i++) {
+    point_t *p = (point_t *)node_get(a, i);
+    if(p->node.enable == (FLAG_ENABLE | FLAG_SETUP)) {
+      uint32_t h = POINT_FILTER_HASH(p->addr);
+      a->filter[h >> 3] |= 1 << (h & 7);
+    }
+  }
+  return res;
+}
+
 static int point_alloc(array_t *a, int id, uint32_t addr, int flags, void *data)
 {
   point_t *p = (point_t *)node_alloc(a, id, data);
@@ -334,23 +504,149 @@ static int point_alloc(array_t *a, int id, uint32_t addr, int flags, void *data)
   }
   p->addr = addr;
   p->flags = flags;
+  p->hits = 0;
+  p->cond = NULL;
+  p->num_terms = 0;
+  return point_update(a, id);
+}
+
+static int point_set_cond(array_t *a, int id, const tools_cond_term_t *terms, int num)
+{
+  point_t *p = (point_t *)node_get(a, id);
+  tools_cond_term_t *cond = NULL;
+  if((p == NULL) || ((p->node.enable & FLAG_SETUP) == 0)) {
+    return -1;
+  }
+  if((num < 0) || (num > TOOLS_COND_MAX_TERMS)) {
+    return -1;
+  }
+  if(num > 0) {
+    size_t bytes = sizeof(tools_cond_term_t) * num;
+    cond = (tools_cond_term_t *)malloc(bytes);
+    if(cond == NULL) {
+      return -1;
+    }
+    memcpy(cond, terms, bytes);
+  }
+  free(p->cond);
+  p->cond = cond;
+  p->num_terms = num;
   return id;
 }
 
-static int point_check(array_t *a, uint32_t addr, int flags)
+static void point_free_cond(array_t *a, int id)
+{
+  point_t *p = (point_t *)node_get(a, id);
+  if(p != NULL) {
+    free(p->cond);
+    p->cond = NULL;
+    p->num_terms = 0;
+  }
+}
+
+static void point_cleanup(array_t *a)
 {
   int i;
+  for(i=0;i<a->max;i++) {
+    point_free_cond(a, i);
+  }
+}
+
+/* read a big endian value from RAM without side effects */
+static int cond_read_mem(uint32_t addr, int size, uint32_t *val)
+{
+  const uint8_t *data = mem_get_range(addr, size);
+  uint32_t v = 0;
+  int i;
+  if(data == NULL) {
+    return 0;
+  }
+  for(i=0;i<size;i++) {
+    v = (v << 8) | data[i];
+  }
+  *val = v;
+  return 1;
+}
+
+static int cond_compare(int op, uint64_t a, uint64_t b)
+{
+  switch(op) {
+    case TOOLS_COND_EQ: return a == b;
+    case TOOLS_COND_NE: return a != b;
+    case TOOLS_COND_LT: return a < b;
+    case TOOLS_COND_LE: return a <= b;
+    case TOOLS_COND_GT: return a > b;
+    case TOOLS_COND_GE: return a >= b;
+    case TOOLS_COND_SLT: return (int32_t)a < (int32_t)b;
+    case TOOLS_COND_SLE: return (int32_t)a <= (int32_t)b;
+    case TOOLS_COND_SGT: return (int32_t)a > (int32_t)b;
+    case TOOLS_COND_SGE: return (int32_t)a >= (int32_t)b;
+    default: return 0;
+  }
+}
+
+static int point_eval_cond(point_t *p, uint32_t value)
+{
+  int i;
+  for(i=0;i<p->num_terms;i++) {
+    const tools_cond_term_t *t = &p->cond[i];
+    uint64_t v;
+    uint32_t mv;
+    switch(t->kind) {
+      case TOOLS_COND_REG:
+        v = cpu_r_reg(t->arg) & t->mask;
+        break;
+      case TOOLS_COND_MEM8:
+      case TOOLS_COND_MEM16:
+      case TOOLS_COND_MEM32:
+        /* size is 1, 2 or 4 bytes */
+        if(!cond_read_mem(t->arg, 1 << (t->kind - TOOLS_COND_MEM8), &mv)) {
+          return 0;
+        }
+        v = mv & t->mask;
+        break;
+      case TOOLS_COND_VALUE:
+        v = value & t->mask;
+        break;
+      case TOOLS_COND_HITS:
+        if(!cond_compare(t->op, p->hits, t->value)) {
+          return 0;
+        }
+        continue;
+      default:
+        return 0;
+    }
+    if(!cond_compare(t->op, v, t->value)) {
+      return 0;
+    }
+  }
+  return 1;
+}
 
+/* count hits of matching points. counting points only record the hit,
+   the first other point whose condition holds is returned */
+static int point_check(array_t *a, uint32_t addr, int flags, uint32_t value)
+{
+  uint32_t h = POINT_FILTER_HASH(addr);
+  int i;
+
+  if((a->filter == NULL) || ((a->filter[h >> 3] & (1 << (h & 7))) == 0)) {
+    return NO_POINT;
+  }
   for(i=0;i<a->max;i++) {
     point_t *p = (point_t *)node_get(a, i);
     if(p->node.enable == (FLAG_ENABLE | FLAG_SETUP)) {
       /* first check address */
-      int p_addr = p->addr;
-      if(p_addr == addr) {
+      if(p->addr == addr) {
         /* then check flags */
         int p_flags = p->flags;
         if((p_flags & flags) != 0) {
-          return i;
+          p->hits++;
+          if((p_flags & TOOLS_POINT_COUNT) == 0) {
+            if((p->num_terms == 0) || point_eval_cond(p, value)) {
+              return i;
+            }
+          }
         }
       }
     }
@@ -358,6 +654,25 @@ static int point_check(array_t *a, uint32_t addr, int flags)
   return NO_POINT;
 }
 
+static int point_get_hits(array_t *a, uint64_t *hits, int max)
+{
+  int i;
+  for(i=0;(i<a->max) && (i<max);i++) {
+    point_t *p = (point_t *)node_get(a, i);
+    hits[i] = p->hits;
+  }
+  return i;
+}
+
+static void point_clear_hits(array_t *a)
+{
+  int i;
+  for(i=0;i<a->max;i++) {
+    point_t *p = (point_t *)node_get(a, i);
+    p->hits = 0;
+  }
+}
+
 /* ---- Breakpoints ----- */
 
 int tools_get_num_breakpoints(void)
@@ -383,6 +698,7 @@ int tools_setup_breakpoints(int num, free_func_t free_func)
 
   /* remove old */
   if(breakpoints.nodes != NULL) {
+    point_cleanup(&breakpoints);
     array_cleanup(&breakpoints, breakpoints_free_func);
   }
 
@@ -390,7 +706,7 @@ int tools_setup_breakpoints(int num, free_func_t free_func)
   breakpoints_free_func = free_func;
 
   if(num > 0) {
-    return array_setup(&breakpoints, num, sizeof(point_t));
+    return point_setup(&breakpoints, num);
   } else {
     return 0;
   }
@@ -403,17 +719,18 @@ int tools_create_breakpoint(int id, uint32_t addr, int flags, void *data)
 
 int tools_free_breakpoint(int id)
 {
-  return node_free(&breakpoints, id, breakpoints_free_func);
+  point_free_cond(&breakpoints, id);
+  return point_update(&breakpoints, node_free(&breakpoints, id, breakpoints_free_func));
 }
 
 int tools_enable_breakpoint(int id)
 {
-  return node_enable(&breakpoints, id);
+  return point_update(&breakpoints, node_enable(&breakpoints, id));
 }
 
 int tools_disable_breakpoint(int id)
 {
-  return node_disable(&breakpoints, id);
+  return point_update(&breakpoints, node_disable(&breakpoints, id));
 }
 
 int tools_is_breakpoint_enabled(int id)
@@ -428,7 +745,22 @@ void *tools_get_breakpoint_data(int id)
 
 int tools_check_breakpoint(uint32_t addr, int flags)
 {
-  return point_check(&breakpoints, addr, flags);
+  return point_check(&breakpoints, addr, flags, addr);
+}
+
+int tools_set_breakpoint_cond(int id, const tools_cond_term_t *terms, int num)
+{
+  return point_set_cond(&breakpoints, id, terms, num);
+}
+
+int tools_get_breakpoint_hits(uint64_t *hits, int max)
+{
+  return point_get_hits(&breakpoints, hits, max);
+}
+
+void tools_clear_breakpoint_hits(void)
+{
+  point_clear_hits(&breakpoints);
 }
 
 /* ---- Watchpoints ----- */
@@ -456,6 +788,7 @@ int tools_setup_watchpoints(int num, free_func_t free_func)
 
   /* remove old */
   if(watchpoints.nodes != NULL) {
+    point_cleanup(&watchpoints);
     array_cleanup(&watchpoints, watchpoints_free_func);
   }
 
@@ -463,7 +796,7 @@ int tools_setup_watchpoints(int num, free_func_t free_func)
   watchpoints_free_func = free_func;
 
   if(num > 0) {
-    return array_setup(&watchpoints, num, sizeof(point_t));
+    return point_setup(&watchpoints, num);
   } else {
     return 0;
   }
@@ -476,17 +809,18 @@ int tools_create_watchpoint(int id, uint32_t addr, int flags, void *data)
 
 int tools_free_watchpoint(int id)
 {
-  return node_free(&watchpoints, id, watchpoints_free_func);
+  point_free_cond(&watchpoints, id);
+  return point_update(&watchpoints, node_free(&watchpoints, id, watchpoints_free_func));
 }
 
 int tools_enable_watchpoint(int id)
 {
-  return node_enable(&watchpoints, id);
+  return point_update(&watchpoints, node_enable(&watchpoints, id));
 }
 
 int tools_disable_watchpoint(int id)
 {
-  return node_disable(&watchpoints, id);
+  return point_update(&watchpoints, node_disable(&watchpoints, id));
 }
 
 int tools_is_watchpoint_enabled(int id)
@@ -499,9 +833,24 @@ void *tools_get_watchpoint_data(int id)
   return node_get_data(&watchpoints, id);
 }
 
-int tools_check_watchpoint(uint32_t addr, int flags)
+int tools_check_watchpoint(uint32_t addr, int flags, uint32_t value)
+{
+  return point_check(&watchpoints, addr, flags, value);
+}
+
+int tools_set_watchpoint_cond(int id, const tools_cond_term_t *terms, int num)
 {
-  return point_check(&watchpoints, addr, flags);
+  return point_set_cond(&watchpoints, id, terms, num);
+}
+
+int tools_get_watchpoint_hits(uint64_t *hits, int max)
+{
+  return point_get_hits(&watchpoints, hits, max);
+}
+
+void tools_clear_watchpoint_hits(void)
+{
+  point_clear_hits(&watchpoints);
 }
 
 /* ----- Timers ----- */
@@ -596,3 +945,361 @@ int tools_tick_timers(uint32_t pc, uint32_t elapsed)
   }
   return num_events;
 }
+
+uint32_t tools_get_next_timer(void)
+{
+  int i;
+  uint32_t next = 0;
+  for(i=0;i<timers.max;i++) {
+    my_timer_t *t = (my_timer_t *)node_get(&timers, i);
+    if(t->node.enable == (FLAG_ENABLE | FLAG_SETUP)) {
+      uint32_t left = 1;
+      if(t->elapsed < t->interval) {
+        left = t->interval - t->elapsed;
+      }
+      if((next == 0) || (left < next)) {
+        next = left;
+      }
+    }
+  }
+  return next;
+}
+
+/* ----- Idle Detection ----- */
+
+static void idle_snapshot(uint32_t pc)
+{
+  int i;
+  idle.loop_pc = pc;
+  idle.num_instr = 0;
+  idle.changes = mem_cpu_changes;
+  for(i=0;i<16;i++) {
+    idle.regs[i] = cpu_r_reg(M68K_REG_D0 + i);
+  }
+  idle.regs[16] = cpu_r_reg(M68K_REG_SR);
+}
+
+static int idle_same_state(void)
+{
+  int i;
+  if(idle.changes != mem_cpu_changes) {
+    return 0;
+  }
+  for(i=0;i<16;i++) {
+    if(idle.regs[i] != cpu_r_reg(M68K_REG_D0 + i)) {
+      return 0;
+    }
+  }
+  return idle.regs[16] == cpu_r_reg(M68K_REG_SR);
+}
+
+void tools_set_idle_detection(int enable)
+{
+  tools_idle_enabled = enable;
+  idle.num_instr = -1;
+}
+
+uint64_t tools_get_idle_cycles(void)
+{
+  return idle.cycles;
+}
+
+/* a short backward loop that returns to its start with the same register
+   set and without writing memory can never leave by itself.
+   return the cycles to skip (max_skip) if the CPU spins in such a loop */
+uint32_t tools_check_idle(uint32_t pc, uint32_t max_skip)
+{
+  uint32_t skip = 0;
+
+  if((idle.num_instr >= 0) && (pc == idle.loop_pc)) {
+    if(idle_same_state()) {
+      skip = max_skip;
+      idle.cycles += skip;
+    } else {
+      idle_snapshot(pc);
+    }
+  }
+  else if(pc <= idle.last_pc) {
+    /* backward jump: new loop candidate */
+    idle_snapshot(pc);
+  }
+  else if(idle.num_instr >= 0) {
+    idle.num_instr++;
+    if(idle.num_instr > IDLE_MAX_INSTR) {
+      idle.num_instr = -1;
+    }
+  }
+
+  idle.last_pc = pc;
+  return skip;
+}
+
+/* ----- Opcode Stats ----- */
+
+int tools_setup_opcode_stats(int enable)
+{
+  if(enable) {
+    if(opcode_stats == NULL) {
+      opcode_stats = (uint64_t *)calloc(0x10000, sizeof(uint64_t));
+      if(opcode_stats == NULL) {
+        tools_opcode_stats_enabled = 0;
+        return -1;
+      }
+    }
+  } else {
+    if(opcode_stats != NULL) {
+      free(opcode_stats);
+      opcode_stats = NULL;
+    }
+  }
+  tools_opcode_stats_enabled = enable;
+  return 0;
+}
+
+void tools_clear_opcode_stats(void)
+{
+  if(opcode_stats != NULL) {
+    memset(opcode_stats, 0, 0x10000 * sizeof(uint64_t));
+  }
+  instr_count = 0;
+}
+
+const uint64_t *tools_get_opcode_stats(void)
+{
+  return opcode_stats;
+}
+
+uint64_t tools_get_instr_count(void)
+{
+  return instr_count;
+}
+
+/* called before each instruction with its opcode */
+void tools_count_opcode(uint16_t opcode)
+{
+  opcode_stats[opcode]++;
+  instr_count++;
+}
+
+/* ----- Coverage ----- */
+
+static void free_coverage(void)
+{
+  uint32_t i;
+  for(i=0;i<coverage_num_pages;i++) {
+    if(coverage_pages[i] != NULL) {
+      free(coverage_pages[i]);
+    }
+  }
+  free(coverage_pages);
+  coverage_pages = NULL;
+  coverage_num_pages = 0;
+}
+
+int tools_setup_coverage(int enable)
+{
+  if(enable) {
+    if(coverage_pages == NULL) {
+      /* a bitmap pointer for each page of the page table */
+      uint32_t num = mem_get_num_pages();
+      coverage_pages = (uint8_t **)calloc(num, sizeof(uint8_t *));
+      if(coverage_pages == NULL) {
+        tools_coverage_enabled = 0;
+        return -1;
+      }
+      coverage_num_pages = num;
+    }
+  } else {
+    if(coverage_pages != NULL) {
+      free_coverage();
+    }
+  }
+  tools_coverage_enabled = enable;
+  return 0;
+}
+
+void tools_clear_coverage(void)
+{
+  uint32_t i;
+  for(i=0;i<coverage_num_pages;i++) {
+    if(coverage_pages[i] != NULL) {
+      free(coverage_pages[i]);
+      coverage_pages[i] = NULL;
+    }
+  }
+}
+
+/* bitmaps are allocated lazily on the first hit in a page */
+static uint8_t *get_coverage_bitmap(uint32_t page_no)
+{
+  uint8_t *bitmap = coverage_pages[page_no];
+  if(bitmap == NULL) {
+    bitmap = (uint8_t *)calloc(1, TOOLS_COVERAGE_PAGE_BYTES);
+    coverage_pages[page_no] = bitmap;
+  }
+  return bitmap;
+}
+
+void tools_mark_coverage(uint32_t pc)
+{
+  uint32_t page_no = pc >> MEM_PAGE_SHIFT;
+  uint32_t word = (pc & MEM_PAGE_MASK) >> 1;
+  uint8_t *bitmap;
+
+  if(page_no >= coverage_num_pages) {
+    return;
+  }
+  bitmap = get_coverage_bitmap(page_no);
+  if(bitmap != NULL) {
+    bitmap[word >> 3] |= 1 << (word & 7);
+  }
+}
+
+const uint8_t *tools_get_coverage_page(uint32_t page_no)
+{
+  if(page_no >= coverage_num_pages) {
+    return NULL;
+  }
+  return coverage_pages[page_no];
+}
+
+int tools_merge_coverage_page(uint32_t page_no, const uint8_t *data)
+{
+  uint8_t *bitmap;
+  int i;
+
+  if(page_no >= coverage_num_pages) {
+    return -1;
+  }
+  bitmap = get_coverage_bitmap(page_no);
+  if(bitmap == NULL) {
+    return -1;
+  }
+  for(i=0;i<TOOLS_COVERAGE_PAGE_BYTES;i++) {
+    bitmap[i] |= data[i];
+  }
+  return 0;
+}
+
+/* ----- Edge Map ----- */
+
+int tools_setup_edge_map(uint32_t size)
+{
+  free(edge_map);
+  free(edge_virgin);
+  edge_map = NULL;
+  edge_virgin = NULL;
+  edge_map_size = 0;
+  tools_edge_map_enabled = 0;
+  if(size == 0) {
+    return 0;
+  }
+  /* size must be a power of two */
+  if((size & (size - 1)) != 0) {
+    return -1;
+  }
+  edge_map = (uint8_t *)calloc(size, 1);
+  edge_virgin = (uint8_t *)calloc(size, 1);
+  if((edge_map == NULL) || (edge_virgin == NULL)) {
+    tools_setup_edge_map(0);
+    return -1;
+  }
+  edge_map_size = size;
+  edge_prev = 0;
+  tools_edge_map_enabled = 1;
+  return 0;
+}
+
+uint32_t tools_get_edge_map_size(void)
+{
+  return edge_map_size;
+}
+
+void tools_clear_edge_map(void)
+{
+  if(edge_map != NULL) {
+    memset(edge_map, 0, edge_map_size);
+  }
+  edge_prev = 0;
+}
+
+void tools_clear_edge_virgin(void)
+{
+  if(edge_virgin != NULL) {
+    memset(edge_virgin, 0, edge_map_size);
+  }
+}
+
+const uint8_t *tools_get_edge_map(void)
+{
+  return edge_map;
+}
+
+void tools_mark_edge(uint32_t pc)
+{
+  /* scatter the word address over the map */
+  uint32_t cur = (pc >> 1) * 0x9e3779b1U;
+  cur ^= cur >> 15;
+  edge_map[(cur ^ edge_prev) & (edge_map_size - 1)]++;
+  /* shift keeps A->B and B->A apart */
+  edge_prev = cur >> 1;
+}
+
+/* map a hit count to a bucket bit: 1, 2, 3, 4-7, 8-15, 16-31, 32-127, 128+ */
+static uint8_t edge_bucket(uint8_t count)
+{
+  if(count <= 3) {
+    return count == 3 ? 4 : count;
+  }
+  if(count < 8) {
+    return 8;
+  }
+  if(count < 16) {
+    return 16;
+  }
+  if(count < 32) {
+    return 32;
+  }
+  if(count < 128) {
+    return 64;
+  }
+  return 128;
+}
+
+int tools_update_edge_virgin(void)
+{
+  int result = TOOLS_EDGE_NONE;
+  uint32_t i;
+
+  if(edge_map == NULL) {
+    return TOOLS_EDGE_NONE;
+  }
+  for(i=0;i<edge_map_size;i++) {
+    uint8_t count = edge_map[i];
+    if(count != 0) {
+      uint8_t bucket = edge_bucket(count);
+      uint8_t seen = edge_virgin[i];
+      if((seen & bucket) == 0) {
+        if(seen == 0) {
+          result = TOOLS_EDGE_NEW_EDGE;
+        } else if(result == TOOLS_EDGE_NONE) {
+          result = TOOLS_EDGE_NEW_COUNT;
+        }
+        edge_virgin[i] = seen | bucket;
+      }
+    }
+  }
+  return result;
+}
+
+uint32_t tools_get_num_edges(void)
+{
+  uint32_t num = 0;
+  uint32_t i;
+  for(i=0;i<edge_map_size;i++) {
+    if(edge_virgin[i] != 0) {
+      num++;
+    }
+  }
+  return num;
+}
@@ -11,15 +11,54 @@
 
 #define NO_POINT      -1
 
+/* point flag: only count hits and never report the point */
+#define TOOLS_POINT_COUNT  0x10000
+
 typedef void (*free_func_t)(void *data);
 
+/* conditions of break and watch points: a list of terms that must all hold */
+#define TOOLS_COND_MAX_TERMS  8
+
+/* term kinds: arg is the register number or the memory address */
+#define TOOLS_COND_REG    0
+#define TOOLS_COND_MEM8   1
+#define TOOLS_COND_MEM16  2
+#define TOOLS_COND_MEM32  3
+#define TOOLS_COND_VALUE  4 /* accessed value of a watchpoint */
+#define TOOLS_COND_HITS   5
+
+/* compare ops: unsigned and signed */
+#define TOOLS_COND_EQ     0
+#define TOOLS_COND_NE     1
+#define TOOLS_COND_LT     2
+#define TOOLS_COND_LE     3
+#define TOOLS_COND_GT     4
+#define TOOLS_COND_GE     5
+#define TOOLS_COND_SLT    6
+#define TOOLS_COND_SLE    7
+#define TOOLS_COND_SGT    8
+#define TOOLS_COND_SGE    9
+
+typedef struct {
+  uint8_t  kind;
+  uint8_t  op;
+  uint32_t arg;
+  uint32_t mask;
+  uint32_t value;
+} tools_cond_term_t;
+
 extern void tools_init(void);
 extern void tools_free(void);
 
 extern int tools_pc_trace_enabled;
+extern int tools_pc_trace_mode;
 extern int tools_breakpoints_enabled;
 extern int tools_watchpoints_enabled;
 extern int tools_timers_enabled;
+extern int tools_idle_enabled;
+extern int tools_opcode_stats_enabled;
+extern int tools_coverage_enabled;
+extern int tools_edge_map_enabled;
 
 extern int tools_setup_pc_trace(int num);
 extern int tools_get_pc_trace_size(void);
@@ -27,6 +66,13 @@ extern uint32_t *tools_get_pc_trace(int *size);
 extern void tools_free_pc_trace(uint32_t *data);
 extern void tools_update_pc_trace(uint32_t pc);
 
+/* record every pc or only source and target pairs of taken branches */
+#define TOOLS_PC_TRACE_ALL     0
+#define TOOLS_PC_TRACE_BRANCH  1
+
+extern void tools_set_pc_trace_mode(int mode);
+extern void tools_update_branch_trace(uint32_t pc, uint16_t ir);
+
 extern int tools_get_max_breakpoints(void);
 extern int tools_get_num_breakpoints(void);
 extern int tools_get_next_free_breakpoint(void);
@@ -38,6 +84,9 @@ extern int tools_disable_breakpoint(int id);
 extern int tools_is_breakpoint_enabled(int id);
 extern void *tools_get_breakpoint_data(int id);
 extern int tools_check_breakpoint(uint32_t addr, int flags);
+extern int tools_set_breakpoint_cond(int id, const tools_cond_term_t *terms, int num);
+extern int tools_get_breakpoint_hits(uint64_t *hits, int max);
+extern void tools_clear_breakpoint_hits(void);
 
 extern int tools_get_max_watchpoints(void);
 extern int tools_get_num_watchpoints(void);
@@ -49,7 +98,10 @@ extern int tools_enable_watchpoint(int id);
 extern int tools_disable_watchpoint(int id);
 extern int tools_is_watchpoint_enabled(int id);
 extern void *tools_get_watchpoint_data(int id);
-extern int tools_check_watchpoint(uint32_t addr, int flags);
+extern int tools_check_watchpoint(uint32_t addr, int flags, uint32_t value);
+extern int tools_set_watchpoint_cond(int id, const tools_cond_term_t *terms, int num);
+extern int tools_get_watchpoint_hits(uint64_t *hits, int max);
+extern void tools_clear_watchpoint_hits(void);
 
 extern int tools_get_max_timers(void);
 extern int tools_get_num_timers(void);
@@ -62,5 +114,39 @@ extern int tools_disable_timer(int id);
 extern int tools_is_timer_enabled(int id);
 extern void *tools_get_timer_data(int id);
 extern int tools_tick_timers(uint32_t pc, uint32_t elapsed);
+extern uint32_t tools_get_next_timer(void);
+
+extern void tools_set_idle_detection(int enable);
+extern uint64_t tools_get_idle_cycles(void);
+extern uint32_t tools_check_idle(uint32_t pc, uint32_t max_skip);
+
+extern int tools_setup_opcode_stats(int enable);
+extern void tools_clear_opcode_stats(void);
+extern const uint64_t *tools_get_opcode_stats(void);
+extern uint64_t tools_get_instr_count(void);
+extern void tools_count_opcode(uint16_t opcode);
+
+/* one coverage bit per 16 bit word of a page */
+#define TOOLS_COVERAGE_PAGE_BYTES 0x1000
+
+extern int tools_setup_coverage(int enable);
+extern void tools_clear_coverage(void);
+extern void tools_mark_coverage(uint32_t pc);
+extern const uint8_t *tools_get_coverage_page(uint32_t page_no);
+extern int tools_merge_coverage_page(uint32_t page_no, const uint8_t *data);
+
+/* result of tools_update_edge_virgin() */
+#define TOOLS_EDGE_NONE       0
+#define TOOLS_EDGE_NEW_COUNT  1
+#define TOOLS_EDGE_NEW_EDGE   2
+
+extern int tools_setup_edge_map(uint32_t size);
+extern uint32_t tools_get_edge_map_size(void);
+extern void tools_clear_edge_map(void);
+extern void tools_clear_edge_virgin(void);
+extern const uint8_t *tools_get_edge_map(void);
+extern void tools_mark_edge(uint32_t pc);
+extern int tools_update_edge_virgin(void);
+extern uint32_t tools_get_num_edges(void);
 
 #endif
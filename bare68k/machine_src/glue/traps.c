@@ -26,6 +26,8 @@ static entry_t traps[NUM_TRAPS];
 static entry_t *first_free;
 static int global_enable = 1;
 static int num_free = 0;
+static int num_calls = 0;
+static trap_call_func_t call_func = NULL;
 
 static int trap_aline(uint opcode, uint pc)
 {
@@ -61,8 +63,18 @@ static int trap_aline(uint opcode, uint pc)
     trap_free(off);
   }
 
-  /* set event when cpu execute() returns */
-  cpu_add_event(CPU_EVENT_ALINE_TRAP, pc, opcode, flags, data);
+  if(flags & TRAP_CALL) {
+    /* call trap function now. only errors generate an event */
+    void *out_data = NULL;
+    int res = call_func(opcode, pc, flags, data, &out_data);
+    if(res == CPU_CB_ERROR) {
+      cpu_add_event(CPU_EVENT_CALLBACK_ERROR, pc, 0, 0, out_data);
+      return M68K_ALINE_NONE;
+    }
+  } else {
+    /* set event when cpu execute() returns */
+    cpu_add_event(CPU_EVENT_ALINE_TRAP, pc, opcode, flags, data);
+  }
 
   if(flags & TRAP_AUTO_RTS) {
     return M68K_ALINE_RTS;
@@ -92,6 +104,7 @@ void traps_init(void)
   traps[NUM_TRAPS-1].data = NULL;
   traps[NUM_TRAPS-1].flags = 0;
   num_free = NUM_TRAPS;
+  num_calls = 0;
 
   /* setup my trap handler */
   m68k_set_aline_hook_callback(trap_aline);
@@ -137,6 +150,11 @@ uint16_t trap_setup_abs(uint16_t id, int flags, void *data)
     return TRAP_INVALID;
   }
 
+  /* call traps need a call function */
+  if((flags & TRAP_CALL) && (call_func == NULL)) {
+    return TRAP_INVALID;
+  }
+
   /* was first free? */
   if(first_free == &traps[id]) {
     first_free = traps[id].next;
@@ -155,6 +173,9 @@ uint16_t trap_setup_abs(uint16_t id, int flags, void *data)
   traps[id].flags = flags | TRAP_SETUP | TRAP_ENABLE;
 
   num_free--;
+  if(flags & TRAP_CALL) {
+    num_calls++;
+  }
 
   return id | 0xa000;
 }
@@ -169,6 +190,9 @@ void *trap_free(uint16_t opcode)
     return NULL;
   }
   data = traps[id].data;
+  if(traps[id].flags & TRAP_CALL) {
+    num_calls--;
+  }
   /* insert trap into free list */
   traps[id].next = first_free;
   if(first_free != NULL) {
@@ -205,3 +229,13 @@ void traps_global_disable(void)
 {
   global_enable = 0;
 }
+
+void traps_set_call_func(trap_call_func_t func)
+{
+  call_func = func;
+}
+
+int traps_has_calls(void)
+{
+  return num_calls > 0;
+}
@@ -15,6 +15,7 @@
 #define TRAP_AUTO_RTS   2
 #define TRAP_SETUP      4
 #define TRAP_ENABLE     8
+#define TRAP_CALL       16  /* call trap func directly instead of an event */
 
 #define TRAP_INVALID    0xffff
 
@@ -24,6 +25,10 @@
 typedef unsigned int uint;
 #endif
 
+/* called for TRAP_CALL traps while the CPU runs.
+   returns CPU_CB_NO_EVENT or CPU_CB_ERROR with error data in out_data */
+typedef int (*trap_call_func_t)(uint16_t opcode, uint32_t pc, int flags, void *data, void **out_data);
+
 /* ----- API ----- */
 extern void traps_init(void);
 extern int traps_shutdown(void);
@@ -40,4 +45,8 @@ extern void trap_disable(uint16_t opcode);
 extern void traps_global_enable(void);
 extern void traps_global_disable(void);
 
+extern void traps_set_call_func(trap_call_func_t func);
+/* return true if TRAP_CALL traps are set up */
+extern int traps_has_calls(void);
+
 #endif
@@ -0,0 +1,24 @@
+from libc.stdint cimport uint8_t, uint32_t
+
+# gstruct.h
+cdef extern from "glue/gstruct.h":
+  int GSTRUCT_U8
+  int GSTRUCT_S8
+  int GSTRUCT_U16
+  int GSTRUCT_S16
+  int GSTRUCT_U32
+  int GSTRUCT_S32
+  int GSTRUCT_CSTR
+  int GSTRUCT_BSTR
+  int GSTRUCT_NUM_TYPES
+  int GSTRUCT_WALK_INVALID
+  int GSTRUCT_WALK_TOO_LONG
+
+  ctypedef struct gstruct_field_t:
+    uint32_t  offset
+    int       type
+
+  int gstruct_get_type_size(int type)
+  int gstruct_read(uint32_t addr, const gstruct_field_t *fields, int num_fields, uint32_t *values)
+  int gstruct_write(uint32_t addr, const gstruct_field_t *fields, int num_fields, const uint32_t *values, const uint8_t *valid)
+  int gstruct_walk(uint32_t first, uint32_t next_offset, int skip_tail, uint32_t *nodes, int max_nodes)
@@ -0,0 +1,116 @@
+# guest structures
+
+cdef class StructLayout:
+  cdef gstruct.gstruct_field_t *fields
+  cdef uint32_t *values
+  cdef uint8_t *valid
+  cdef int num_fields
+
+  def __cinit__(self, object fields):
+    cdef int i
+    cdef int n = len(fields)
+    self.fields = <gstruct.gstruct_field_t *>malloc(max(n, 1) * sizeof(gstruct.gstruct_field_t))
+    self.values = <uint32_t *>malloc(max(n, 1) * sizeof(uint32_t))
+    self.valid = <uint8_t *>malloc(max(n, 1) * sizeof(uint8_t))
+    if self.fields == NULL or self.values == NULL or self.valid == NULL:
+      raise MemoryError("No struct memory!")
+    self.num_fields = n
+    for i in range(n):
+      offset, ftype = fields[i]
+      if gstruct.gstruct_get_type_size(ftype) == 0:
+        raise ValueError("Invalid field type: %d" % ftype)
+      self.fields[i].offset = offset
+      self.fields[i].type = ftype
+
+  def __dealloc__(self):
+    if self.fields != NULL:
+      free(self.fields)
+    if self.values != NULL:
+      free(self.values)
+    if self.valid != NULL:
+      free(self.valid)
+
+  def __len__(self):
+    return self.num_fields
+
+  cdef object _get_value(self, int i):
+    cdef uint32_t val = self.values[i]
+    cdef int ftype = self.fields[i].type
+    cdef uint32_t length
+    cdef const uint8_t *data
+    if ftype == gstruct.GSTRUCT_S8:
+      return <int8_t>val
+    elif ftype == gstruct.GSTRUCT_S16:
+      return <int16_t>val
+    elif ftype == gstruct.GSTRUCT_S32:
+      return <int32_t>val
+    elif ftype == gstruct.GSTRUCT_CSTR:
+      if val == 0:
+        return None
+      data = mem.mem_r_cstr(val, &length)
+      if data == NULL:
+        raise ValueError("Invalid cstr at $%08x" % val)
+      return <bytes>data[:length]
+    elif ftype == gstruct.GSTRUCT_BSTR:
+      if val == 0:
+        return None
+      data = mem.mem_r_bstr(val << 2, &length)
+      if data == NULL:
+        raise ValueError("Invalid bstr at $%08x" % (val << 2))
+      return <bytes>data[:length]
+    else:
+      return val
+
+  cdef tuple _read(self, uint32_t addr):
+    cdef int i
+    if gstruct.gstruct_read(addr, self.fields, self.num_fields, self.values) == 0:
+      raise ValueError("Invalid struct at $%08x" % addr)
+    return tuple([self._get_value(i) for i in range(self.num_fields)])
+
+  def read(self, uint32_t addr):
+    result = self._read(addr)
+    _handle_api_exc()
+    return result
+
+  def write(self, uint32_t addr, object values):
+    cdef int i
+    if len(values) != self.num_fields:
+      raise ValueError("Invalid number of values: %d" % len(values))
+    for i in range(self.num_fields):
+      val = values[i]
+      if val is None:
+        self.valid[i] = 0
+      else:
+        self.values[i] = val & 0xffffffff
+        self.valid[i] = 1
+    if gstruct.gstruct_write(addr, self.fields, self.num_fields,
+                             self.values, self.valid) == 0:
+      raise ValueError("Invalid struct at $%08x" % addr)
+    _handle_api_exc()
+
+  def read_list(self, uint32_t first, uint32_t next_offset,
+                bool skip_tail=False, int max_nodes=4096):
+    nodes = struct_walk_list(first, next_offset, skip_tail, max_nodes)
+    result = [(addr, self._read(addr)) for addr in nodes]
+    _handle_api_exc()
+    return result
+
+def struct_walk_list(uint32_t first, uint32_t next_offset,
+                     bool skip_tail=False, int max_nodes=4096):
+  cdef uint32_t *nodes
+  cdef int n, i
+  if max_nodes <= 0:
+    raise ValueError("Invalid max nodes: %d" % max_nodes)
+  nodes = <uint32_t *>malloc(max_nodes * sizeof(uint32_t))
+  if nodes == NULL:
+    raise MemoryError("No list memory!")
+  n = gstruct.gstruct_walk(first, next_offset, skip_tail, nodes, max_nodes)
+  if n >= 0:
+    result = [nodes[i] for i in range(n)]
+  free(nodes)
+  if n == gstruct.GSTRUCT_WALK_INVALID:
+    raise ValueError("Invalid list node in list at $%08x" % first)
+  elif n == gstruct.GSTRUCT_WALK_TOO_LONG:
+    raise ValueError("List at $%08x has more than %d nodes" % (first, max_nodes))
+  _handle_api_exc()
+  return result
@@ -0,0 +1,28 @@
+from libc.stdint cimport uint32_t
+
+# heap.h
+cdef extern from "glue/heap.h":
+  int HEAP_FLAG_CLEAR
+
+  ctypedef struct heap_stats_t:
+    uint32_t  total_bytes
+    uint32_t  used_bytes
+    uint32_t  free_bytes
+    uint32_t  peak_used_bytes
+    uint32_t  largest_free
+    uint32_t  num_allocs
+    uint32_t  num_free_blocks
+    uint32_t  total_allocs
+    uint32_t  failed_allocs
+
+  ctypedef struct heap_t:
+    pass
+
+  heap_t *heap_create(uint32_t start, uint32_t size, uint32_t granularity)
+  void heap_destroy(heap_t *heap)
+  uint32_t heap_alloc(heap_t *heap, uint32_t size, uint32_t align, int flags)
+  uint32_t heap_free(heap_t *heap, uint32_t addr)
+  uint32_t heap_realloc(heap_t *heap, uint32_t addr, uint32_t size, int flags)
+  uint32_t heap_get_size(heap_t *heap, uint32_t addr)
+  void heap_clear(heap_t *heap)
+  void heap_get_stats(heap_t *heap, heap_stats_t *stats)
@@ -0,0 +1,61 @@
+# guest heap
+
+cdef class Heap:
+  cdef heap.heap_t *heap
+  cdef readonly uint32_t start
+  cdef readonly uint32_t size
+
+  def __cinit__(self, uint32_t start, uint32_t size, uint32_t granularity=4):
+    self.heap = heap.heap_create(start, size, granularity)
+    if self.heap == NULL:
+      raise ValueError("Invalid heap range $%08x+$%08x" % (start, size))
+    self.start = start
+    self.size = size & ~(granularity - 1)
+
+  def __dealloc__(self):
+    if self.heap != NULL:
+      heap.heap_destroy(self.heap)
+
+  def alloc(self, uint32_t size, uint32_t align=0, bool clear=False):
+    cdef int flags = heap.HEAP_FLAG_CLEAR if clear else 0
+    cdef uint32_t addr
+    if align & (align - 1):
+      raise ValueError("Invalid alignment: %d" % align)
+    addr = heap.heap_alloc(self.heap, size, align, flags)
+    if clear:
+      _handle_api_exc()
+    return addr
+
+  def free(self, uint32_t addr):
+    cdef uint32_t size = heap.heap_free(self.heap, addr)
+    if size == 0:
+      raise ValueError("Invalid heap address $%08x" % addr)
+    return size
+
+  def realloc(self, uint32_t addr, uint32_t size, bool clear=False):
+    cdef int flags = heap.HEAP_FLAG_CLEAR if clear else 0
+    cdef uint32_t new_addr
+    if addr != 0 and heap.heap_get_size(self.heap, addr) == 0:
+      raise ValueError("Invalid heap address $%08x" % addr)
+    new_addr = heap.heap_realloc(self.heap, addr, size, flags)
+    _handle_api_exc()
+    return new_addr
+
+  def get_size(self, uint32_t addr):
+    cdef uint32_t size = heap.heap_get_size(self.heap, addr)
+    if size == 0:
+      raise ValueError("Invalid heap address $%08x" % addr)
+    return size
+
+  def is_allocated(self, uint32_t addr):
+    return heap.heap_get_size(self.heap, addr) != 0
+
+  def clear(self):
+    heap.heap_clear(self.heap)
+
+  def get_stats(self):
+    cdef heap.heap_stats_t s
+    heap.heap_get_stats(self.heap, &s)
+    return (s.total_bytes, s.used_bytes, s.free_bytes, s.peak_used_bytes,
+            s.largest_free, s.num_allocs, s.num_free_blocks,
+            s.total_allocs, s.failed_allocs)
@@ -0,0 +1,26 @@
+from libc.stdint cimport uint32_t, uint64_t
+
+# irq.h
+cdef extern from "glue/irq.h":
+
+  cdef enum:
+    IRQ_MAX_ENTRIES = 32
+    IRQ_INVALID = -1
+
+  cdef enum:
+    IRQ_ACK_DYNAMIC = 0xfffffffd
+
+  void irq_init()
+  void irq_free()
+
+  int irq_schedule(int level, uint64_t cycle, uint32_t duration,
+                   uint32_t period, uint32_t vector)
+  int irq_cancel(int id)
+  void irq_cancel_all()
+  int irq_get_num_entries()
+  int irq_is_active(int id)
+
+  int irq_get_level()
+
+  int irq_set_ack_vector(int level, uint32_t vector, int auto_clear)
+  uint32_t irq_get_ack_vector(int level)
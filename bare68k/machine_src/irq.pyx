@@ -0,0 +1,47 @@
+# irq scheduler
+
+def get_max_irqs():
+  return irq.IRQ_MAX_ENTRIES
+
+def get_num_irqs():
+  return irq.irq_get_num_entries()
+
+def schedule_irq(int level, uint64_t delay, uint32_t duration=0,
+                 uint32_t period=0,
+                 uint32_t vector=musashi.M68K_INT_ACK_AUTOVECTOR):
+  cdef uint64_t cycle = cpu.cpu_get_clock() + delay
+  cdef int irq_id
+  if level < 1 or level > 7:
+    raise ValueError("Invalid irq level: %d" % level)
+  irq_id = irq.irq_schedule(level, cycle, duration, period, vector)
+  if irq_id == irq.IRQ_INVALID:
+    raise MemoryError("No free irq entry!")
+  return irq_id
+
+def cancel_irq(int irq_id):
+  if irq.irq_cancel(irq_id) == irq.IRQ_INVALID:
+    raise ValueError("Invalid irq id!")
+
+def cancel_all_irqs():
+  irq.irq_cancel_all()
+
+def is_irq_active(int irq_id):
+  return irq.irq_is_active(irq_id) != 0
+
+def get_irq_level():
+  return irq.irq_get_level()
+
+# int ack vector table
+
+def set_int_ack_vector(int level, uint32_t vector, bool auto_clear=True):
+  if vector > 255 and vector != musashi.M68K_INT_ACK_AUTOVECTOR and \
+     vector != musashi.M68K_INT_ACK_SPURIOUS and \
+     vector != irq.IRQ_ACK_DYNAMIC:
+    raise ValueError("Invalid int ack vector: %08x" % vector)
+  if irq.irq_set_ack_vector(level, vector, auto_clear) == irq.IRQ_INVALID:
+    raise ValueError("Invalid irq level: %d" % level)
+
+def get_int_ack_vector(int level):
+  if level < 1 or level > 7:
+    raise ValueError("Invalid irq level: %d" % level)
+  return irq.irq_get_ack_vector(level)
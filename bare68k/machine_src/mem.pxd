@@ -28,6 +28,7 @@ cdef extern from "glue/mem.h":
   void mem_free()
 
   unsigned int mem_get_page_shift()
+  unsigned int mem_get_sub_page_shift()
   unsigned int mem_get_num_pages()
   void mem_set_invalid_value(uint32_t value)
 
@@ -41,6 +42,13 @@ cdef extern from "glue/mem.h":
   int mem_add_empty(unsigned int start_page, unsigned int num_pages, int flags, uint32_t value)
   int mem_add_mirror(unsigned int start_page, unsigned int num_pages, int flags, unsigned int base_page)
 
+  special_entry_t *mem_add_special_sub(unsigned int start_sub, unsigned int num_subs,
+                           special_read_func_t read_func, void *read_data,
+                           special_write_func_t write_func, void *write_data)
+  int mem_add_empty_sub(unsigned int start_sub, unsigned int num_subs, int flags, uint32_t value)
+  int mem_is_split_page(unsigned int page_no)
+  unsigned int mem_get_num_page_blocks()
+
   void mem_set_cpu_trace_func(cpu_trace_func_t func)
   void mem_set_api_trace_func(api_trace_func_t func)
 
@@ -60,6 +68,8 @@ cdef extern from "glue/mem.h":
   int mem_copy_block(uint32_t src_addr, uint32_t tgt_addr, uint32_t size)
   const uint8_t *mem_r_block(uint32_t address, uint32_t size)
   int mem_w_block(uint32_t address, uint32_t size, const uint8_t *src_data)
+  int mem_r_array(uint32_t address, uint32_t count, int width, void *values)
+  int mem_w_array(uint32_t address, uint32_t count, int width, const void *values)
 
   const uint8_t *mem_r_cstr(uint32_t address, uint32_t *length)
   int mem_w_cstr(uint32_t address, const uint8_t *str, uint32_t length)
@@ -78,6 +88,11 @@ cdef extern from "glue/mem.h":
   int mem_w16(uint32_t address, uint16_t value)
   int mem_w32(uint32_t address, uint32_t value)
 
+  int mem_snapshot_take()
+  uint32_t mem_snapshot_restore()
+  void mem_snapshot_free()
+  int mem_has_snapshot()
+
   void mem_disasm_buffer(const uint8_t *buf, uint32_t size, uint32_t offset)
   void mem_disasm_memory()
 
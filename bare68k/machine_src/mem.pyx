@@ -96,6 +96,58 @@ def add_mirror(uint16_t start_page, uint16_t num_pages, int flags, uint16_t base
     raise ValueError("Invalid mirror: start=%d, num=%d, base=%d" % (start_page, num_pages, base_page))
   return <uint32_t>(start_page << 16)
 
+# configure sub page ranges (4K granularity)
+
+def get_sub_page_shift():
+  return mem.mem_get_sub_page_shift()
+
+def add_special_sub(uint32_t start_sub, uint32_t num_subs, read_func, write_func):
+  cdef mem.special_entry_t *se
+  cdef void *r_func = NULL
+  cdef void *w_func = NULL
+
+  if read_func is not None:
+    Py_INCREF(read_func)
+    r_func = <void *>read_func
+
+  if write_func is not None:
+    Py_INCREF(write_func)
+    w_func = <void *>write_func
+
+  se = mem.mem_add_special_sub(start_sub, num_subs,
+                               mem_special_adapter_r, r_func,
+                               mem_special_adapter_w, w_func)
+  if se == NULL:
+    raise ValueError("Invalid special sub: start=%d, num=%d" % (start_sub, num_subs))
+  return <uint32_t>(start_sub << mem.mem_get_sub_page_shift())
+
+def add_empty_sub(uint32_t start_sub, uint32_t num_subs, int flags, uint32_t value):
+  cdef int res = mem.mem_add_empty_sub(start_sub, num_subs, flags, value)
+  if res == 0:
+    raise ValueError("Invalid empty sub: start=%d, num=%d" % (start_sub, num_subs))
+  return <uint32_t>(start_sub << mem.mem_get_sub_page_shift())
+
+def is_split_page(uint32_t page_no):
+  return mem.mem_is_split_page(page_no) != 0
+
+def get_num_page_blocks():
+  return mem.mem_get_num_page_blocks()
+
+# snapshot
+
+def take_snapshot():
+  if not mem.mem_snapshot_take():
+    raise MemoryError("No snapshot memory!")
+
+def restore_snapshot():
+  return mem.mem_snapshot_restore()
+
+def free_snapshot():
+  mem.mem_snapshot_free()
+
+def has_snapshot():
+  return mem.mem_has_snapshot() != 0
+
 # memory trace cpu
 
 cdef object mem_cpu_trace_func = None
@@ -223,6 +275,78 @@ def w_block(uint32_t addr, bytes data):
   else:
     _handle_api_exc()
 
+# typed big endian arrays
+
+cdef _r_array(uint32_t addr, uint32_t count, int width, str typecode):
+  cdef array.array res = array.array(typecode)
+  if count == 0:
+    return res
+  array.resize(res, count)
+  cdef int ok = mem.mem_r_array(addr, count, width, res.data.as_voidptr)
+  if ok == 0:
+    raise ValueError("Invalid address $%08x" % addr)
+  else:
+    _handle_api_exc()
+    return res
+
+cdef _w_array(uint32_t addr, object values, int width, str typecode):
+  cdef const uint8_t[::1] raw
+  cdef uint32_t size
+  cdef int ok
+  try:
+    view = memoryview(values)
+  except TypeError:
+    view = memoryview(array.array(typecode, values))
+  if view.itemsize != width or not view.c_contiguous:
+    # store the element values of other buffers
+    view = memoryview(array.array(typecode, view.tolist()))
+  size = view.nbytes
+  if size == 0:
+    return
+  raw = view.cast('B')
+  # big endian buffers (e.g. numpy '>u2') are already in guest order
+  if view.format[0] in '>!':
+    ok = mem.mem_w_block(addr, size, &raw[0])
+  else:
+    ok = mem.mem_w_array(addr, size / width, width, &raw[0])
+  if ok == 0:
+    raise ValueError("Invalid address $%08x" % addr)
+  else:
+    _handle_api_exc()
+
+def r16_array(uint32_t addr, uint32_t count):
+  return _r_array(addr, count, 2, 'H')
+
+def r32_array(uint32_t addr, uint32_t count):
+  return _r_array(addr, count, 4, 'I')
+
+def rs16_array(uint32_t addr, uint32_t count):
+  return _r_array(addr, count, 2, 'h')
+
+def rs32_array(uint32_t addr, uint32_t count):
+  return _r_array(addr, count, 4, 'i')
+
+def w16_array(uint32_t addr, object values):
+  _w_array(addr, values, 2, 'H')
+
+def w32_array(uint32_t addr, object values):
+  _w_array(addr, values, 4, 'I')
+
+def ws16_array(uint32_t addr, object values):
+  _w_array(addr, values, 2, 'h')
+
+def ws32_array(uint32_t addr, object values):
+  _w_array(addr, values, 4, 'i')
+
+def r_numpy(uint32_t addr, uint32_t count, object dtype='>u2'):
+  import numpy
+  dt = numpy.dtype(dtype)
+  if dt.byteorder == '<' or (dt.byteorder == '=' and dt.itemsize > 1 and
+                             sys.byteorder == 'little'):
+    dt = dt.newbyteorder('>')
+  data = r_block(addr, count * dt.itemsize)
+  return numpy.frombuffer(data, dtype=dt)
+
 # special access
 
 def r_cstr(uint32_t addr):
@@ -1,15 +1,31 @@
-from libc.stdint cimport uint32_t
+from libc.stdint cimport uint8_t, uint32_t, uint64_t
 
 # tools.h
 cdef extern from "glue/tools.h":
 
   ctypedef void (*free_func_t)(void *data)
 
+  cdef enum:
+    TOOLS_PC_TRACE_ALL
+    TOOLS_PC_TRACE_BRANCH
+    TOOLS_COND_MAX_TERMS
+    TOOLS_COND_HITS
+    TOOLS_COND_SGE
+
+  ctypedef struct tools_cond_term_t:
+    uint8_t kind
+    uint8_t op
+    uint32_t arg
+    uint32_t mask
+    uint32_t value
+
   void tools_init()
   void tools_free()
 
   int tools_get_pc_trace_size()
   int tools_setup_pc_trace(int num)
+  int tools_pc_trace_mode
+  void tools_set_pc_trace_mode(int mode)
   uint32_t *tools_get_pc_trace(int *size)
   void tools_free_pc_trace(uint32_t *data)
 
@@ -24,6 +40,9 @@ cdef extern from "glue/tools.h":
   int tools_is_breakpoint_enabled(int id)
   void *tools_get_breakpoint_data(int id)
   int tools_check_breakpoint(uint32_t addr, int flags)
+  int tools_set_breakpoint_cond(int id, const tools_cond_term_t *terms, int num)
+  int tools_get_breakpoint_hits(uint64_t *hits, int max)
+  void tools_clear_breakpoint_hits()
 
   int tools_get_num_watchpoints()
   int tools_get_max_watchpoints()
@@ -35,7 +54,10 @@ cdef extern from "glue/tools.h":
   int tools_disable_watchpoint(int id)
   int tools_is_watchpoint_enabled(int id)
   void *tools_get_watchpoint_data(int id)
-  int tools_check_watchpoint(uint32_t addr, int flags)
+  int tools_check_watchpoint(uint32_t addr, int flags, uint32_t value)
+  int tools_set_watchpoint_cond(int id, const tools_cond_term_t *terms, int num)
+  int tools_get_watchpoint_hits(uint64_t *hits, int max)
+  void tools_clear_watchpoint_hits()
 
   int tools_get_num_timers()
   int tools_get_max_timers()
@@ -48,3 +70,37 @@ cdef extern from "glue/tools.h":
   int tools_is_timer_enabled(int id)
   void *tools_get_timer_data(int id)
   int tools_tick_timers(uint32_t pc, uint32_t elapsed)
+  uint32_t tools_get_next_timer()
+
+  int tools_idle_enabled
+  void tools_set_idle_detection(int enable)
+  uint64_t tools_get_idle_cycles()
+
+  int tools_opcode_stats_enabled
+  int tools_setup_opcode_stats(int enable)
+  void tools_clear_opcode_stats()
+  const uint64_t *tools_get_opcode_stats()
+  uint64_t tools_get_instr_count()
+
+  cdef enum:
+    TOOLS_COVERAGE_PAGE_BYTES = 0x1000
+
+  int tools_coverage_enabled
+  int tools_setup_coverage(int enable)
+  void tools_clear_coverage()
+  const uint8_t *tools_get_coverage_page(uint32_t page_no)
+  int tools_merge_coverage_page(uint32_t page_no, const uint8_t *data)
+
+  cdef enum:
+    TOOLS_EDGE_NONE
+    TOOLS_EDGE_NEW_COUNT
+    TOOLS_EDGE_NEW_EDGE
+
+  int tools_edge_map_enabled
+  int tools_setup_edge_map(uint32_t size)
+  uint32_t tools_get_edge_map_size()
+  void tools_clear_edge_map()
+  void tools_clear_edge_virgin()
+  const uint8_t *tools_get_edge_map()
+  int tools_update_edge_virgin()
+  uint32_t tools_get_num_edges()
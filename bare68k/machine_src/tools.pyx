@@ -1,3 +1,29 @@
+# break/watch point conditions
+
+cdef int _fill_cond(tools.tools_cond_term_t *terms, object cond) except -1:
+  cdef int num = 0
+  if cond is None:
+    return 0
+  if len(cond) > tools.TOOLS_COND_MAX_TERMS:
+    raise ValueError("Too many condition terms!")
+  for term in cond:
+    if len(term) == 4:
+      kind, arg, op, value = term
+      mask = 0xffffffff
+    else:
+      kind, arg, op, value, mask = term
+    if kind < 0 or kind > tools.TOOLS_COND_HITS:
+      raise ValueError("Invalid condition kind: %d" % kind)
+    if op < 0 or op > tools.TOOLS_COND_SGE:
+      raise ValueError("Invalid condition op: %d" % op)
+    terms[num].kind = kind
+    terms[num].op = op
+    terms[num].arg = arg
+    terms[num].mask = mask
+    terms[num].value = value & 0xffffffff
+    num += 1
+  return num
+
 # cpu pc trace
 
 def get_pc_trace_size():
@@ -23,6 +49,22 @@ def get_pc_trace():
   tools.tools_free_pc_trace(data)
   return a
 
+def set_pc_trace_mode(int mode):
+  if mode != tools.TOOLS_PC_TRACE_ALL and mode != tools.TOOLS_PC_TRACE_BRANCH:
+    raise ValueError("Invalid pc trace mode: %d" % mode)
+  tools.tools_set_pc_trace_mode(mode)
+
+def get_pc_trace_mode():
+  return tools.tools_pc_trace_mode
+
+def get_branch_trace():
+  if tools.tools_pc_trace_mode != tools.TOOLS_PC_TRACE_BRANCH:
+    return None
+  a = get_pc_trace()
+  if a is None:
+    return None
+  return list(zip(a[0::2], a[1::2]))
+
 # breakpoints
 
 def get_max_breakpoints():
@@ -93,6 +135,28 @@ def check_breakpoint(uint32_t addr, int flags):
   else:
     return bp_id
 
+def get_breakpoint_hits():
+  cdef int num = tools.tools_get_max_breakpoints()
+  cdef uint64_t *hits
+  if num == 0:
+    return []
+  hits = <uint64_t *>malloc(sizeof(uint64_t) * num)
+  if hits == NULL:
+    raise MemoryError("No hits memory!")
+  num = tools.tools_get_breakpoint_hits(hits, num)
+  result = [hits[i] for i in range(num)]
+  free(hits)
+  return result
+
+def clear_breakpoint_hits():
+  tools.tools_clear_breakpoint_hits()
+
+def set_breakpoint_condition(int bp_id, object cond):
+  cdef tools.tools_cond_term_t terms[tools.TOOLS_COND_MAX_TERMS]
+  cdef int num = _fill_cond(terms, cond)
+  if tools.tools_set_breakpoint_cond(bp_id, terms, num) < 0:
+    raise ValueError("Invalid breakpoint index!")
+
 # watchpoints
 
 def get_max_watchpoints():
@@ -156,13 +220,35 @@ def get_watchpoint_data(int bp_id):
   else:
     return None
 
-def check_watchpoint(uint32_t addr, int flags):
-  cdef int bp_id = tools.tools_check_watchpoint(addr, flags)
+def check_watchpoint(uint32_t addr, int flags, uint32_t value=0):
+  cdef int bp_id = tools.tools_check_watchpoint(addr, flags, value)
   if bp_id < 0:
     return None
   else:
     return bp_id
 
+def get_watchpoint_hits():
+  cdef int num = tools.tools_get_max_watchpoints()
+  cdef uint64_t *hits
+  if num == 0:
+    return []
+  hits = <uint64_t *>malloc(sizeof(uint64_t) * num)
+  if hits == NULL:
+    raise MemoryError("No hits memory!")
+  num = tools.tools_get_watchpoint_hits(hits, num)
+  result = [hits[i] for i in range(num)]
+  free(hits)
+  return result
+
+def clear_watchpoint_hits():
+  tools.tools_clear_watchpoint_hits()
+
+def set_watchpoint_condition(int bp_id, object cond):
+  cdef tools.tools_cond_term_t terms[tools.TOOLS_COND_MAX_TERMS]
+  cdef int num = _fill_cond(terms, cond)
+  if tools.tools_set_watchpoint_cond(bp_id, terms, num) < 0:
+    raise ValueError("Invalid watchpoint index!")
+
 # timers
 
 def get_max_timers():
@@ -228,3 +314,110 @@ def get_timer_data(int bp_id):
 
 def tick_timers(uint32_t pc, uint32_t elapsed):
   return tools.tools_tick_timers(pc, elapsed)
+
+def get_next_timer():
+  return tools.tools_get_next_timer()
+
+# idle detection
+
+def set_idle_detection(bool enable):
+  tools.tools_set_idle_detection(enable)
+
+def is_idle_detection_enabled():
+  return tools.tools_idle_enabled != 0
+
+def get_idle_cycles():
+  return tools.tools_get_idle_cycles()
+
+# opcode stats
+
+def setup_opcode_stats(bool enable):
+  if tools.tools_setup_opcode_stats(enable) < 0:
+    raise MemoryError("No opcode stats memory!")
+
+def is_opcode_stats_enabled():
+  return tools.tools_opcode_stats_enabled != 0
+
+def clear_opcode_stats():
+  tools.tools_clear_opcode_stats()
+
+def get_instr_count():
+  return tools.tools_get_instr_count()
+
+def get_opcode_stats():
+  cdef const uint64_t *stats = tools.tools_get_opcode_stats()
+  cdef dict result = {}
+  cdef int i
+  if stats == NULL:
+    return None
+  for i in range(0x10000):
+    if stats[i] != 0:
+      result[i] = stats[i]
+  return result
+
+# coverage
+
+def setup_coverage(bool enable):
+  if tools.tools_setup_coverage(enable) < 0:
+    raise MemoryError("No coverage memory!")
+
+def is_coverage_enabled():
+  return tools.tools_coverage_enabled != 0
+
+def clear_coverage():
+  tools.tools_clear_coverage()
+
+def get_coverage_page_size():
+  return tools.TOOLS_COVERAGE_PAGE_BYTES
+
+def get_coverage():
+  cdef dict result = {}
+  cdef const uint8_t *data
+  cdef uint32_t page_no
+  cdef uint32_t num_pages = mem.mem_get_num_pages()
+  if not tools.tools_coverage_enabled:
+    return None
+  for page_no in range(num_pages):
+    data = tools.tools_get_coverage_page(page_no)
+    if data != NULL:
+      result[page_no] = <bytes>data[:tools.TOOLS_COVERAGE_PAGE_BYTES]
+  return result
+
+def merge_coverage(uint32_t page_no, bytes data):
+  cdef const uint8_t *ptr = data
+  if len(data) != tools.TOOLS_COVERAGE_PAGE_BYTES:
+    raise ValueError("Invalid coverage page size!")
+  if tools.tools_merge_coverage_page(page_no, ptr) < 0:
+    raise ValueError("Invalid coverage page: %d" % page_no)
+
+# edge map
+
+def setup_edge_map(uint32_t size):
+  if size & (size - 1) != 0:
+    raise ValueError("Invalid edge map size: %d" % size)
+  if tools.tools_setup_edge_map(size) < 0:
+    raise MemoryError("No edge map memory!")
+
+def is_edge_map_enabled():
+  return tools.tools_edge_map_enabled != 0
+
+def get_edge_map_size():
+  return tools.tools_get_edge_map_size()
+
+def clear_edge_map():
+  tools.tools_clear_edge_map()
+
+def clear_edge_virgin():
+  tools.tools_clear_edge_virgin()
+
+def get_edge_map():
+  cdef const uint8_t *data = tools.tools_get_edge_map()
+  if data == NULL:
+    return None
+  return <bytes>data[:tools.tools_get_edge_map_size()]
+
+def update_edge_virgin():
+  return tools.tools_update_edge_virgin()
+
+def get_num_edges():
+  return tools.tools_get_num_edges()
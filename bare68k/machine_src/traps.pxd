@@ -1,4 +1,4 @@
-from libc.stdint cimport uint16_t
+from libc.stdint cimport uint16_t, uint32_t
 
 # traps.h
 cdef extern from "glue/traps.h":
@@ -8,9 +8,14 @@ cdef extern from "glue/traps.h":
     TRAP_ONE_SHOT = 1
     TRAP_AUTO_RTS = 2
 
+  cdef enum:
+    TRAP_CALL = 16
+
   cdef enum:
     TRAP_INVALID = 0xffff
 
+  ctypedef int (*trap_call_func_t)(uint16_t opcode, uint32_t pc, int flags, void *data, void **out_data)
+
   void traps_init()
   int traps_shutdown()
 
@@ -25,3 +30,6 @@ cdef extern from "glue/traps.h":
 
   void traps_global_enable()
   void traps_global_disable()
+
+  void traps_set_call_func(trap_call_func_t func)
+  int traps_has_calls()
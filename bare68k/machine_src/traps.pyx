@@ -18,6 +18,95 @@ def trap_setup_abs(uint16_t tid, int flags, object call not None):
   else:
     raise MemoryError("no more traps!")
 
+# traps with a register signature called directly by the cpu
+
+cdef class TrapCall:
+  cdef readonly object func
+  cdef readonly tuple arg_regs
+  cdef readonly int ret_reg
+  cdef int args[16]
+  cdef int num_args
+
+  def __cinit__(self, object func not None, object arg_regs=(), object ret_reg=None):
+    cdef int i
+    self.func = func
+    self.arg_regs = tuple(arg_regs)
+    self.num_args = len(self.arg_regs)
+    if self.num_args > 16:
+      raise ValueError("Too many trap args: %d" % self.num_args)
+    for i in range(self.num_args):
+      self.args[i] = _check_trap_reg(self.arg_regs[i])
+    if ret_reg is None:
+      self.ret_reg = -1
+    else:
+      self.ret_reg = _check_trap_reg(ret_reg)
+
+  def __repr__(self):
+    return "TrapCall(%r, %r, %r)" % (self.func, self.arg_regs,
+                                     None if self.ret_reg < 0 else self.ret_reg)
+
+  cdef invoke(self):
+    cdef int *a = self.args
+    cdef int i
+    cdef int n = self.num_args
+    if n == 0:
+      result = self.func()
+    elif n == 1:
+      result = self.func(cpu.cpu_r_reg(a[0]))
+    elif n == 2:
+      result = self.func(cpu.cpu_r_reg(a[0]), cpu.cpu_r_reg(a[1]))
+    elif n == 3:
+      result = self.func(cpu.cpu_r_reg(a[0]), cpu.cpu_r_reg(a[1]),
+                         cpu.cpu_r_reg(a[2]))
+    else:
+      result = self.func(*[cpu.cpu_r_reg(a[i]) for i in range(n)])
+    if self.ret_reg >= 0 and result is not None:
+      cpu.cpu_w_reg(self.ret_reg, result & 0xffffffff)
+
+cdef int _check_trap_reg(object reg) except -1:
+  if reg < musashi.M68K_REG_D0 or reg > musashi.M68K_REG_SR:
+    raise ValueError("Invalid trap register: %r" % (reg,))
+  return reg
+
+cdef int trap_call_wrapper(uint16_t opcode, uint32_t pc, int flags,
+                           void *data, void **out_data):
+  cdef TrapCall call = <TrapCall>data
+  cdef int res = cpu.CPU_CB_NO_EVENT
+  try:
+    call.invoke()
+  except:
+    exc_info = sys.exc_info()
+    Py_INCREF(exc_info)
+    out_data[0] = <void *>exc_info
+    res = cpu.CPU_CB_ERROR
+  # the trap entry of a one shot trap is already gone
+  if flags & traps.TRAP_ONE_SHOT:
+    Py_DECREF(call)
+  return res
+
+def trap_setup_call(int flags, object func not None, object args=(), object ret=None):
+  cdef uint16_t op
+  cdef TrapCall call = TrapCall(func, args, ret)
+  traps.traps_set_call_func(trap_call_wrapper)
+  op = traps.trap_setup(flags | traps.TRAP_CALL, <void *>call)
+  if op != traps.TRAP_INVALID:
+    Py_INCREF(call)
+    return op
+  else:
+    raise MemoryError("no more traps!")
+
+def trap_setup_call_abs(uint16_t tid, int flags, object func not None,
+                        object args=(), object ret=None):
+  cdef uint16_t op
+  cdef TrapCall call = TrapCall(func, args, ret)
+  traps.traps_set_call_func(trap_call_wrapper)
+  op = traps.trap_setup_abs(tid, flags | traps.TRAP_CALL, <void *>call)
+  if op != traps.TRAP_INVALID:
+    Py_INCREF(call)
+    return op
+  else:
+    raise MemoryError("no more traps!")
+
 def trap_free(uint16_t tid):
   cdef void *data
   cdef object callable
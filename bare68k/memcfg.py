@@ -13,6 +13,11 @@ PAGE_BYTES = 64 * 1024
 PAGE_MASK = 0xffff
 PAGE_SHIFT = 16
 
+SUB_PAGE_BYTES = 4 * 1024
+SUB_PAGE_MASK = 0xfff
+SUB_PAGE_SHIFT = 12
+SUB_PAGES = PAGE_BYTES // SUB_PAGE_BYTES
+
 
 class MemoryRange(object):
 
@@ -38,6 +43,27 @@ class MemoryRange(object):
             and self.traps == o.traps
 
 
+class MemorySubRange(object):
+    """a range of 4K sub pages that overlays the page ranges"""
+
+    def __init__(self, start_sub, num_subs, mem_type, opts=None, name=None):
+        self.start_sub = start_sub
+        self.num_subs = num_subs
+        self.mem_type = mem_type
+        self.opts = opts
+        self.name = name
+        self.next_sub = self.start_sub + self.num_subs
+        self.start_addr = start_sub << SUB_PAGE_SHIFT
+
+    def __repr__(self):
+        return "MemorySubRange(%d, %d, %s, opts=%r, name=%s)" % \
+            (self.start_sub, self.num_subs, self.mem_type, self.opts, self.name)
+
+    def __eq__(self, o):
+        return self.start_sub == o.start_sub and self.num_subs == o.num_subs \
+            and self.mem_type == o.mem_type and self.opts == o.opts
+
+
 class MemoryConfig(object):
     """Configuration class for the memory layout of your m68k system"""
 
@@ -47,6 +73,8 @@ class MemoryConfig(object):
         self.auto_align = auto_align
         # page list to see allocation
         self.range_list = []
+        # sub page ranges overlaying the pages
+        self.sub_range_list = []
 
     def _get_str_size(self, size_str, def_units):
         """get a size value from a string an honor K,M,G units
@@ -96,6 +124,24 @@ class MemoryConfig(object):
             pages = total >> PAGE_SHIFT
         return pages
 
+    def _get_num_subs(self, size, units):
+        """get a size value and make sure its sub page aligned and return the sub pages"""
+        if type(size) is str:
+            n_size, n_units = self._get_str_size(size, units)
+            total = n_size * n_units
+        else:
+            total = size * units
+        # is 4k sub page aligned?
+        if total & SUB_PAGE_MASK != 0:
+            if self.auto_align:
+                subs = (total + SUB_PAGE_MASK) >> SUB_PAGE_SHIFT
+            else:
+                raise ConfigError(
+                    "Size value %s (units %s) is not sub page aligned!" % (size, units))
+        else:
+            subs = total >> SUB_PAGE_SHIFT
+        return subs
+
     def _get_page_addr(self, addr):
         """convert an absolute address to a page number"""
         return self._get_num_pages(addr, 1)
@@ -146,6 +192,21 @@ class MemoryConfig(object):
             res.append(r)
             return res
 
+    def _store_sub_range(self, begin_sub, num_subs, mem_type,
+                         opts=None, name=None):
+        """add a sub page range. it may overlay page ranges but no other sub range"""
+        r = MemorySubRange(begin_sub, num_subs, mem_type, opts, name)
+        rl = self.sub_range_list
+        pos = 0
+        for e in rl:
+            if r.next_sub <= e.start_sub:
+                break
+            elif r.start_sub < e.next_sub:
+                raise ConfigError("%r overlaps %r!" % (r, e))
+            pos += 1
+        rl.insert(pos, r)
+        return [r]
+
     def _prepare_rom(self, data, pad):
         if data is None:
             return None
@@ -198,6 +259,19 @@ class MemoryConfig(object):
         return self._store_page_range(begin_page, num_pages, MEM_RESERVE,
                                       name=name)
 
+    # sub page based
+
+    def add_special_sub_range(self, begin_sub, num_subs, r_func, w_func,
+                              name=None):
+        opts = (r_func, w_func)
+        return self._store_sub_range(begin_sub, num_subs, MEM_SPECIAL,
+                                     opts=opts, name=name)
+
+    def add_empty_sub_range(self, begin_sub, num_subs, value=0xffffffff,
+                            name=None):
+        return self._store_sub_range(begin_sub, num_subs, MEM_EMPTY,
+                                     opts=value, name=name)
+
     # address based
 
     def add_ram_range_addr(self, begin_addr, size,
@@ -243,12 +317,30 @@ class MemoryConfig(object):
         return self.add_reserve_range(begin_page, num_pages,
                                       name=name)
 
+    def add_special_sub_range_addr(self, begin_addr, size, r_func, w_func,
+                                   units=1024, name=None):
+        begin_sub = self._get_num_subs(begin_addr, 1)
+        num_subs = self._get_num_subs(size, units)
+        return self.add_special_sub_range(begin_sub, num_subs, r_func, w_func,
+                                          name=name)
+
+    def add_empty_sub_range_addr(self, begin_addr, size,
+                                 value=0xffffffff, units=1024, name=None):
+        begin_sub = self._get_num_subs(begin_addr, 1)
+        num_subs = self._get_num_subs(size, units)
+        return self.add_empty_sub_range(begin_sub, num_subs, value,
+                                        name=name)
+
     # get result
 
     def get_range_list(self):
         """return the list of memory ranges currently allocated"""
         return self.range_list
 
+    def get_sub_range_list(self):
+        """return the list of sub page ranges overlaying the pages"""
+        return self.sub_range_list
+
     def get_page_list_str(self):
         """return a string showing page allocation"""
         s = ""
@@ -268,11 +360,16 @@ class MemoryConfig(object):
 
     def get_num_pages(self):
         """return the total number of pages required to handle the given layout"""
+        n = 0
         rl = self.range_list
-        if len(rl) == 0:
-            return 0
-        else:
-            return rl[-1].next_page
+        if len(rl) > 0:
+            n = rl[-1].next_page
+        srl = self.sub_range_list
+        if len(srl) > 0:
+            sn = (srl[-1].next_sub + SUB_PAGES - 1) // SUB_PAGES
+            if sn > n:
+                n = sn
+        return n
 
     def check(self, ram_at_zero=True, max_pages=256):
         """check if gurrent layout is valid"""
@@ -283,6 +380,29 @@ class MemoryConfig(object):
             raise ConfigError("too many pages: want=%d max=%d" %
                               (n, max_pages))
         if ram_at_zero:
+            if len(self.range_list) == 0:
+                raise ConfigError("no RAM at page 0!")
             r = self.range_list[0]
             if r.start_page > 0 or r.mem_type != MEM_RAM:
                 raise ConfigError("no RAM at page 0!")
+        self._check_sub_ranges(ram_at_zero)
+
+    def _check_sub_ranges(self, ram_at_zero):
+        """sub ranges must be sub page aligned and must not overlap each
+           other. they may only overlay RAM, ROM, empty or unused pages"""
+        last = None
+        for sr in sorted(self.sub_range_list, key=lambda x: x.start_sub):
+            if sr.num_subs < 1 or sr.start_addr & SUB_PAGE_MASK != 0 or \
+                    sr.start_addr != sr.start_sub << SUB_PAGE_SHIFT:
+                raise ConfigError("%r is not sub page aligned!" % sr)
+            if last is not None and sr.start_sub < last.next_sub:
+                raise ConfigError("%r overlaps %r!" % (sr, last))
+            last = sr
+            if ram_at_zero and sr.start_sub == 0:
+                raise ConfigError("%r overlays RAM at page 0!" % sr)
+            for r in self.range_list:
+                if r.mem_type not in (MEM_SPECIAL, MEM_MIRROR, MEM_RESERVE):
+                    continue
+                if sr.start_sub < r.next_page * SUB_PAGES and \
+                        r.start_page * SUB_PAGES < sr.next_sub:
+                    raise ConfigError("%r overlaps %r!" % (sr, r))
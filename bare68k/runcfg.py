@@ -10,7 +10,8 @@ class RunConfig(object):
 
     def __init__(self, catch_kb_intr=True, cycles_per_run=0,
                  with_labels=True, pc_trace_size=8,
-                 instr_trace=False, cpu_mem_trace=False, api_mem_trace=False):
+                 instr_trace=False, cpu_mem_trace=False, api_mem_trace=False,
+                 idle_detection=False, pc_trace_mode=PC_TRACE_ALL):
         self._catch_kb_intr = catch_kb_intr
         self._cycles_per_run = cycles_per_run
         self._with_labels = with_labels
@@ -18,14 +19,18 @@ class RunConfig(object):
         self._instr_trace = instr_trace
         self._cpu_mem_trace = cpu_mem_trace
         self._api_mem_trace = api_mem_trace
+        self._idle_detection = idle_detection
+        self._pc_trace_mode = pc_trace_mode
 
     def __repr__(self):
         return "RunConfg(catch_kb_intr={}, cycles_per_run={}, " \
             "with_labels={}, pc_trace_size={}, instr_trace={}, " \
-            "cpu_mem_trace={}, api_mem_trace={})".format(
+            "cpu_mem_trace={}, api_mem_trace={}, idle_detection={}, " \
+            "pc_trace_mode={})".format(
                 self._catch_kb_intr, self._cycles_per_run,
                 self._with_labels, self._pc_trace_size,
-                self._instr_trace, self._cpu_mem_trace, self._api_mem_trace
+                self._instr_trace, self._cpu_mem_trace, self._api_mem_trace,
+                self._idle_detection, self._pc_trace_mode
             )
 
     def get_catch_kb_intr(self):
@@ -49,6 +54,12 @@ class RunConfig(object):
     def get_api_mem_trace(self):
         return self._api_mem_trace
 
+    def get_idle_detection(self):
+        return self._idle_detection
+
+    def get_pc_trace_mode(self):
+        return self._pc_trace_mode
+
     def set_catch_kb_instr(self, on):
         self._catch_kb_intr = on
 
@@ -66,3 +77,9 @@ class RunConfig(object):
 
     def set_api_mem_trace(self, on):
         self._api_mem_trace = on
+
+    def set_idle_detection(self, on):
+        self._idle_detection = on
+
+    def set_pc_trace_mode(self, mode):
+        self._pc_trace_mode = mode
@@ -15,7 +15,9 @@ from bare68k.cpucfg import *
 from bare68k.memcfg import *
 from bare68k.runcfg import RunConfig
 from bare68k.label import *
-from bare68k.handler import EventHandler
+from bare68k.handler import EventHandler, isawaitable
+
+RESET_OPCODE = 0x4e70
 
 
 class EventStats(object):
@@ -98,6 +100,21 @@ class RunInfo(object):
             return 0
 
 
+class RunState(object):
+    """internal state of an active run loop"""
+
+    def __init__(self, rec_depth):
+        self.rec_depth = rec_depth
+        self.cpu_state = None
+        self.stats = EventStats()
+        self.start_cycles = 0
+        self.total_start = 0
+        self.cpu_time = 0
+        self.results = []
+        self.stay = True
+        self.budget = None
+
+
 def log_setup(level=logging.DEBUG):
     """setup logging of the runtime"""
     FORMAT = '%(asctime)-15s %(name)24s:%(levelname)7s:  %(message)s'
@@ -172,12 +189,16 @@ class Runtime(object):
         self._setup_mem(mem_cfg)
         # setup cpu event handlers
         self._setup_handlers()
+        # skip idle loops?
+        tools.set_idle_detection(run_cfg._idle_detection)
 
         # clear state
         self._reset_pc = None
         self._reset_sp = None
         self._end_pcs = []
+        # pool of saved cpu contexts for nested runs
         self._cpu_states = []
+        self._call_ret_addr = None
 
         # setup label mgr
         if with_labels:
@@ -279,6 +300,22 @@ class Runtime(object):
                 self._log.info("memory: XXX @%04x +%04x", start, size)
             else:
                 raise ValueError("Invalid memory type: %d" % mt)
+        # sub page ranges overlay the pages setup above
+        for sr in mem_cfg.get_sub_range_list():
+            mt = sr.mem_type
+            start = sr.start_sub
+            size = sr.num_subs
+            if mt == MEM_SPECIAL:
+                r_func, w_func = sr.opts
+                mem.add_special_sub(start, size, r_func, w_func)
+                self._log.info("memory: spc sub @%05x +%05x", start, size)
+            elif mt == MEM_EMPTY:
+                value = sr.opts
+                mem.add_empty_sub(start, size, MEM_FLAGS_RW, value)
+                self._log.info("memory: --- sub @%05x +%05x: %08x",
+                               start, size, value)
+            else:
+                raise ValueError("Invalid sub memory type: %s" % mt)
         self._log.info("memory: done. max_pages=%04x", mem_cfg.get_num_pages())
 
     def shutdown(self):
@@ -324,29 +361,182 @@ class Runtime(object):
         else:
             return self._end_pcs[-1]
 
-    def run(self, reset_end_pc=None, start_pc=None, start_sp=None):
+    def run(self, reset_end_pc=None, start_pc=None, start_sp=None,
+            max_cycles=None, max_instructions=None, deadline=None):
         """run the CPU until emulation ends
 
         This is the main loop of your emulation. The CPU emulation is run and
         events are processed. The events are dispatched and the associated handlers
         are called. If a reset opcode is encountered then the execution is terminated.
 
+        A run can be limited to ``max_cycles`` CPU cycles, ``max_instructions``
+        executed instructions or a wall clock ``deadline`` given as a
+        :func:`time.time` value. The limits are enforced natively and the run
+        ends with a ``CPU_EVENT_BUDGET`` result if one is exceeded.
+
+        A nested run can be started from an event handler but not from a
+        callback invoked directly by the executing CPU. This raises a
+        :class:`bare68k.CallError`.
+
         Returns a RunInfo instance giving you timing information.
         """
-        # get some config values
+        state = self._run_begin(reset_end_pc, start_pc, start_sp,
+                                max_cycles, max_instructions, deadline)
+        try:
+            self._run_loop(state)
+        finally:
+            ri = self._run_end(state)
+        return ri
+
+    def set_call_trampoline(self, addr):
+        """set the return address of guest calls made with :meth:`call`
+
+        A RESET opcode is placed at the given address in guest memory. A
+        called guest function returns to it and this ends the call.
+        """
+        mem.w16(addr, RESET_OPCODE)
+        self._call_ret_addr = addr
+
+    def call(self, addr, regs=None, stack_args=None, max_cycles=None,
+             max_instructions=None, deadline=None):
+        """call a guest function and return the value of D0
+
+        The registers given as a dict of ``M68K_REG_`` numbers and values
+        are set, the ``stack_args`` are pushed as longs in reverse order and
+        the return address of the call trampoline set with
+        :meth:`set_call_trampoline` is pushed. Then the CPU runs until the
+        function returns. Afterwards the complete CPU state is restored, so
+        a call can be made from an event handler while the emulation runs.
+        Callbacks invoked directly by the executing CPU, e.g. direct call
+        traps or special memory handlers, must not call. The RESET of the
+        trampoline requires supervisor mode.
+
+        Raises :class:`bare68k.CallError` if the run ends for another
+        reason than the return of the function or if the CPU is already
+        executing.
+        """
+        self._check_not_executing("call")
+        ret_addr = self._call_ret_addr
+        if ret_addr is None:
+            raise ConfigError("no call trampoline set")
+        ctx = self._get_cpu_context()
+        try:
+            if regs:
+                cpu.w_regs(regs)
+            sp = cpu.r_sp()
+            if stack_args:
+                for arg in reversed(stack_args):
+                    sp -= 4
+                    mem.w32(sp, arg & 0xffffffff)
+            sp -= 4
+            mem.w32(sp, ret_addr)
+            state = self._run_begin(ret_addr + 2, addr, sp, max_cycles,
+                                    max_instructions, deadline,
+                                    save_cpu=False)
+            try:
+                self._run_loop(state)
+            finally:
+                ri = self._run_end(state)
+            if ri.get_last_result() != CPU_EVENT_DONE:
+                raise CallError("call of %08x failed: %s" %
+                                (addr, CPU_EVENT_NAMES[ri.get_last_result()]),
+                                ri)
+            return cpu.r_reg(M68K_REG_D0)
+        finally:
+            cpu.set_cpu_context(ctx)
+            self._cpu_states.append(ctx)
+
+    def _check_not_executing(self, what):
+        """internal helper to refuse running the CPU from inside of it"""
+        if cpu.is_executing():
+            raise CallError("%s while CPU executes: use an event based "
+                            "handler instead of a direct callback" % what)
+
+    def _get_cpu_context(self):
+        """internal helper to save the cpu state in a pooled context"""
+        if self._cpu_states:
+            return cpu.get_cpu_context(self._cpu_states.pop())
+        return cpu.get_cpu_context()
+
+    def _run_loop(self, state):
+        """internal helper to execute the CPU and dispatch events"""
         catch_kb_intr = self._run_cfg._catch_kb_intr
         cycles_per_run = self._run_cfg._cycles_per_run
-        pc_trace_size = self._run_cfg._pc_trace_size
-        instr_trace = self._run_cfg._instr_trace
-        cpu_mem_trace = self._run_cfg._cpu_mem_trace
-        api_mem_trace = self._run_cfg._api_mem_trace
+        timer = time.time
+
+        while state.stay:
+            try:
+                start = timer()
+                # execute CPU code until event occurs
+                num_events = cpu.execute_to_event_checked(cycles_per_run)
+            except KeyboardInterrupt as e:
+                # either abort execution (default) or re-raise exception
+                self._log.debug("keyboard interrupt")
+                if not catch_kb_intr:
+                    raise e
+                state.results.append((CPU_EVENT_USER_ABORT, None))
+                break
+            finally:
+                end = timer()
+                state.cpu_time += end - start
+
+            # dispatch events
+            run_info = cpu.get_info()
+            state.results = []
+            for event in run_info.events:
+                # a callback returned an awaitable
+                if isawaitable(event.data):
+                    self._run_not_async(event, event.data)
+                handler = self._run_get_handler(state, event)
+                if handler is not None:
+                    result = handler(event)
+                    if isawaitable(result):
+                        self._run_not_async(event, result)
+                    # handler wants to exit run loop
+                    if self._run_result(state, event, result):
+                        break
+
+    def _run_not_async(self, event, awaitable):
+        """internal helper to reject an awaitable in a sync run loop"""
+        close = getattr(awaitable, "close", None)
+        if close is not None:
+            close()
+        raise ConfigError("%s handler returned an awaitable: use run_async()"
+                          % CPU_EVENT_NAMES[event.ev_type])
+
+    def run_async(self, reset_end_pc=None, start_pc=None, start_sp=None,
+                  max_cycles=None, max_instructions=None, deadline=None):
+        """run the CPU as an asyncio coroutine until emulation ends
+
+        Works like :meth:`run` but executes the CPU in slices of
+        ``cycles_per_run`` cycles and yields to the event loop between
+        them. Handlers may return awaitables that are awaited before the
+        CPU continues. If a special memory, trace or instruction hook
+        callback returns an awaitable (for reads as second value of the
+        tuple) then the guest is suspended after the current instruction
+        until it completes. A special memory read handler still has to
+        return the read value right away, it can not be produced by the
+        awaitable. Requires Python 3.5 or newer.
+
+        :meth:`run` raises a :class:`bare68k.ConfigError` if a handler or
+        callback returns an awaitable.
+
+        Returns a coroutine that results in a RunInfo instance.
+        """
+        from bare68k.aio import run_async
+        return run_async(self, reset_end_pc, start_pc, start_sp,
+                         max_cycles, max_instructions, deadline)
+
+    def _run_begin(self, reset_end_pc, start_pc, start_sp,
+                   max_cycles=None, max_instructions=None, deadline=None,
+                   save_cpu=True):
+        """internal helper to enter a run loop"""
+        self._check_not_executing("run")
+        state = RunState(len(self._end_pcs))
 
         # recursive run() call? if yes then store cpu state
-        rec_depth = len(self._end_pcs)
-        if rec_depth > 0:
-            cpu_state = cpu.get_cpu_context()
-        else:
-            cpu_state = None
+        if state.rec_depth > 0 and save_cpu:
+            state.cpu_state = self._get_cpu_context()
 
         # set start pc/sp if requested
         if start_pc is not None:
@@ -357,101 +547,117 @@ class Runtime(object):
         # keep end pc
         self._end_pcs.append(reset_end_pc)
 
-        # timer function
-        timer = time.time
-
         # stats
-        stats = EventStats()
-        start_cycles = cpu.get_total_cycles()
+        state.start_cycles = cpu.get_total_cycles()
+
+        # limit run? the budget is global so save the one of an outer run
+        # and suspend it while a nested run is active
+        limit = max_cycles or max_instructions or deadline
+        if limit or state.rec_depth > 0:
+            state.budget = cpu.get_budget()
+        if limit:
+            timeout = 0
+            if deadline:
+                # an already passed deadline still needs a timeout
+                timeout = max(deadline - time.time(), 0.001)
+            cpu.set_budget(max_cycles or 0, max_instructions or 0, timeout)
+        elif state.rec_depth > 0:
+            cpu.clear_budget()
+
+        # traces are set up by the outermost run only
+        if state.rec_depth == 0:
+            self._setup_traces()
+
+        # main loop
+        self._log.debug("enter run loop #%d", state.rec_depth)
+        state.total_start = time.time()
+        return state
+
+    def _run_get_handler(self, state, event):
+        """internal helper to count an event and return its handler"""
+        handler = event.handler
+        state.stats.count(event.ev_type)
+        if handler is not None:
+            self._log.debug("trigger handler: %s",
+                            CPU_EVENT_NAMES[event.ev_type])
+        else:
+            self._log.warning("no handler: result=%s (event=%r)",
+                              CPU_EVENT_NAMES[event.ev_type], event)
+        return handler
+
+    def _run_result(self, state, event, result):
+        """internal helper to process a handler result
 
+        Returns True if the event loop must be terminated.
+        """
+        if result is None:
+            return False
+        state.results.append((result, event))
+        state.stay = False
+        self._log.debug("run loop exit #%d: result=%s"
+                        " (event=%r)",
+                        state.rec_depth, CPU_EVENT_NAMES[result],
+                        event)
+        # user abort terminates event loop
+        return result == CPU_EVENT_USER_ABORT
+
+    def _setup_traces(self):
+        """internal helper to set up the pc trace and trace hooks"""
+        run_cfg = self._run_cfg
         # pc trace?
-        tools.setup_pc_trace(pc_trace_size)
+        tools.setup_pc_trace(run_cfg._pc_trace_size)
+        tools.set_pc_trace_mode(run_cfg._pc_trace_mode)
 
         # instr trace?
         evh = self._event_handler
-        if instr_trace:
+        if run_cfg._instr_trace:
             cpu.set_instr_hook_func(evh.handle_instr_trace)
-        if cpu_mem_trace:
+        if run_cfg._cpu_mem_trace:
             mem.mach.set_mem_cpu_trace_func(
                 evh.handle_cpu_mem_trace, as_str=True)
-        if api_mem_trace:
+        if run_cfg._api_mem_trace:
             mem.mach.set_mem_api_trace_func(
                 evh.handle_api_mem_trace, as_str=True)
 
-        cpu_time = 0
-
-        # main loop
-        self._log.debug("enter run loop #%d", rec_depth)
-        total_start = timer()
-
-        results = []
-        stay = True
-        while stay:
-            try:
-                start = timer()
-                # execute CPU code until event occurs
-                num_events = cpu.execute_to_event_checked(cycles_per_run)
-            except KeyboardInterrupt as e:
-                # either abort execution (default) or re-raise exception
-                self._log.debug("keyboard interrupt")
-                if not catch_kb_intr:
-                    raise e
-                results.append((CPU_EVENT_USER_ABORT, None))
-                break
-            finally:
-                end = timer()
-                cpu_time += end - start
+    def _cleanup_traces(self):
+        """internal helper to remove the trace hooks"""
+        run_cfg = self._run_cfg
+        if run_cfg._instr_trace:
+            cpu.set_instr_hook_func(None)
+        if run_cfg._cpu_mem_trace:
+            mem.set_mem_cpu_trace_func(None)
+        if run_cfg._api_mem_trace:
+            mem.set_mem_api_trace_func(None)
 
-            # dispatch events
-            run_info = cpu.get_info()
-            results = []
-            for event in run_info.events:
-                handler = event.handler
-                stats.count(event.ev_type)
-                if handler is not None:
-                    self._log.debug("trigger handler: %s",
-                                    CPU_EVENT_NAMES[event.ev_type])
-                    result = handler(event)
-                    # handler wants to exit run loop
-                    if result is not None:
-                        results.append((result, event))
-                        stay = False
-                        self._log.debug("run loop exit #%d: result=%s"
-                                        " (event=%r)",
-                                        rec_depth, CPU_EVENT_NAMES[result],
-                                        event)
-                        # user abort terminates event loop
-                        if result == CPU_EVENT_USER_ABORT:
-                            break
-                else:
-                    self._log.warning("no handler: result=%s (event=%r)",
-                                      CPU_EVENT_NAMES[event.ev_type], event)
-
-        total_end = timer()
-        self._log.debug("leave run loop #%d", rec_depth)
+    def _run_end(self, state):
+        """internal helper to leave a run loop and return its RunInfo"""
+        total_end = time.time()
+        self._log.debug("leave run loop #%d", state.rec_depth)
 
         # pop end pc
         self._end_pcs.pop()
 
         # restore cpu
-        if cpu_state is not None:
-            cpu.set_cpu_context(cpu_state)
+        if state.cpu_state is not None:
+            cpu.set_cpu_context(state.cpu_state)
+            self._cpu_states.append(state.cpu_state)
+
+        # restore limits of outer run
+        if state.budget is not None:
+            cpu.restore_budget(state.budget)
 
         # instr trace
-        if instr_trace:
-            cpu.set_instr_hook_func(None)
-        if cpu_mem_trace:
-            mem.set_mem_cpu_trace_func(None)
-        if api_mem_trace:
-            mem.set_mem_api_trace_func(None)
+        if state.rec_depth == 0:
+            self._cleanup_traces()
 
         # final timing
-        total_time = total_end - total_start
+        total_time = total_end - state.total_start
         end_cycles = cpu.get_total_cycles()
-        total_cycles = end_cycles - start_cycles
+        total_cycles = end_cycles - state.start_cycles
 
         # create run info result
-        ri = RunInfo(total_time, cpu_time, total_cycles, results, stats)
+        ri = RunInfo(total_time, state.cpu_time, total_cycles,
+                     state.results, state.stats)
         self._log.debug("run info: %s", ri)
         return ri
 
@@ -470,7 +676,8 @@ class Runtime(object):
             CPU_EVENT_INT_ACK: cfg.handle_int_ack,
             CPU_EVENT_BREAKPOINT: cfg.handle_breakpoint,
             CPU_EVENT_WATCHPOINT: cfg.handle_watchpoint,
-            CPU_EVENT_TIMER: cfg.handle_timer
+            CPU_EVENT_TIMER: cfg.handle_timer,
+            CPU_EVENT_BUDGET: cfg.handle_budget
         }
         for e in eh:
             cpu.set_event_handler(e, eh[e])
@@ -0,0 +1,144 @@
+"""declarative access to structures in guest memory.
+
+A :class:`StructDef` describes the layout of a guest structure once. Reading
+or writing a whole structure is then a single native call instead of one
+memory call per field. Linked lists of structures are walked natively, too::
+
+    Node = StructDef("Node", [
+        ("ln_Succ", STRUCT_U32),
+        ("ln_Pred", STRUCT_U32),
+        ("ln_Type", STRUCT_U8),
+        ("ln_Pri", STRUCT_S8),
+        ("ln_Name", STRUCT_CSTR),
+    ])
+    node = Node.read(addr)
+    nodes = Node.read_list(mem.r32(list_addr), "ln_Succ", skip_tail=True)
+"""
+
+import collections
+
+import bare68k.api.mem as mem
+from bare68k.consts import *
+
+_type_sizes = {
+    STRUCT_U8: 1,
+    STRUCT_S8: 1,
+    STRUCT_U16: 2,
+    STRUCT_S16: 2,
+    STRUCT_U32: 4,
+    STRUCT_S32: 4,
+    STRUCT_CSTR: 4,
+    STRUCT_BSTR: 4,
+}
+
+DEFAULT_MAX_NODES = 4096
+
+
+def walk_list(first, next_offset, skip_tail=False,
+              max_nodes=DEFAULT_MAX_NODES):
+    """return the addresses of all nodes of a linked list
+
+    The next pointers at ``next_offset`` are followed starting with the
+    node at ``first`` until a NULL pointer is found. With ``skip_tail`` the
+    last node is dropped, as required for the tail node of an Exec list.
+    A ValueError is raised on invalid addresses or if the list is longer
+    than ``max_nodes``.
+    """
+    return mem.struct_walk_list(first, next_offset, skip_tail, max_nodes)
+
+
+class StructDef(object):
+    """the layout of a structure in guest memory
+
+    Args:
+        name (str): name of the structure and its records
+        fields (list): ``(name, type)`` or ``(name, type, offset)`` tuples
+            with a STRUCT_ field type. Without an offset the field is placed
+            after the previous one, words and longs are aligned to even
+            addresses like the m68k compilers do.
+        size (int, optional): total size of the structure. By default the
+            end of the last field rounded up to an even size.
+
+    String fields (STRUCT_CSTR, STRUCT_BSTR) are read as the string the
+    pointer refers to or None for a NULL pointer. They are written as
+    plain pointers.
+    """
+
+    def __init__(self, name, fields, size=None):
+        self.name = name
+        self._offsets = collections.OrderedDict()
+        self._types = {}
+        layout = []
+        offset = 0
+        end = 0
+        for field in fields:
+            if len(field) == 3:
+                field_name, field_type, offset = field
+            else:
+                field_name, field_type = field
+            if field_type not in _type_sizes:
+                raise ValueError("invalid type of field '%s': %r" %
+                                 (field_name, field_type))
+            if field_name in self._offsets:
+                raise ValueError("duplicate field: %s" % field_name)
+            field_size = _type_sizes[field_type]
+            if field_size > 1 and offset & 1:
+                if len(field) == 3:
+                    raise ValueError("odd offset of field '%s': %d" %
+                                     (field_name, offset))
+                offset += 1
+            self._offsets[field_name] = offset
+            self._types[field_name] = field_type
+            layout.append((offset, field_type))
+            offset += field_size
+            end = max(end, offset)
+        if size is None:
+            size = (end + 1) & ~1
+        self.size = size
+        self._layout = mem.StructLayout(layout)
+        self._record = collections.namedtuple(name, list(self._offsets))
+
+    def __repr__(self):
+        return "StructDef(%r, size=%d)" % (self.name, self.size)
+
+    def get_field_names(self):
+        """return the field names in declaration order"""
+        return list(self._offsets)
+
+    def get_offset(self, field_name):
+        """return the offset of the given field"""
+        return self._offsets[field_name]
+
+    def get_type(self, field_name):
+        """return the STRUCT_ type of the given field"""
+        return self._types[field_name]
+
+    def read(self, addr):
+        """read the structure at the given address into a named tuple"""
+        return self._record._make(self._layout.read(addr))
+
+    def write(self, addr, **values):
+        """write the given fields of the structure at the given address
+
+        Fields that are not given are left untouched.
+        """
+        vals = [None] * len(self._offsets)
+        for pos, field_name in enumerate(self._offsets):
+            if field_name in values:
+                vals[pos] = values.pop(field_name)
+        if values:
+            raise ValueError("invalid fields for %s: %s" %
+                             (self.name, ", ".join(sorted(values))))
+        self._layout.write(addr, vals)
+
+    def read_list(self, first, next_field, skip_tail=False,
+                  max_nodes=DEFAULT_MAX_NODES):
+        """read all structures of a linked list
+
+        The list is walked like in :func:`walk_list` using the given field
+        as next pointer. Returns a list of ``(addr, record)`` tuples.
+        """
+        next_offset = self._offsets[next_field]
+        res = self._layout.read_list(first, next_offset, skip_tail, max_nodes)
+        make = self._record._make
+        return [(addr, make(vals)) for addr, vals in res]
@@ -1,3 +1,4 @@
+import sys
 import pytest
 
 from bare68k import *
@@ -55,3 +56,9 @@ def rtnl(request):
     rt.reset(PROG_BASE, STACK)
     yield rt
     rt.shutdown()
+
+
+# asyncio support needs async def
+collect_ignore = []
+if sys.version_info < (3, 5):
+    collect_ignore.append("tests/test_aio.py")
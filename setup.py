@@ -228,7 +228,11 @@ sourcefiles = gen_src + [
     'bare68k/machine_src/glue/mem.c',
     'bare68k/machine_src/glue/traps.c',
     'bare68k/machine_src/glue/tools.c',
+    'bare68k/machine_src/glue/irq.c',
     'bare68k/machine_src/glue/label.c',
+    'bare68k/machine_src/glue/disasm.c',
+    'bare68k/machine_src/glue/gstruct.c',
+    'bare68k/machine_src/glue/heap.c',
 
     'bare68k/machine_src/musashi/m68kcpu.c',
     'bare68k/machine_src/musashi/m68kdasm.c',
@@ -238,20 +242,31 @@ depends = [
     'bare68k/machine_src/mem.pxd',
     'bare68k/machine_src/traps.pxd',
     'bare68k/machine_src/tools.pxd',
+    'bare68k/machine_src/irq.pxd',
     'bare68k/machine_src/label.pxd',
+    'bare68k/machine_src/disasm.pxd',
+    'bare68k/machine_src/gstruct.pxd',
+    'bare68k/machine_src/heap.pxd',
 
     'bare68k/machine_src/cpu.pyx',
     'bare68k/machine_src/mem.pyx',
     'bare68k/machine_src/traps.pyx',
     'bare68k/machine_src/tools.pyx',
+    'bare68k/machine_src/irq.pyx',
     'bare68k/machine_src/disasm.pyx',
+    'bare68k/machine_src/gstruct.pyx',
+    'bare68k/machine_src/heap.pyx',
     'bare68k/machine_src/label.pyx',
 
     'bare68k/machine_src/glue/cpu.h',
     'bare68k/machine_src/glue/mem.h',
     'bare68k/machine_src/glue/traps.h',
     'bare68k/machine_src/glue/tools.h',
+    'bare68k/machine_src/glue/irq.h',
     'bare68k/machine_src/glue/label.h',
+    'bare68k/machine_src/glue/disasm.h',
+    'bare68k/machine_src/glue/gstruct.h',
+    'bare68k/machine_src/glue/heap.h',
 
     'bare68k/machine_src/glue/win/stdint.h'
 ]
@@ -0,0 +1,49 @@
+import pytest
+
+from bare68k.consts import *
+from bare68k.api import mem, cpu, tools
+from bare68k.debug.condition import *
+
+PROG_BASE = 0x1000
+
+
+def test_condition_parse():
+    c = Condition("d0 == 5 && a7 < 0x1000 and hits >= 10")
+    assert c.terms == [
+        (COND_REG, M68K_REG_D0, COND_EQ, 5, 0xffffffff),
+        (COND_REG, M68K_REG_A7, COND_LT, 0x1000, 0xffffffff),
+        (COND_HITS, 0, COND_GE, 10, 0xffffffff)]
+    c = Condition("w[0x400] & 0xff00 != 0 && value==0")
+    assert c.terms == [
+        (COND_MEM16, 0x400, COND_NE, 0, 0xff00),
+        (COND_VALUE, 0, COND_EQ, 0, 0xffffffff)]
+    c = Condition("D1 s< -1")
+    assert c.terms == [(COND_REG, M68K_REG_D1, COND_SLT, 0xffffffff,
+                        0xffffffff)]
+    assert str(c) == "D1 s< -1"
+
+
+def test_condition_parse_error():
+    with pytest.raises(ValueError):
+        Condition("d0 = 5")
+    with pytest.raises(ValueError):
+        Condition("d8 == 5")
+    with pytest.raises(ValueError):
+        Condition("d0 == five")
+
+
+def test_condition_breakpoint(rt):
+    tools.setup_breakpoints(1)
+    # moveq #5,d0 ; loop: subq.l #1,d0 ; bne.s loop ; reset
+    mem.w16(PROG_BASE, 0x7005)
+    mem.w16(PROG_BASE + 2, 0x5380)
+    mem.w16(PROG_BASE + 4, 0x66fc)
+    mem.w16(PROG_BASE + 6, 0x4e70)
+    tools.set_breakpoint(0, PROG_BASE + 2, MEM_FC_MASK, None)
+    Condition("d0 == 2").set_breakpoint(0)
+    ri = rt.run()
+    assert ri.get_last_result() == CPU_EVENT_BREAKPOINT
+    assert ri.get_last_event().addr == PROG_BASE + 2
+    # the instruction at the breakpoint is still executed
+    assert cpu.r_dx(0) == 1
+    tools.cleanup_breakpoints()
@@ -0,0 +1,33 @@
+from bare68k.api import mem, tools
+from bare68k.debug.coverage import *
+
+PROG_BASE = 0x1000
+
+
+def test_coverage_map(rt):
+    tools.setup_coverage(True)
+    # moveq #1,d0 ; beq.s skip ; nop ; skip: reset
+    mem.w16(PROG_BASE, 0x7001)
+    mem.w16(PROG_BASE + 2, 0x6702)
+    mem.w16(PROG_BASE + 4, 0x4e71)
+    mem.w16(PROG_BASE + 6, 0x4e70)
+    rt.run()
+    cm = CoverageMap.from_machine()
+    assert cm.get_addresses() == [PROG_BASE, PROG_BASE + 2,
+                                  PROG_BASE + 4, PROG_BASE + 6]
+    assert cm.get_num_covered() == 4
+    # second run takes the branch
+    tools.clear_coverage()
+    mem.w16(PROG_BASE, 0x7000)
+    rt.run(start_pc=PROG_BASE)
+    cm2 = CoverageMap.from_machine()
+    assert not cm2.is_covered(PROG_BASE + 4)
+    assert cm2.get_num_covered() == 3
+    cm2.merge(cm)
+    assert cm2.is_covered(PROG_BASE + 4)
+    assert cm2.get_num_covered() == 4
+    # back to the machine
+    tools.clear_coverage()
+    cm2.to_machine()
+    assert CoverageMap.from_machine().get_pages() == cm2.get_pages()
+    tools.setup_coverage(False)
@@ -1,7 +1,10 @@
 
 from __future__ import print_function
 
+import logging
+
 from bare68k.debug.cpusnapshot import *
+from bare68k.runtime import init_quick
 
 
 def test_css_empty(rt):
@@ -33,3 +36,90 @@ def test_css_real(rt):
 def test_css_simple(rt):
     run_prog(rt)
     print_cpu_snapshot()
+
+
+def test_css_branch_trace(rt):
+    PROG_BASE = rt.get_reset_pc()
+    rt.get_run_cfg().set_pc_trace_mode(PC_TRACE_BRANCH)
+    for i in range(4):
+        mem.w16(PROG_BASE + i * 2, 0x4e71)  # nop
+    mem.w16(PROG_BASE + 8, 0x4ef8)  # jmp
+    mem.w16(PROG_BASE + 10, PROG_BASE + 16)
+    for i in range(4):
+        mem.w16(PROG_BASE + 16 + i * 2, 0x4e71)  # nop
+    mem.w16(PROG_BASE + 24, 0x4e70)  # reset
+    rt.run()
+    snap = CPUSnapshotCreator().create()
+    pcs = [il.pc for il in snap.pc_trace]
+    assert pcs == [PROG_BASE + 8] + \
+        [PROG_BASE + 16 + i * 2 for i in range(5)]
+
+
+class CountingDisassembler(Disassembler):
+
+    def __init__(self):
+        Disassembler.__init__(self)
+        self.count = 0
+
+    def disassemble(self, pc, cycles=None):
+        self.count += 1
+        return Disassembler.disassemble(self, pc, cycles)
+
+
+def test_css_lazy(rt):
+    run_prog(rt)
+    da = CountingDisassembler()
+    c = CPUSnapshotCreator(da)
+    snap = c.create("lazy")
+    assert da.count == 0
+    # filtered log level does not render
+    log = logging.getLogger("test_css_lazy")
+    log.setLevel(logging.ERROR)
+    CPUSnapshotFormatter().log(snap, log, logging.DEBUG)
+    assert da.count == 0
+    # first access disassembles the trace
+    pcs = [il.pc for il in snap.pc_trace]
+    assert da.count == len(pcs)
+    assert pcs[-1] == rt.get_reset_pc() + 16 * 6
+    snap.pc_trace
+    assert da.count == len(pcs)
+
+
+def test_css_code_copy(rt):
+    run_prog(rt)
+    snap = CPUSnapshotCreator().create()
+    # overwrite the code before rendering
+    PROG_BASE = rt.get_reset_pc()
+    for i in range(17 * 3):
+        mem.w16(PROG_BASE + i * 2, 0)
+    ils = snap.pc_trace
+    assert [il.opcode for il in ils] == ['jmp'] * (len(ils) - 1) + ['reset']
+    assert tuple(ils[0].words) == (0x4ef8, ils[0].pc + 6)
+
+
+def test_css_branch_trace_code_copy(rt):
+    PROG_BASE = rt.get_reset_pc()
+    rt.get_run_cfg().set_pc_trace_mode(PC_TRACE_BRANCH)
+    mem.w16(PROG_BASE, 0x4e71)  # nop
+    mem.w16(PROG_BASE + 2, 0x4ef8)  # jmp
+    mem.w16(PROG_BASE + 4, PROG_BASE + 8)
+    mem.w16(PROG_BASE + 8, 0x4e71)  # nop
+    mem.w16(PROG_BASE + 10, 0x4e70)  # reset
+    rt.run()
+    snap = CPUSnapshotCreator().create()
+    for i in range(6):
+        mem.w16(PROG_BASE + i * 2, 0)
+    ils = snap.pc_trace
+    assert [(il.pc, il.opcode) for il in ils] == [
+        (PROG_BASE + 2, 'jmp'), (PROG_BASE + 8, 'nop'),
+        (PROG_BASE + 10, 'reset')]
+
+
+def test_css_code_copy_shutdown():
+    rt = init_quick()
+    rt.reset(0x1000, 0x800)
+    run_prog(rt)
+    snap = CPUSnapshotCreator().create()
+    rt.shutdown()
+    CPUSnapshotFormatter().format(snap)
+    assert [il.opcode for il in snap.pc_trace][-2:] == ['jmp', 'reset']
@@ -77,3 +77,32 @@ def test_da_annotation(rt):
     da.set_annotator(annotator)
     li, pc = da.disassemble(0)
     assert li.annotation == "#" + li.opcode
+
+
+def test_da_decode(rt):
+    mem = rt.get_mem()
+    mem.w16(0, 0x4e75)
+    mem.w16(2, 0xa042)
+    da = Disassembler()
+    di = da.decode(0)
+    assert di.mnemonic == 'rts'
+    assert di.args is None
+    assert di.operands == ()
+    res = da.decode_range(0, 4)
+    assert [d.mnemonic for d in res] == ['rts', 'aline']
+
+
+def test_da_range_file(rt):
+    data = read_code_file()
+    end = CODE_ORG + len(data)
+    da = Disassembler(data, CODE_ORG)
+    pc = CODE_ORG
+    lines = list(da.disassemble_range(CODE_ORG, end))
+    for li in lines:
+        ref, pc = da.disassemble(pc)
+        assert li.pc == ref.pc
+        assert li.words == ref.words
+        assert li.opcode == ref.opcode
+        assert li.args == ref.args
+    assert pc >= end
+    da.shutdown()
@@ -0,0 +1,57 @@
+import os
+
+from bare68k.consts import *
+from bare68k.debug.listing import *
+
+CODE_ORG = 0x1000
+
+
+def read_code_file():
+    data_file = os.path.abspath(os.path.join(
+        __file__, "..", "..", "..", "samples", "ppunpack", "unpack.bin"))
+    with open(data_file, "rb") as fh:
+        return fh.read()
+
+
+def get_pcs(text):
+    return [int(line.split()[0][1:], 16) for line in text.splitlines()]
+
+
+def test_listing_inline():
+    data = read_code_file()
+    gen = ListingGenerator(data, CODE_ORG, chunk_size=0x40, num_workers=0)
+    chunks = list(gen.generate())
+    assert len(chunks) > 1
+    pcs = get_pcs("".join(chunks))
+    assert pcs[0] == CODE_ORG
+    assert pcs == sorted(pcs)
+    assert pcs[-1] < CODE_ORG + len(data)
+
+
+def test_listing_workers(rt, tmpdir):
+    data = read_code_file()
+    lm = rt.get_label_mgr()
+    lm.add_label(CODE_ORG, 8, "start")
+    file_name = str(tmpdir.join("workers.lst"))
+    gen = ListingGenerator(data, CODE_ORG, label_mgr=lm, chunk_size=0x40,
+                           num_workers=2)
+    with open(file_name, "w") as fh:
+        size = gen.write(fh)
+    with open(file_name) as fh:
+        text = fh.read()
+    assert size == len(text)
+    lines = text.splitlines()
+    assert "start" in lines[0]
+    assert "start+4" in lines[1]
+    pcs = get_pcs(text)
+    assert pcs == sorted(pcs)
+    assert len(set(pcs)) == len(pcs)
+
+
+def test_listing_file(tmpdir):
+    data = read_code_file()
+    file_name = str(tmpdir.join("unpack.lst"))
+    size = write_listing(file_name, data, CODE_ORG, num_workers=0,
+                         cpu_type=M68K_CPU_TYPE_68020)
+    with open(file_name) as fh:
+        assert len(fh.read()) == size
@@ -0,0 +1,26 @@
+from bare68k.api import mem
+from bare68k.debug.opstats import *
+
+PROG_BASE = 0x1000
+
+
+def test_opstats_group(rt):
+    st = OpcodeStats()
+    st.start()
+    # loop: moveq #0,d0 ; move.l d0,d1 ; move.w d0,d1 ; reset
+    mem.w16(PROG_BASE, 0x7000)
+    mem.w16(PROG_BASE + 2, 0x2200)
+    mem.w16(PROG_BASE + 4, 0x3200)
+    mem.w16(PROG_BASE + 6, 0x4e70)
+    mem.w16(PROG_BASE + 8, 0x4e71)
+    rt.run()
+    counts = st.get_opcode_counts()
+    assert counts == {0x7000: 1, 0x2200: 1, 0x3200: 1, 0x4e70: 1}
+    assert st.get_instr_count() == 4
+    groups = st.group_by_mnemonic(counts)
+    assert groups == [("move.l", 1), ("move.w", 1), ("moveq", 1),
+                      ("reset", 1)]
+    groups = st.group_by_mnemonic(counts, with_size=False)
+    assert groups == [("move", 2), ("moveq", 1), ("reset", 1)]
+    st.stop()
+    assert st.get_opcode_counts() == {}
@@ -48,6 +48,37 @@ def test_register_access(mach):
         ws_reg(M68K_REG_D0, 2**31)
 
 
+def test_register_batch(mach):
+    w_regs({M68K_REG_D0: 1, M68K_REG_A0: 0x1000, M68K_REG_D7: -1})
+    assert r_regs((M68K_REG_D0, M68K_REG_A0, M68K_REG_D7)) == \
+        (1, 0x1000, 0xffffffff)
+    assert rs_regs([M68K_REG_D7, M68K_REG_D0]) == (-1, 1)
+    w_regs([(M68K_REG_D1, 2), (M68K_REG_PC, 0x400), (M68K_REG_SR, 0x2700)])
+    assert r_regs([M68K_REG_D1, M68K_REG_PC, M68K_REG_SR]) == \
+        (2, 0x400, 0x2700)
+    assert r_regs([]) == ()
+    with pytest.raises(OverflowError):
+        w_regs({M68K_REG_D0: 0x100000000})
+
+
+def test_register_view(mach):
+    view = get_reg_view()
+    assert len(view) == 16
+    w_dx(3, 0xdeadbeef)
+    w_ax(2, 0x1234)
+    assert view[M68K_REG_D3] == 0xdeadbeef
+    assert view[M68K_REG_A2] == 0x1234
+    view[M68K_REG_D0] = 42
+    view[M68K_REG_A7] = 0x800
+    assert r_dx(0) == 42
+    assert r_sp() == 0x800
+    # the view is live across context switches
+    ctx = get_cpu_context()
+    view[M68K_REG_D0] = 23
+    set_cpu_context(ctx)
+    assert view[M68K_REG_D0] == 42
+
+
 def test_memory_access(mach):
     w8(0, 42)
     assert r8(0) == 42
@@ -158,6 +189,50 @@ def test_execute_to_event(mach):
     assert ev.addr == 0x10c
 
 
+def test_execute_nogil(mach):
+    import threading
+    # loop: move.l #$80000,d0; subq.l #1,d0; bne.s loop; reset
+    w16(0x100, 0x203c)
+    w32(0x102, 0x80000)
+    w16(0x106, 0x5380)
+    w16(0x108, 0x66fc)
+    w16(0x10a, RESET_OPCODE)
+    w_pc(0x100)
+    assert not has_callbacks()
+
+    class counter:
+        count = 0
+        done = False
+
+        def run(self):
+            while not self.done:
+                self.count += 1
+    c = counter()
+    t = threading.Thread(target=c.run)
+    t.start()
+    start = c.count
+    ne = execute_to_event_checked()
+    end = c.count
+    c.done = True
+    t.join()
+    assert ne == 1
+    assert get_info().events[0].ev_type == CPU_EVENT_RESET
+    assert r_reg(M68K_REG_D0) == 0
+    # thread was running while the cpu executed
+    assert end > start
+
+
+def test_has_callbacks(mach):
+    assert not has_callbacks()
+    set_instr_hook_func(default=True)
+    assert not has_callbacks()
+    set_instr_hook_func(lambda pc: None)
+    assert has_callbacks()
+    set_instr_hook_func(None)
+    add_special(1, 1, None, None)
+    assert has_callbacks()
+
+
 def test_instr_hook(mach):
     w16(0x100, NOP_OPCODE)
     w16(0x102, NOP_OPCODE)
@@ -274,6 +349,10 @@ def test_context(mach):
     assert ctx.r_reg(M68K_REG_PC) == 0x100
     set_cpu_context(ctx)
     assert r_pc() == 0x100
+    # reuse context
+    w_pc(0x300)
+    assert get_cpu_context(ctx) is ctx
+    assert ctx.r_reg(M68K_REG_PC) == 0x300
 
 
 def test_irq_autovec_nofunc(mach):
@@ -425,6 +504,52 @@ def test_irq_vec_exc(mach):
     traceback.print_exception(*ev.data)
 
 
+def test_budget_cycles(mach):
+    # loop: nop ; bra.s loop
+    w16(0x100, NOP_OPCODE)
+    w16(0x102, 0x60fc)
+    w_pc(0x100)
+    set_budget(max_cycles=1000)
+    ne = execute_to_event_checked(100)
+    assert ne == 1
+    ev = get_info().events[0]
+    assert ev.ev_type == CPU_EVENT_BUDGET
+    assert ev.value == CPU_BUDGET_CYCLES
+    # budget fires only once
+    assert execute(1000) == 0
+    clear_budget()
+
+
+def test_budget_instr(mach):
+    # nop sled
+    for i in range(32):
+        w16(0x100 + i * 2, NOP_OPCODE)
+    w_pc(0x100)
+    set_budget(max_instructions=10)
+    ne = execute_to_event_checked()
+    assert ne == 1
+    ev = get_info().events[0]
+    assert ev.ev_type == CPU_EVENT_BUDGET
+    assert ev.value == CPU_BUDGET_INSTR
+    # event is raised by the 10th instruction and the CPU stops after it
+    assert ev.addr == 0x112
+    assert r_pc() == 0x114
+    clear_budget()
+
+
+def test_budget_deadline(mach):
+    w16(0x100, NOP_OPCODE)
+    w16(0x102, 0x60fc)
+    w_pc(0x100)
+    set_budget(timeout=0.01)
+    ne = execute_to_event_checked(1000)
+    assert ne == 1
+    ev = get_info().events[0]
+    assert ev.ev_type == CPU_EVENT_BUDGET
+    assert ev.value == CPU_BUDGET_DEADLINE
+    clear_budget()
+
+
 def test_get_sr_str(mach):
     sr = r_sr()
     s = get_sr_str(sr)
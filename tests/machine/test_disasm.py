@@ -136,3 +136,63 @@ def test_disassemble_is_valid(mach):
     if get_type() == M68K_CPU_TYPE_68000:
         op2 = 0x8380  # unpk
         assert disassemble_is_valid(op2) is False
+
+
+def test_disassemble_decode(mach):
+    w16(0x100, 0x2028)  # move.l ($10,A0), D0
+    w16(0x102, 0x0010)
+    w32(0x104, 0x48e7fffe)  # movem.l D0-D7/A0-A6, -(A7)
+    w32(0x108, 0x41fa0010)  # lea ($10,PC), A0
+    w32(0x10c, 0x51c8fffc)  # dbra D0, $10c
+    w16(0x110, 0xa042)  # aline
+    di = disassemble_decode(0x100)
+    assert di.pc == 0x100
+    assert di.length == 4
+    assert di.next_pc == 0x104
+    assert di.opcode == 0x2028
+    assert di.words == (0x2028, 0x0010)
+    assert di.mnemonic == "move.l"
+    assert di.size == 4
+    assert di.args == "($10,A0),D0"
+    assert di.operands == ((DISASM_OP_ADISP, 0, 0x10, DISASM_INDEX_NONE),
+                           (DISASM_OP_DREG, 0, 0, DISASM_INDEX_NONE))
+    di = disassemble_decode(0x104)
+    assert di.get_operand(0) == (DISASM_OP_REGLIST, 0, 0x7fff,
+                                 DISASM_INDEX_NONE)
+    assert di.get_operand(1) == (DISASM_OP_APREDEC, 7, 0, DISASM_INDEX_NONE)
+    with pytest.raises(IndexError):
+        di.get_operand(2)
+    di = disassemble_decode(0x108)
+    assert di.mnemonic == "lea"
+    assert di.size == 0
+    assert di.get_operand(0)[:3] == (DISASM_OP_PCDISP, 0, 0x11a)
+    di = disassemble_decode(0x10c)
+    assert di.get_operand(1)[:3] == (DISASM_OP_ADDR, 0, 0x10a)
+    di = disassemble_decode(0x110)
+    assert di.mnemonic == "aline"
+    assert di.args == "#$042"
+    assert di.operands == ((DISASM_OP_IMM, 0, 0x42, DISASM_INDEX_NONE),)
+    # range
+    res = disassemble_decode_range(0x100, 0x112)
+    assert [d.pc for d in res] == [0x100, 0x104, 0x108, 0x10c, 0x110]
+
+
+def test_disassemble_range_buffer(mach):
+    w16(0x100, 0x4e75)  # rts
+    w16(0x102, 0x4eb9)  # jsr
+    w32(0x104, 0xdeadbeef)
+    w16(0x108, 0xa042)  # aline
+    buf = disassemble_range_buffer(0x100, 0x10a)
+    assert len(buf) == 3
+    assert buf.get_pc(1) == 0x102
+    assert buf.get_length(1) == 6
+    assert buf.get_words(1) == (0x4eb9, 0xdead, 0xbeef)
+    assert buf.get_line(0) == (0x100, (0x4e75,), "rts", None)
+    assert buf.get_line(1) == (0x102, (0x4eb9, 0xdead, 0xbeef),
+                               "jsr", "$deadbeef.l")
+    assert buf.get_line(2) == (0x108, (0xa042,), "aline", "#$042")
+    assert buf.get_text() == b"rts\0\0jsr\0$deadbeef.l\0aline\0#$042\0"
+    with pytest.raises(IndexError):
+        buf.get_line(3)
+    # empty range
+    assert len(disassemble_range_buffer(0x100, 0x100)) == 0
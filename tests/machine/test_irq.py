@@ -0,0 +1,185 @@
+from __future__ import print_function
+
+import pytest
+
+from bare68k.consts import *
+from bare68k.machine import *
+
+COUNTER = 0x500
+PROG = 0x1000
+HANDLER = 0x1100
+NOP_OPCODE = 0x4e71
+
+
+def setup_prog(loop):
+    # handler: addq.l #1,COUNTER.w ; rte
+    w16(HANDLER, 0x52b8)
+    w16(HANDLER + 2, COUNTER)
+    w16(HANDLER + 4, 0x4e73)
+    for i, op in enumerate(loop):
+        w16(PROG + i * 2, op)
+    w32(COUNTER, 0)
+    w_pc(PROG)
+    w_sp(0x800)
+    w_sr(0, 0x2000)
+
+
+def test_irq_schedule_cancel(mach):
+    assert get_num_irqs() == 0
+    with pytest.raises(ValueError):
+        schedule_irq(0, 10)
+    with pytest.raises(ValueError):
+        schedule_irq(8, 10)
+    irq_id = schedule_irq(3, 10)
+    assert is_irq_active(irq_id)
+    assert get_num_irqs() == 1
+    cancel_irq(irq_id)
+    assert not is_irq_active(irq_id)
+    assert get_num_irqs() == 0
+    with pytest.raises(ValueError):
+        cancel_irq(irq_id)
+    # fill all entries
+    for i in range(get_max_irqs()):
+        schedule_irq(1, 10)
+    with pytest.raises(MemoryError):
+        schedule_irq(1, 10)
+    cancel_all_irqs()
+    assert get_num_irqs() == 0
+
+
+def test_irq_periodic_autovec(mach):
+    # loop: bra.s loop
+    setup_prog([0x60fe])
+    w32(0x6c, HANDLER)  # level 3 autovector
+    assert get_clock() == 0
+    irq_id = schedule_irq(3, 100, period=1000)
+    ne = execute(10000)
+    assert ne == 0
+    assert get_clock() >= 10000
+    # irqs at 100, 1100, ... 9100
+    assert r32(COUNTER) == 10
+    assert is_irq_active(irq_id)
+    cancel_irq(irq_id)
+
+
+def test_irq_periodic_stop(mach):
+    # loop: stop #$2000 ; bra.s loop
+    setup_prog([0x4e72, 0x2000, 0x60fa])
+    w32(0x70, HANDLER)  # level 4 autovector
+    schedule_irq(4, 500, period=500)
+    ne = execute(5000)
+    assert ne == 0
+    # irqs at 500, 1000, ... 4500
+    assert r32(COUNTER) == 9
+
+
+def test_irq_one_shot_vector(mach):
+    setup_prog([0x60fe])
+    w32(0x40 * 4, HANDLER)  # vector 64
+    irq_id = schedule_irq(5, 50, vector=0x40)
+    assert execute(20) == 0
+    assert r32(COUNTER) == 0
+    assert execute(100) == 0
+    assert r32(COUNTER) == 1
+    # one shot is released after ack
+    assert not is_irq_active(irq_id)
+    assert get_num_irqs() == 0
+    assert get_irq_level() == 0
+
+
+def test_irq_duration(mach):
+    setup_prog([0x60fe])
+    # mask all irqs
+    w_sr(0, 0x2700)
+    schedule_irq(2, 10, duration=100)
+    execute(50)
+    assert get_irq_level() == 2
+    execute(200)
+    assert get_irq_level() == 0
+    assert get_num_irqs() == 0
+    assert r32(COUNTER) == 0
+
+
+def test_irq_with_manual(mach):
+    setup_prog([0x60fe])
+    w32(0x6c, HANDLER)
+    # mask all irqs
+    w_sr(0, 0x2700)
+    set_irq(1)
+    schedule_irq(3, 10, duration=100)
+    execute(50)
+    assert get_irq_level() == 3
+    execute(200)
+    assert get_irq_level() == 1
+    set_irq(0)
+    assert get_irq_level() == 0
+
+
+def test_int_ack_vector_table(mach):
+    assert get_int_ack_vector(3) == INT_ACK_DYNAMIC
+    with pytest.raises(ValueError):
+        set_int_ack_vector(0, 0x40)
+    with pytest.raises(ValueError):
+        set_int_ack_vector(3, 0x100)
+    setup_prog([0x60fe])
+    w32(0x40 * 4, HANDLER)  # vector 64
+
+    def int_ack(level, pc):
+        raise RuntimeError("no python ack expected")
+    set_int_ack_func(int_ack)
+    assert has_callbacks()
+    for level in range(1, 8):
+        set_int_ack_vector(level, 0x40)
+    assert get_int_ack_vector(3) == 0x40
+    # no python ack left
+    assert not has_callbacks()
+    set_irq(3)
+    ne = execute(100)
+    assert ne == 0
+    assert r32(COUNTER) == 1
+    # auto cleared
+    assert get_irq_level() == 0
+    set_int_ack_func(None)
+
+
+def test_int_ack_vector_no_clear(mach):
+    setup_prog([0x60fe])
+    w32(0x6c, HANDLER)
+    set_int_ack_vector(3, M68K_INT_ACK_AUTOVECTOR, False)
+    set_irq(3)
+    execute(200)
+    # level stays asserted and irq is taken again
+    assert get_irq_level() == 3
+    assert r32(COUNTER) > 1
+    set_irq(0)
+
+
+def test_int_ack_vector_dynamic(mach):
+    setup_prog([0x60fe])
+    w32(0x6c, HANDLER)
+    set_int_ack_vector(2, 0x40)
+    levels = []
+
+    def int_ack(level, pc):
+        levels.append(level)
+        return M68K_INT_ACK_AUTOVECTOR
+    set_int_ack_func(int_ack)
+    set_irq(3)
+    execute(100)
+    assert set(levels) == {3}
+    assert r32(COUNTER) >= 1
+    set_irq(0)
+    set_int_ack_func(None)
+
+
+def test_irq_periodic_idle(mach):
+    set_idle_detection(True)
+    # loop: nop ; bra.s loop
+    setup_prog([NOP_OPCODE, 0x60fc])
+    w32(0x6c, HANDLER)
+    schedule_irq(3, 100, period=1000)
+    ne = execute(10000)
+    assert ne == 0
+    assert r32(COUNTER) == 10
+    assert get_idle_cycles() > 8000
+    set_idle_detection(False)
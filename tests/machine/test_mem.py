@@ -1,5 +1,6 @@
 from __future__ import print_function
 
+import array
 import pytest
 import traceback
 
@@ -182,6 +183,90 @@ def test_b_str(mem_rw):
     assert r_bstr(mem_rw) == s
 
 
+def test_struct_layout(mem_rw):
+    layout = StructLayout([(0, STRUCT_U32), (4, STRUCT_S16), (6, STRUCT_S8),
+                           (7, STRUCT_U8), (8, STRUCT_CSTR),
+                           (12, STRUCT_BSTR), (16, STRUCT_S32)])
+    assert len(layout) == 7
+    w_cstr(mem_rw + 0x100, b"hello")
+    w_bstr(mem_rw + 0x200, b"world")
+    layout.write(mem_rw, [0xdeadbeef, -2, -1, 0xff, mem_rw + 0x100,
+                          (mem_rw + 0x200) >> 2, -5])
+    assert r16(mem_rw + 4) == 0xfffe
+    assert layout.read(mem_rw) == (0xdeadbeef, -2, -1, 0xff, b"hello",
+                                   b"world", -5)
+    # partial write
+    layout.write(mem_rw, [None, 7, None, None, 0, 0, None])
+    assert layout.read(mem_rw) == (0xdeadbeef, 7, -1, 0xff, None, None, -5)
+    with pytest.raises(ValueError):
+        layout.write(mem_rw, [1, 2])
+    with pytest.raises(ValueError):
+        layout.read(0x100000)
+    with pytest.raises(ValueError):
+        StructLayout([(0, 42)])
+
+
+def test_struct_walk_list(mem_rw):
+    # three nodes: next pointer at offset 4, value at offset 8
+    nodes = [mem_rw + 0x10, mem_rw + 0x40, mem_rw + 0x20]
+    for i, node in enumerate(nodes):
+        nxt = nodes[i + 1] if i < 2 else 0
+        w32(node + 4, nxt)
+        w16(node + 8, i)
+    assert struct_walk_list(nodes[0], 4) == nodes
+    assert struct_walk_list(nodes[0], 4, True) == nodes[:2]
+    assert struct_walk_list(0, 4) == []
+    layout = StructLayout([(8, STRUCT_U16)])
+    assert layout.read_list(nodes[0], 4) == [
+        (nodes[0], (0,)), (nodes[1], (1,)), (nodes[2], (2,))]
+    with pytest.raises(ValueError):
+        struct_walk_list(nodes[0], 4, max_nodes=2)
+    # loop
+    w32(nodes[2] + 4, nodes[0])
+    with pytest.raises(ValueError):
+        struct_walk_list(nodes[0], 4)
+    # invalid pointer
+    w32(nodes[2] + 4, 0x100000)
+    with pytest.raises(ValueError):
+        struct_walk_list(nodes[0], 4)
+
+
+def test_heap(mem_rw):
+    heap = Heap(mem_rw, 0x1000)
+    assert heap.start == mem_rw
+    assert heap.size == 0x1000
+    a = heap.alloc(10)
+    assert a == mem_rw
+    assert heap.get_size(a) == 12
+    b = heap.alloc(0x20, 0x100)
+    assert b == mem_rw + 0x100
+    # the gap is used for small blocks
+    c = heap.alloc(4)
+    assert c == mem_rw + 12
+    assert heap.free(a) == 12
+    with pytest.raises(ValueError):
+        heap.free(a)
+    assert not heap.is_allocated(a)
+    # grow in place and move
+    b2 = heap.realloc(b, 0x40)
+    assert b2 == b
+    w32(c, 0xcafebabe)
+    c2 = heap.realloc(c, 0x200, clear=True)
+    assert c2 != c
+    assert r32(c2) == 0xcafebabe
+    assert r32(c2 + 4) == 0
+    assert heap.alloc(0x2000) == 0
+    stats = heap.get_stats()
+    assert stats[0] == 0x1000
+    assert stats[1] == 0x240
+    heap.clear()
+    assert heap.get_stats()[1] == 0
+    with pytest.raises(ValueError):
+        heap.alloc(4, 3)
+    with pytest.raises(ValueError):
+        Heap(0x100000, 0x1000)
+
+
 def test_cpu_trace_func(mem_rw):
     class Tester:
         value = None
@@ -517,6 +602,125 @@ def test_empty_rw(mach):
     assert ri.num_events == 0
 
 
+def test_mirror_memory(mach):
+    add_memory(1, 1, MEM_FLAGS_RW)
+    add_mirror(2, 1, MEM_FLAGS_RW, 0)
+    add_mirror(3, 1, MEM_FLAGS_READ, 1)
+    # mirror aliases the memory of the base page
+    cpu_w32(0x20100, 0xdeadbeef)
+    assert r32(0x100) == 0xdeadbeef
+    w16(0x10010, 0x1234)
+    assert cpu_r16(0x30010) == 0x1234
+    assert r_block(0x20100, 4) == b"\xde\xad\xbe\xef"
+    # a block must not run from page 1 into the mirror of page 0
+    with pytest.raises(ValueError):
+        r_block(0x1fffe, 4)
+    # read only mirror
+    cpu_w8(0x30000, 1)
+    ri = get_info()
+    assert ri.num_events == 1
+    assert ri.events[0].ev_type == CPU_EVENT_MEM_ACCESS
+
+
+def test_mirror_special(mach):
+    def r(mode, addr):
+        return addr & 0xff
+    add_mirror(2, 1, MEM_FLAGS_RW, 1)
+    add_special(1, 1, r, None)
+    # special page is reached through the mirror
+    assert cpu_r8(0x20012) == 0x12
+    # base page changes to memory
+    add_memory(1, 1, MEM_FLAGS_RW)
+    cpu_w8(0x20012, 0x42)
+    assert r8(0x10012) == 0x42
+
+
+def test_special_sub(mach):
+    class special:
+        w_val = None
+
+        def r(self, mode, addr):
+            return (21, None)
+
+        def w(self, mode, addr, val):
+            self.w_val = val
+    s = special()
+    # 4K special block inside the RAM page 0
+    assert add_special_sub(2, 1, s.r, s.w) == 0x2000
+    assert is_split_page(0)
+    # RAM around still works
+    w8(0x1fff, 42)
+    assert r8(0x1fff) == 42
+    w8(0x3000, 43)
+    assert r8(0x3000) == 43
+    # special sub page triggers callbacks
+    assert r8(0x2000) == 21
+    assert cpu_r16(0x2ffe) == 21
+    cpu_w8(0x2010, 11)
+    assert s.w_val == 11
+    ri = get_info()
+    assert ri.num_events == 0
+    # block access is clipped before the special sub page
+    w_block(0x1000, b"a" * 0x1000)
+    with pytest.raises(ValueError):
+        w_block(0x1000, b"a" * 0x1001)
+    assert r_block(0x3000, 0x10) == b"+" + b"\0" * 15
+    with pytest.raises(ValueError):
+        w_cstr(0x1ff0, b"a" * 16)
+    w_cstr(0x1ff0, b"a" * 15)
+
+
+def test_special_sub_full_page(mach):
+    def r(mode, addr):
+        return 7
+    # a range covering a whole page keeps the page unsplit
+    add_special_sub(16, 16, r, None)
+    assert not is_split_page(1)
+    assert r8(0x10000) == 7
+    # partial range splits the page
+    add_special_sub(32, 2, r, None)
+    assert is_split_page(2)
+    assert r8(0x21fff) == 7
+    assert cpu_r8(0x22000) == 0xff
+    ri = get_info()
+    assert ri.num_events == 1
+    assert ri.events[0].ev_type == CPU_EVENT_MEM_ACCESS
+    clear_info()
+    # overwrite with a page resets split
+    add_memory(2, 1, MEM_FLAGS_RW)
+    assert not is_split_page(2)
+    w32(0x22000, 0xdeadbeef)
+    assert r32(0x22000) == 0xdeadbeef
+
+
+def test_empty_sub(mach):
+    assert add_empty_sub(1, 1, MEM_FLAGS_READ, 0x40302010) == 0x1000
+    assert r8(0x1000) == 0x10
+    assert r16(0x1000) == 0x2010
+    assert r32(0x1ffc) == 0x40302010
+    # RAM in the other sub pages
+    w32(0, 0x12345678)
+    assert r32(0) == 0x12345678
+    cpu_w16(0x2000, 0x1234)
+    assert cpu_r16(0x2000) == 0x1234
+    # write to read only empty sub page
+    cpu_w8(0x1000, 21)
+    ri = get_info()
+    assert ri.num_events == 1
+    assert ri.events[0].ev_type == CPU_EVENT_MEM_ACCESS
+    # cstr must not leave memory
+    w_block(0xff0, b"a" * 16)
+    with pytest.raises(ValueError):
+        r_cstr(0xff0)
+
+
+def test_invalid_sub(mach):
+    with pytest.raises(ValueError):
+        add_empty_sub(4 * 16 - 1, 2, MEM_FLAGS_RW, 0)
+    with pytest.raises(ValueError):
+        add_special_sub(0, 0, None, None)
+
+
 def test_api_trace_func(mach):
     class Tester:
         value = None
@@ -738,3 +942,89 @@ def test_api_access_str():
     assert s == "rb32  "
     s = get_api_access_str(MEM_ACCESS_W_B32)
     assert s == "wb32  "
+
+
+def test_sparse_page_table():
+    init(M68K_CPU_TYPE_68020, 0x10000)
+    assert get_num_page_blocks() == 0
+    add_memory(0, 2, MEM_FLAGS_RW)
+    add_memory(0xff80, 8, MEM_FLAGS_READ)
+    assert get_num_page_blocks() == 2
+    w32(0x1fffc, 0x12345678)
+    assert r32(0x1fffc) == 0x12345678
+    assert cpu_r32(0xff800000) == 0
+    # unmapped pages in between
+    with pytest.raises(ValueError):
+        r8(0x800000)
+    assert cpu_r8(0x800000) == 0xff
+    ri = get_info()
+    assert ri.num_events == 1
+    assert ri.events[0].ev_type == CPU_EVENT_MEM_ACCESS
+    # mirror into an unmapped block
+    add_mirror(0x1000, 2, MEM_FLAGS_RW, 0)
+    assert get_num_page_blocks() == 3
+    assert cpu_r32(0x1001fffc) == 0x12345678
+    shutdown()
+
+
+def test_snapshot(mach):
+    assert not has_snapshot()
+    assert restore_snapshot() == 0
+    w32(0x100, 0x11223344)
+    take_snapshot()
+    assert has_snapshot()
+    # nothing changed
+    assert restore_snapshot() == 0
+    # cpu and api writes are undone
+    cpu_w32(0x100, 0xdeadbeef)
+    w_block(0x3000, b"hello")
+    set_block(0x5ffe, 4, 0xaa)
+    # one sub page for the write, one for the block, two for the set
+    assert restore_snapshot() == 4
+    assert r32(0x100) == 0x11223344
+    assert r_block(0x3000, 5) == b"\0\0\0\0\0"
+    assert r32(0x5ffe) == 0
+    assert restore_snapshot() == 0
+    free_snapshot()
+    assert not has_snapshot()
+
+
+def test_typed_arrays(mach):
+    w16_array(0x100, [1, 2, 0xffff])
+    assert r_block(0x100, 6) == b"\x00\x01\x00\x02\xff\xff"
+    a = r16_array(0x100, 3)
+    assert isinstance(a, array.array)
+    assert a.tolist() == [1, 2, 0xffff]
+    assert rs16_array(0x100, 3).tolist() == [1, 2, -1]
+    ws32_array(0x200, array.array('i', [-1, 5]))
+    assert r32_array(0x200, 2).tolist() == [0xffffffff, 5]
+    assert rs32_array(0x200, 2).tolist() == [-1, 5]
+    ws16_array(0x300, (-2, 3))
+    assert r16_array(0x300, 2).tolist() == [0xfffe, 3]
+    # other buffers store their element values
+    w16_array(0x400, b"\x12\x34")
+    assert r16_array(0x400, 2).tolist() == [0x12, 0x34]
+    w32_array(0x500, memoryview(array.array('I', [0xdeadbeef])))
+    assert r32(0x500) == 0xdeadbeef
+    # empty
+    assert len(r16_array(0x100, 0)) == 0
+    w32_array(0x100, [])
+    # out of range
+    with pytest.raises(ValueError):
+        r16_array(0xfffe, 2)
+    with pytest.raises(ValueError):
+        w32_array(0xfffe, [1])
+    with pytest.raises(OverflowError):
+        w16_array(0x100, [-1])
+
+
+def test_typed_arrays_numpy(mach):
+    numpy = pytest.importorskip("numpy")
+    w16_array(0x100, [1, 0xfffe])
+    a = r_numpy(0x100, 2, '>u2')
+    assert a.tolist() == [1, 0xfffe]
+    assert r_numpy(0x100, 2, 'i2').tolist() == [1, -2]
+    w32_array(0x200, numpy.array([1, 2], dtype='>u4'))
+    assert r32_array(0x200, 2).tolist() == [1, 2]
+    w32_array(0x200, numpy.array([3, 4], dtype='<u4'))
+    assert r32_array(0x200, 2).tolist() == [3, 4]
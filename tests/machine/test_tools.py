@@ -79,6 +79,32 @@ def test_pc_trace_short(mach):
     cleanup_pc_trace()
     assert get_pc_trace_size() == 0
 
+
+def test_branch_trace(mach):
+    w16(0x100, 0x7002)  # moveq #2,d0
+    w16(0x102, NOP_OPCODE)
+    w32(0x104, 0x51c8fffc)  # dbra d0,0x102
+    w16(0x108, 0x6002)  # bra.s 0x10c
+    w16(0x10a, NOP_OPCODE)
+    w16(0x10c, RESET_OPCODE)
+    w_pc(0x100)
+    setup_pc_trace(16)
+    assert get_pc_trace_mode() == PC_TRACE_ALL
+    assert get_branch_trace() is None
+    set_pc_trace_mode(PC_TRACE_BRANCH)
+    assert get_pc_trace_mode() == PC_TRACE_BRANCH
+    ne = execute(100)
+    assert ne == 1
+    # dbra falls through on last round: no branch
+    trace = get_branch_trace()
+    assert trace == [(0x104, 0x102), (0x104, 0x102), (0x108, 0x10c)]
+    with pytest.raises(ValueError):
+        set_pc_trace_mode(2)
+    set_pc_trace_mode(PC_TRACE_ALL)
+    assert get_branch_trace() is None
+    cleanup_pc_trace()
+
+
 # ----- breakpoints -----
 
 
@@ -360,3 +386,276 @@ def test_timers_event(mach):
     assert ev.value == 0  # bp id
     assert ev.flags == 0  # offset to interval
     assert ev.data == "hello"
+
+
+def test_timers_slices(mach):
+    setup_timers(1)
+    set_timer(0, 1000, None)
+    # loop: bra.s loop
+    w16(0x100, 0x60fe)
+    w_pc(0x100)
+    num = 0
+    for i in range(20):
+        num += execute(100)
+    assert num == 2
+
+
+def test_timers_stop(mach):
+    setup_timers(1)
+    set_timer(0, 1000, "wake")
+    # stop #$2700
+    w16(0x100, 0x4e72)
+    w16(0x102, 0x2700)
+    w_pc(0x100)
+    ne = execute(100000)
+    assert ne == 1
+    ev = get_info().events[0]
+    assert ev.ev_type == CPU_EVENT_TIMER
+    assert ev.data == "wake"
+    assert get_done_cycles() <= 1100
+
+
+# ----- idle detection -----
+
+
+def test_idle_loop(mach):
+    assert not is_idle_detection_enabled()
+    set_idle_detection(True)
+    assert is_idle_detection_enabled()
+    # loop: tst.l $200.w ; beq.s loop
+    w16(0x100, 0x4ab8)
+    w16(0x102, 0x0200)
+    w16(0x104, 0x67fa)
+    w_pc(0x100)
+    ne = execute(100000)
+    assert ne == 0
+    assert get_done_cycles() >= 100000
+    assert get_idle_cycles() > 90000
+    set_idle_detection(False)
+
+
+def test_idle_loop_writes(mach):
+    set_idle_detection(True)
+    # loop: addq.l #1,$200.w ; bra.s loop
+    w16(0x100, 0x52b8)
+    w16(0x102, 0x0200)
+    w16(0x104, 0x60fa)
+    w_pc(0x100)
+    execute(10000)
+    assert get_idle_cycles() == 0
+    set_idle_detection(False)
+
+
+def test_idle_loop_timer(mach):
+    set_idle_detection(True)
+    setup_timers(1)
+    set_timer(0, 5000, "hello")
+    # loop: nop ; bra.s loop
+    w16(0x100, NOP_OPCODE)
+    w16(0x102, 0x60fc)
+    w_pc(0x100)
+    ne = execute(100000)
+    assert ne == 1
+    ev = get_info().events[0]
+    assert ev.ev_type == CPU_EVENT_TIMER
+    assert 5000 <= get_done_cycles() <= 5100
+    assert get_idle_cycles() > 4000
+    set_idle_detection(False)
+
+
+# ----- opcode stats -----
+
+
+def test_opcode_stats(mach):
+    assert get_opcode_stats() is None
+    setup_opcode_stats(True)
+    assert is_opcode_stats_enabled()
+    # 3 nops and a reset
+    w16(0x100, NOP_OPCODE)
+    w16(0x102, NOP_OPCODE)
+    w16(0x104, NOP_OPCODE)
+    w16(0x106, RESET_OPCODE)
+    w16(0x108, NOP_OPCODE)
+    w_pc(0x100)
+    ne = execute(1000)
+    assert ne == 1
+    stats = get_opcode_stats()
+    assert stats == {NOP_OPCODE: 3, RESET_OPCODE: 1}
+    assert get_instr_count() == 4
+    clear_opcode_stats()
+    assert get_opcode_stats() == {}
+    assert get_instr_count() == 0
+    setup_opcode_stats(False)
+    assert get_opcode_stats() is None
+
+
+# ----- coverage -----
+
+
+def test_coverage(mach):
+    assert get_coverage() is None
+    setup_coverage(True)
+    assert is_coverage_enabled()
+    assert get_coverage() == {}
+    w16(0x100, NOP_OPCODE)
+    w16(0x102, NOP_OPCODE)
+    w16(0x104, RESET_OPCODE)
+    w_pc(0x100)
+    execute(1000)
+    cov = get_coverage()
+    assert list(cov.keys()) == [0]
+    data = cov[0]
+    assert len(data) == get_coverage_page_size()
+    # words 0x80, 0x81, 0x82
+    assert data[0x10:0x11] == b"\x07"
+    clear_coverage()
+    assert get_coverage() == {}
+    # merge back
+    merge_coverage(0, data)
+    assert get_coverage() == cov
+    with pytest.raises(ValueError):
+        merge_coverage(0, b"\x00")
+    with pytest.raises(ValueError):
+        merge_coverage(1000, data)
+    setup_coverage(False)
+    assert get_coverage() is None
+
+
+# ----- edge map -----
+
+
+def test_edge_map(mach):
+    assert not is_edge_map_enabled()
+    assert get_edge_map() is None
+    with pytest.raises(ValueError):
+        setup_edge_map(1000)
+    setup_edge_map(0x1000)
+    assert is_edge_map_enabled()
+    assert get_edge_map_size() == 0x1000
+    w16(0x100, NOP_OPCODE)
+    w16(0x102, NOP_OPCODE)
+    w16(0x104, RESET_OPCODE)
+    w_pc(0x100)
+    execute(1000)
+    edges = get_edge_map()
+    assert len(edges) == 0x1000
+    assert sum(bytearray(edges)) == 3
+    assert update_edge_virgin() == EDGE_MAP_NEW_EDGE
+    assert get_num_edges() == 3
+    # same path again
+    clear_edge_map()
+    w_pc(0x100)
+    execute(1000)
+    assert update_edge_virgin() == EDGE_MAP_NONE
+    clear_edge_virgin()
+    assert get_num_edges() == 0
+    setup_edge_map(0)
+    assert not is_edge_map_enabled()
+
+
+def test_bp_count(mach):
+    setup_breakpoints(4)
+    assert get_breakpoint_hits() == [0, 0, 0, 0]
+    set_breakpoint(0, 0x100, MEM_FC_MASK | POINT_FLAG_COUNT, None)
+    set_breakpoint(1, 0x102, MEM_FC_MASK | POINT_FLAG_COUNT, None)
+    set_breakpoint(2, 0x106, MEM_FC_MASK, "stop")
+    w16(0x100, NOP_OPCODE)
+    w16(0x102, 0x51c8)  # dbra d0,0x100
+    w16(0x104, 0xfffc)
+    w16(0x106, RESET_OPCODE)
+    w_dx(0, 9)
+    w_pc(0x100)
+    # only the real breakpoint creates an event
+    execute(10000)
+    ev = get_info().events[0]
+    assert ev.ev_type == CPU_EVENT_BREAKPOINT
+    assert ev.value == 2
+    assert get_breakpoint_hits() == [10, 10, 1, 0]
+    clear_breakpoint_hits()
+    assert get_breakpoint_hits() == [0, 0, 0, 0]
+    # disabled points are not counted
+    disable_breakpoint(1)
+    w_dx(0, 0)
+    w_pc(0x100)
+    execute(10000)
+    assert get_breakpoint_hits() == [1, 0, 1, 0]
+    cleanup_breakpoints()
+    assert get_breakpoint_hits() == []
+
+
+def test_wp_count(mach):
+    setup_watchpoints(2)
+    set_watchpoint(0, 0x200, MEM_ACCESS_W16 | POINT_FLAG_COUNT, None)
+    w16(0x100, 0x31c0)  # move.w d0,$200.w
+    w16(0x102, 0x0200)
+    w16(0x104, 0x51c9)  # dbra d1,0x100
+    w16(0x106, 0xfffa)
+    w16(0x108, RESET_OPCODE)
+    w_dx(1, 4)
+    w_pc(0x100)
+    ne = execute(10000)
+    assert ne == 1
+    assert get_info().events[0].ev_type == CPU_EVENT_RESET
+    assert get_watchpoint_hits() == [5, 0]
+    clear_watchpoint_hits()
+    assert get_watchpoint_hits() == [0, 0]
+
+
+def test_bp_condition(mach):
+    setup_breakpoints(1)
+    set_breakpoint(0, 0x100, MEM_FC_MASK, None)
+    # stop at the loop head once d0 is 3
+    set_breakpoint_condition(0, [(COND_REG, M68K_REG_D0, COND_EQ, 3)])
+    w16(0x100, NOP_OPCODE)
+    w16(0x102, 0x51c8)  # dbra d0,0x100
+    w16(0x104, 0xfffc)
+    w16(0x106, RESET_OPCODE)
+    w_dx(0, 9)
+    w_pc(0x100)
+    execute(10000)
+    ev = get_info().events[0]
+    assert ev.ev_type == CPU_EVENT_BREAKPOINT
+    assert r_dx(0) == 3
+    assert get_breakpoint_hits() == [7]
+    # hit count threshold and signed compare
+    set_breakpoint_condition(0, [(COND_HITS, 0, COND_GE, 9),
+                                 (COND_REG, M68K_REG_D0, COND_SLT, 2)])
+    w_dx(0, 9)
+    w_pc(0x100)
+    execute(10000)
+    assert get_info().events[0].ev_type == CPU_EVENT_BREAKPOINT
+    assert r_dx(0) == 1
+    # too many terms
+    with pytest.raises(ValueError):
+        set_breakpoint_condition(0, [(COND_HITS, 0, COND_GE, 0)] * 9)
+    with pytest.raises(ValueError):
+        set_breakpoint_condition(0, [(COND_HITS + 1, 0, COND_GE, 0)])
+    # remove condition
+    set_breakpoint_condition(0, None)
+    w_pc(0x100)
+    execute(10000)
+    assert get_info().events[0].ev_type == CPU_EVENT_BREAKPOINT
+    assert r_dx(0) == 1
+
+
+def test_wp_condition(mach):
+    setup_watchpoints(1)
+    set_watchpoint(0, 0x200, MEM_ACCESS_W16, None)
+    # written value and memory compare
+    set_watchpoint_condition(0, [(COND_VALUE, 0, COND_EQ, 0),
+                                 (COND_MEM8, 0x300, COND_EQ, 0x12, 0xff)])
+    w8(0x300, 0x12)
+    w16(0x100, 0x31c1)  # move.w d1,$200.w
+    w16(0x102, 0x0200)
+    w16(0x104, 0x51c9)  # dbra d1,0x100
+    w16(0x106, 0xfffa)
+    w16(0x108, RESET_OPCODE)
+    w_dx(1, 4)
+    w_pc(0x100)
+    execute(10000)
+    ev = get_info().events[0]
+    assert ev.ev_type == CPU_EVENT_WATCHPOINT
+    assert r16(0x200) == 0
+    assert get_watchpoint_hits() == [5]
+    assert check_watchpoint(0x200, MEM_ACCESS_W16, 1) is None
+    assert check_watchpoint(0x200, MEM_ACCESS_W16, 0) == 0
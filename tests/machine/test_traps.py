@@ -242,3 +242,69 @@ def test_abs_traps(mach):
     assert traps_get_num_free() == 0x1000
     # after trap: aline is disabled again
     check_aline_cpu_ex(opcode)
+
+
+def test_call_trap(mach):
+    calls = []
+
+    def add(a, b):
+        calls.append((a, b))
+        return a + b
+    opcode = trap_setup_call(TRAP_AUTO_RTS, add,
+                             (M68K_REG_D0, M68K_REG_A0), M68K_REG_D0)
+    assert has_callbacks()
+    w_sp(0x200)
+    w32(0x200, 0x300)  # return address on stack
+    w16(0x300, RESET_OPCODE)
+    w_pc(0x100)
+    w16(0x100, opcode)
+    w_dx(0, 0xfffffffe)
+    w_ax(0, 3)
+    # no trap event: directly run into the reset after the rts
+    ne = execute(1000)
+    assert ne == 1
+    ri = get_info()
+    assert ri.events[0].ev_type == CPU_EVENT_RESET
+    assert calls == [(0xfffffffe, 3)]
+    assert r_dx(0) == 1
+    assert r_sp() == 0x204
+    trap_free(opcode)
+    assert not has_callbacks()
+    check_aline_cpu_ex(opcode)
+
+
+def test_call_trap_one_shot(mach):
+    calls = []
+    opcode = trap_setup_call_abs(0x20, TRAP_ONE_SHOT, lambda: calls.append(1))
+    assert opcode == 0xa020
+    w_pc(0x100)
+    w16(0x100, opcode)
+    w16(0x102, RESET_OPCODE)
+    ne = execute(1000)
+    assert ne == 1
+    assert get_info().events[0].ev_type == CPU_EVENT_RESET
+    assert calls == [1]
+    assert traps_get_num_free() == 0x1000
+    check_aline_cpu_ex(opcode)
+
+
+def test_call_trap_error(mach):
+    def fail(d1):
+        raise ValueError(d1)
+    opcode = trap_setup_call(TRAP_DEFAULT, fail, [M68K_REG_D1], M68K_REG_D0)
+    w_pc(0x100)
+    w16(0x100, opcode)
+    w_dx(1, 42)
+    ne = execute(1000)
+    assert ne == 1
+    ev = get_info().events[0]
+    assert ev.ev_type == CPU_EVENT_CALLBACK_ERROR
+    assert ev.data[0] is ValueError
+    assert ev.data[1].args == (42,)
+    trap_free(opcode)
+    with pytest.raises(ValueError):
+        trap_setup_call(TRAP_DEFAULT, fail, [M68K_REG_CPU_TYPE])
+    with pytest.raises(ValueError):
+        trap_setup_call(TRAP_DEFAULT, fail, [M68K_REG_D0] * 17)
+    with pytest.raises(TypeError):
+        trap_setup_call(TRAP_DEFAULT, None)
@@ -0,0 +1,152 @@
+import asyncio
+import pytest
+
+from bare68k import *
+from bare68k.api import *
+from bare68k.consts import *
+
+RESET_OPCODE = 0x4e70
+PROG_BASE = 0x1000
+STACK = 0x800
+
+
+def run_loop(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def create_runtime(mem_cfg=None, cycles_per_run=0):
+    cpu_cfg = CPUConfig(M68K_CPU_TYPE_68000)
+    if mem_cfg is None:
+        mem_cfg = MemoryConfig()
+        mem_cfg.add_ram_range(0, 1)
+    run_cfg = RunConfig(cycles_per_run=cycles_per_run)
+    rt = Runtime(cpu_cfg, mem_cfg, run_cfg)
+    rt.reset(PROG_BASE, STACK)
+    return rt
+
+
+def test_aio_run_done():
+    rt = create_runtime()
+    mem.w16(PROG_BASE, RESET_OPCODE)
+    ri = run_loop(rt.run_async())
+    assert ri.get_last_result() == CPU_EVENT_DONE
+    rt.shutdown()
+
+
+def test_aio_run_yields():
+    rt = create_runtime(cycles_per_run=1000)
+    # loop: move.l #$10000,d0; subq.l #1,d0; bne.s loop; reset
+    mem.w16(PROG_BASE, 0x203c)
+    mem.w32(PROG_BASE + 2, 0x10000)
+    mem.w16(PROG_BASE + 6, 0x5380)
+    mem.w16(PROG_BASE + 8, 0x66fc)
+    mem.w16(PROG_BASE + 10, RESET_OPCODE)
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(1)
+            await asyncio.sleep(0)
+
+    async def main():
+        t = asyncio.ensure_future(ticker())
+        ri = await rt.run_async()
+        t.cancel()
+        return ri
+    ri = run_loop(main())
+    assert ri.get_last_result() == CPU_EVENT_DONE
+    assert len(ticks) > 10
+    rt.shutdown()
+
+
+def test_aio_trap_handler():
+    rt = create_runtime()
+
+    async def handler(event):
+        await asyncio.sleep(0)
+        cpu.w_reg(M68K_REG_D0, 42)
+    op = traps.trap_setup(TRAP_DEFAULT, handler)
+    mem.w16(PROG_BASE, op)
+    mem.w16(PROG_BASE + 2, 0x2200)  # move.l d0,d1
+    mem.w16(PROG_BASE + 4, RESET_OPCODE)
+    ri = run_loop(rt.run_async())
+    assert ri.get_last_result() == CPU_EVENT_DONE
+    assert cpu.r_reg(M68K_REG_D1) == 42
+    rt.shutdown()
+
+
+def test_aio_trap_handler_sync_run():
+    rt = create_runtime()
+
+    async def handler(event):
+        await asyncio.sleep(0)
+    op = traps.trap_setup(TRAP_DEFAULT, handler)
+    mem.w16(PROG_BASE, op)
+    mem.w16(PROG_BASE + 2, RESET_OPCODE)
+    with pytest.raises(ConfigError) as e:
+        rt.run(max_cycles=1000)
+    assert "run_async" in str(e.value)
+    # the failed run is left completely
+    assert rt.get_top_end_pc() is None
+    assert rt._end_pcs == []
+    # a later run is not nested
+    mem.w16(PROG_BASE, RESET_OPCODE)
+    rt.get_run_cfg().set_pc_trace_size(8)
+    ri = rt.run(start_pc=PROG_BASE)
+    assert ri.get_last_result() == CPU_EVENT_DONE
+    assert tools.get_pc_trace()[-1] == PROG_BASE
+    rt.shutdown()
+
+
+def test_aio_special_write_sync_run():
+    mem_cfg = MemoryConfig()
+    mem_cfg.add_ram_range(0, 1)
+
+    async def send(val):
+        await asyncio.sleep(0)
+
+    def write(mode, addr, val):
+        return send(val)
+    mem_cfg.add_special_range(1, 1, None, write)
+    rt = create_runtime(mem_cfg)
+    mem.w16(PROG_BASE, 0x13fc)  # move.b #$41,$10000
+    mem.w16(PROG_BASE + 2, 0x41)
+    mem.w32(PROG_BASE + 4, 0x10000)
+    mem.w16(PROG_BASE + 8, RESET_OPCODE)
+    with pytest.raises(ConfigError):
+        rt.run()
+    rt.shutdown()
+
+
+def test_aio_special_write():
+    mem_cfg = MemoryConfig()
+    mem_cfg.add_ram_range(0, 1)
+    out = []
+
+    async def send(val):
+        await asyncio.sleep(0)
+        out.append(val)
+
+    def write(mode, addr, val):
+        return send(val)
+
+    def read(mode, addr):
+        return (len(out), None)
+    mem_cfg.add_special_range(1, 1, read, write)
+    rt = create_runtime(mem_cfg)
+    mem.w16(PROG_BASE, 0x13fc)  # move.b #$41,$10000
+    mem.w16(PROG_BASE + 2, 0x41)
+    mem.w32(PROG_BASE + 4, 0x10000)
+    mem.w16(PROG_BASE + 8, 0x1039)  # move.b $10000,d0
+    mem.w32(PROG_BASE + 10, 0x10000)
+    mem.w16(PROG_BASE + 14, RESET_OPCODE)
+    ri = run_loop(rt.run_async())
+    assert ri.get_last_result() == CPU_EVENT_DONE
+    assert out == [0x41]
+    # guest was suspended until the write completed
+    assert cpu.r_reg(M68K_REG_D0) == 1
+    rt.shutdown()
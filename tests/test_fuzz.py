@@ -0,0 +1,54 @@
+from bare68k.consts import *
+from bare68k.api import mem
+from bare68k.fuzz import *
+
+# guest parser: a0=buffer, d0=length
+#  "FUZ..." jumps to unmapped memory, "FUH..." loops forever
+PARSER = (
+    0xb07c, 0x0004,          # cmp.w #4,d0
+    0x6d28,                  # blt.s out
+    0x0c10, 0x0046,          # cmp.b #'F',(a0)
+    0x6622,                  # bne.s out
+    0x0c28, 0x0055, 0x0001,  # cmp.b #'U',1(a0)
+    0x661a,                  # bne.s out
+    0x0c28, 0x005a, 0x0002,  # cmp.b #'Z',2(a0)
+    0x6606,                  # bne.s +6
+    0x4ef9, 0x0001, 0x0000,  # jmp $10000
+    0x0c28, 0x0048, 0x0002,  # cmp.b #'H',2(a0)
+    0x6604,                  # bne.s out
+    0x4e71,                  # loop: nop
+    0x60fc,                  # bra.s loop
+    0x52b9, 0x0000, 0x0700,  # out: addq.l #1,$700
+    0x4e75,                  # rts
+)
+
+
+def setup_fuzzer(rt, **kwargs):
+    pc = rt.get_reset_pc()
+    for i, w in enumerate(PARSER):
+        mem.w16(pc + i * 2, w)
+    return Fuzzer(rt, pc, 0x2000, 64, 0x1f00, **kwargs)
+
+
+def test_fuzz_run_input(rt):
+    f = setup_fuzzer(rt, max_instructions=1000)
+    assert f.run_input(b"") == (FUZZ_OK, EDGE_MAP_NEW_EDGE)
+    assert f.run_input(b"") == (FUZZ_OK, EDGE_MAP_NONE)
+    assert f.run_input(b"FUxx") == (FUZZ_OK, EDGE_MAP_NEW_EDGE)
+    assert f.run_input(b"FUZ!")[0] == FUZZ_CRASH
+    assert f.run_input(b"FUH!")[0] == FUZZ_HANG
+    # memory is reset between runs
+    assert f.run_input(b"")[0] == FUZZ_OK
+    assert mem.r32(0x700) == 1
+    assert f.num_execs == 6
+    f.shutdown()
+
+
+def test_fuzz_loop(rt):
+    f = setup_fuzzer(rt, max_instructions=1000, seed=1)
+    assert f.add_seed(b"FUAA") == FUZZ_OK
+    f.fuzz(3000)
+    assert f.num_execs == 3001
+    assert any(c.startswith(b"FUZ") for c in f.crashes)
+    assert any(h.startswith(b"FUH") for h in f.hangs)
+    f.shutdown()
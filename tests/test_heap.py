@@ -0,0 +1,106 @@
+import random
+import pytest
+
+from bare68k.consts import *
+from bare68k.machine import *
+from bare68k.errors import ConfigError
+from bare68k.memcfg import MemoryConfig
+from bare68k.heap import GuestHeap
+
+
+def test_heap_alloc_free(mach):
+    heap = GuestHeap(0x1000, 0x8000)
+    a = heap.alloc(100)
+    b = heap.alloc(200, align=0x100, clear=True)
+    assert a == 0x1000
+    assert b & 0xff == 0
+    assert r_block(b, 200) == bytes(200)
+    stats = heap.get_stats()
+    assert stats.num_allocs == 2
+    assert stats.used_bytes == 100 + 200
+    assert stats.free_bytes == 0x8000 - 300
+    assert stats.num_free_blocks == 2
+    heap.free(a)
+    heap.free(b)
+    stats = heap.get_stats()
+    assert stats.used_bytes == 0
+    assert stats.num_free_blocks == 1
+    assert stats.largest_free == 0x8000
+    assert stats.peak_used_bytes == 300
+    assert stats.total_allocs == 2
+
+
+def test_heap_out_of_memory(mach):
+    heap = GuestHeap(0x1000, 0x100)
+    assert heap.alloc(0x100) == 0x1000
+    assert heap.alloc(4) == 0
+    assert heap.realloc(0x1000, 0x200) == 0
+    assert heap.get_size(0x1000) == 0x100
+    assert heap.get_stats().failed_allocs == 1
+
+
+def test_heap_random(mach):
+    # compare against a simple model of the live blocks
+    heap = GuestHeap(0x1000, 0xf000)
+    rnd = random.Random(4711)
+    blocks = {}
+    for _ in range(5000):
+        op = rnd.randint(0, 2)
+        if op == 0 or not blocks:
+            size = rnd.randint(1, 0x200)
+            addr = heap.alloc(size, align=rnd.choice([0, 16, 256]))
+            if addr != 0:
+                blocks[addr] = (size + 3) & ~3
+        elif op == 1:
+            addr = rnd.choice(list(blocks))
+            assert heap.free(addr) == blocks.pop(addr)
+        else:
+            addr = rnd.choice(list(blocks))
+            size = rnd.randint(1, 0x200)
+            new_addr = heap.realloc(addr, size)
+            if new_addr != 0:
+                del blocks[addr]
+                blocks[new_addr] = (size + 3) & ~3
+        stats = heap.get_stats()
+        assert stats.num_allocs == len(blocks)
+        assert stats.used_bytes == sum(blocks.values())
+        assert stats.used_bytes + stats.free_bytes == 0xf000
+    # no overlaps
+    last_end = 0x1000
+    for addr in sorted(blocks):
+        assert addr >= last_end
+        last_end = addr + blocks[addr]
+    assert last_end <= 0x10000
+    for addr in blocks:
+        heap.free(addr)
+    stats = heap.get_stats()
+    assert stats.num_free_blocks == 1
+    assert stats.largest_free == 0xf000
+
+
+def test_heap_from_range(mach):
+    mem_cfg = MemoryConfig()
+    mem_cfg.add_ram_range(0, 1)
+    mem_cfg.add_rom_range(2, 1)
+    ram, rom = mem_cfg.get_range_list()
+    heap = GuestHeap.from_range(ram, offset=0x1000)
+    assert heap.start == 0x1000
+    assert heap.size == 0xf000
+    with pytest.raises(ConfigError):
+        GuestHeap.from_range(rom)
+    with pytest.raises(ConfigError):
+        GuestHeap.from_range(ram, size=0x20000)
+
+
+def test_heap_page_zero(mach):
+    # 0 is the out of memory result
+    with pytest.raises(ValueError):
+        GuestHeap(0, 0x1000)
+    mem_cfg = MemoryConfig()
+    mem_cfg.add_ram_range(0, 1)
+    ram = mem_cfg.get_range_list()[0]
+    heap = GuestHeap.from_range(ram, granularity=16)
+    assert heap.start == 16
+    assert heap.size == 0x10000 - 16
+    assert heap.alloc(0x100) == 16
+    assert heap.alloc(0x10000) == 0
@@ -117,3 +117,66 @@ def test_memtypes():
     # mirror
     mrm = memcfg.add_mirror_range(7, 1, 0, name="mirror")
     assert mrm[0] == MemoryRange(7, 1, MEM_MIRROR, opts=0, name="mirror")
+
+
+def test_sub_ranges():
+    memcfg = MemoryConfig()
+    memcfg.add_ram_range(0, 1)
+
+    def r(*args):
+        pass
+    # sub ranges overlay page ranges
+    mrs = memcfg.add_special_sub_range(2, 1, r, None, name="chip")
+    assert mrs[0] == MemorySubRange(2, 1, MEM_SPECIAL, opts=(r, None))
+    mre = memcfg.add_empty_sub_range_addr(0x3000, 8)
+    assert mre[0] == MemorySubRange(3, 2, MEM_EMPTY, opts=0xffffffff)
+    assert memcfg.get_sub_range_list() == [mrs[0], mre[0]]
+    # but no other sub range
+    with pytest.raises(ConfigError):
+        memcfg.add_empty_sub_range(4, 1)
+    # not aligned
+    with pytest.raises(ConfigError):
+        memcfg.add_empty_sub_range_addr(0x3800, 4)
+    # sub ranges extend the required pages
+    assert memcfg.get_num_pages() == 1
+    memcfg.add_empty_sub_range(0x21, 1)
+    assert memcfg.get_num_pages() == 3
+    memcfg.check()
+
+
+def test_sub_ranges_check():
+    memcfg = MemoryConfig()
+    memcfg.add_ram_range(0, 1)
+    memcfg.add_rom_range(1, 1)
+    memcfg.add_special_range(2, 1, None, None)
+    memcfg.add_mirror_range(3, 1, 0)
+    memcfg.add_reserve_range(4, 1)
+    # overlay RAM and ROM
+    memcfg.add_empty_sub_range(1, 1)
+    memcfg.add_empty_sub_range(0x10, 1)
+    memcfg.check()
+    # no overlay of special, mirror or reserve pages
+    for page in (2, 3, 4):
+        srl = list(memcfg.sub_range_list)
+        memcfg.add_empty_sub_range(page * SUB_PAGES + 3, 1)
+        with pytest.raises(ConfigError):
+            memcfg.check()
+        memcfg.sub_range_list = srl
+    # no overlay of the RAM at zero
+    memcfg.add_empty_sub_range(0, 1)
+    with pytest.raises(ConfigError):
+        memcfg.check()
+    memcfg.check(ram_at_zero=False)
+    # overlapping sub ranges added directly
+    memcfg.sub_range_list.append(MemorySubRange(0x10, 2, MEM_EMPTY))
+    with pytest.raises(ConfigError):
+        memcfg.check(ram_at_zero=False)
+    memcfg.sub_range_list.pop()
+    # not aligned
+    sr = MemorySubRange(0x11, 1, MEM_EMPTY)
+    sr.start_addr = 0x11100
+    memcfg.sub_range_list.append(sr)
+    with pytest.raises(ConfigError):
+        memcfg.check(ram_at_zero=False)
+    sr.start_addr = 0x11000
+    memcfg.check(ram_at_zero=False)
@@ -1,6 +1,7 @@
 import pytest
 import traceback
 import logging
+import time
 
 from bare68k import *
 from bare68k.api import *
@@ -280,6 +281,35 @@ def test_rt_mem_special_val():
 
     rt.shutdown()
 
+
+def test_rt_mem_special_sub():
+    runtime.log_setup()
+    cpu_cfg = CPUConfig(M68K_CPU_TYPE_68000)
+    mem_cfg = MemoryConfig()
+    mem_cfg.add_ram_range(0, 1)
+    mem_cfg.add_ram_range(1, 1)
+
+    def read(mode, addr):
+        return (42, "read")
+    mem_cfg.add_special_sub_range_addr(0x18000, 4, read, None)
+    run_cfg = RunConfig()
+    rt = Runtime(cpu_cfg, mem_cfg, run_cfg)
+    PROG_BASE = 0x1000
+    STACK = 0x800
+    rt.reset(PROG_BASE, STACK)
+    # RAM next to the special sub page is not affected
+    mem.w32(0x17ffc, 0x1234)
+    mem.w16(PROG_BASE, 0x2039)  # move.l <32b_addr>,d0
+    mem.w32(PROG_BASE + 2, 0x17ffc)
+    mem.w16(PROG_BASE + 6, 0x2039)  # move.l <32b_addr>,d0
+    mem.w32(PROG_BASE + 8, 0x18000)
+    mem.w16(PROG_BASE + 12, RESET_OPCODE)
+    ri = rt.run()
+    assert ri.get_last_result() == CPU_EVENT_MEM_SPECIAL
+    assert ri.get_last_event().addr == 0x18000
+    rt.shutdown()
+
+
 # --- instr_hook ---
 
 
@@ -441,6 +471,87 @@ def test_rt_recursive_run(rt):
     assert ri.get_last_result() == CPU_EVENT_DONE
 
 
+def test_rt_call(rt):
+    PROG_BASE = rt.get_reset_pc()
+    func = PROG_BASE + 0x100
+    # no trampoline yet
+    with pytest.raises(ConfigError):
+        rt.call(func)
+    rt.set_call_trampoline(PROG_BASE + 0x80)
+    # d0 = first stack arg + d1
+    mem.w32(func, 0x202f0004)  # move.l 4(sp),d0
+    mem.w16(func + 4, 0xd081)  # add.l d1,d0
+    mem.w16(func + 6, 0x4e75)  # rts
+    cpu.w_dx(0, 0xdead)
+    cpu.w_dx(1, 1)
+    sp = cpu.r_sp()
+    pc = cpu.r_pc()
+    assert rt.call(func, {M68K_REG_D1: 5}, [10, 20]) == 15
+    assert rt.call(func, {M68K_REG_D1: 1}, [-2]) == 0xffffffff
+    # cpu state is restored
+    assert cpu.r_regs((M68K_REG_D0, M68K_REG_D1, M68K_REG_SP,
+                       M68K_REG_PC)) == (0xdead, 1, sp, pc)
+    # function does not return
+    mem.w16(func, RESET_OPCODE)
+    with pytest.raises(CallError) as e:
+        rt.call(func)
+    assert e.value.run_info.get_last_result() == CPU_EVENT_RESET
+    assert cpu.r_sp() == sp
+
+
+def test_rt_call_nested(rt):
+    PROG_BASE = rt.get_reset_pc()
+    func = PROG_BASE + 0x100
+    rt.set_call_trampoline(PROG_BASE + 0x80)
+    # d0 = d0 * 2
+    mem.w16(func, 0xd080)  # add.l d0,d0
+    mem.w16(func + 2, 0x4e75)  # rts
+    results = []
+
+    def trap_cb(event):
+        for i in range(3):
+            results.append(rt.call(func, {M68K_REG_D0: i}))
+    op = traps.trap_setup(TRAP_DEFAULT, trap_cb)
+    mem.w16(PROG_BASE, 0x7005)  # moveq #5,d0
+    mem.w16(PROG_BASE + 2, op)
+    mem.w16(PROG_BASE + 4, RESET_OPCODE)
+    rt.get_run_cfg().set_pc_trace_size(16)
+    ri = rt.run()
+    assert ri.get_last_result() == CPU_EVENT_DONE
+    assert results == [0, 2, 4]
+    assert cpu.r_dx(0) == 5
+    # the pc trace of the outer run is kept
+    assert tools.get_pc_trace()[0] == PROG_BASE
+
+
+def test_rt_call_in_direct_trap(rt):
+    """a direct call trap must not call into the CPU again"""
+    PROG_BASE = rt.get_reset_pc()
+    func = PROG_BASE + 0x100
+    rt.set_call_trampoline(PROG_BASE + 0x80)
+    mem.w16(func, 0x4e75)  # rts
+    errors = []
+
+    def trap_func():
+        try:
+            rt.call(func)
+        except CallError as e:
+            errors.append(e)
+    op = traps.trap_setup_call(TRAP_DEFAULT, trap_func)
+    mem.w16(PROG_BASE, 0x7005)  # moveq #5,d0
+    mem.w16(PROG_BASE + 2, op)
+    mem.w16(PROG_BASE + 4, 0x7203)  # moveq #3,d1
+    mem.w16(PROG_BASE + 6, RESET_OPCODE)
+    ri = rt.run()
+    assert ri.get_last_result() == CPU_EVENT_DONE
+    assert len(errors) == 1
+    # outer run is not disturbed
+    assert cpu.r_dx(0) == 5
+    assert cpu.r_dx(1) == 3
+    assert cpu.r_pc() == PROG_BASE + 8
+    assert not cpu.is_executing()
+
+
 def test_rt_instr_trace(rt):
     PROG_BASE = rt.get_reset_pc()
     # label range
@@ -563,3 +674,70 @@ def test_rt_api_mem_trace(rt):
     # check log
     msgs = cl.get_msgs(logging.INFO)
     assert msgs is None
+
+
+def test_rt_idle_detection():
+    runtime.log_setup()
+    cpu_cfg = CPUConfig(M68K_CPU_TYPE_68000)
+    mem_cfg = MemoryConfig()
+    mem_cfg.add_ram_range(0, 1)
+    run_cfg = RunConfig(idle_detection=True)
+    rt = Runtime(cpu_cfg, mem_cfg, run_cfg)
+    assert tools.is_idle_detection_enabled()
+    PROG_BASE = 0x1000
+    STACK = 0x800
+    rt.reset(PROG_BASE, STACK)
+    # loop: nop ; dbra d0,loop ; reset
+    mem.w16(PROG_BASE, NOP_OPCODE)
+    mem.w16(PROG_BASE + 2, 0x51c8)
+    mem.w16(PROG_BASE + 4, 0xfffc)
+    mem.w16(PROG_BASE + 6, RESET_OPCODE)
+    cpu.w_dx(0, 100)
+    ri = rt.run()
+    assert ri.get_last_result() == CPU_EVENT_DONE
+    # counting loop is not idle
+    assert tools.get_idle_cycles() == 0
+    rt.shutdown()
+
+
+def test_rt_budget(rt):
+    PROG_BASE = 0x1000
+    # loop: nop ; bra.s loop
+    mem.w16(PROG_BASE, NOP_OPCODE)
+    mem.w16(PROG_BASE + 2, 0x60fc)
+    ri = rt.run(max_cycles=10000)
+    assert ri.get_last_result() == CPU_EVENT_BUDGET
+    assert ri.total_cycles >= 10000
+    ri = rt.run(start_pc=PROG_BASE, max_instructions=100)
+    assert ri.get_last_result() == CPU_EVENT_BUDGET
+    ri = rt.run(start_pc=PROG_BASE, deadline=time.time() + 0.01)
+    assert ri.get_last_result() == CPU_EVENT_BUDGET
+
+
+def test_rt_budget_nested(rt):
+    PROG_BASE = rt.get_reset_pc()
+    func = PROG_BASE + 0x100
+    rt.set_call_trampoline(PROG_BASE + 0x80)
+    # func loops forever
+    mem.w16(func, 0x60fe)  # bra.s *
+    # sub code runs a few nops without a limit
+    for i in range(10):
+        mem.w16(PROG_BASE + 0x40 + i * 2, NOP_OPCODE)
+    mem.w16(PROG_BASE + 0x54, RESET_OPCODE)
+    results = []
+
+    def trap_cb(event):
+        # own limit of a nested call
+        with pytest.raises(CallError) as e:
+            rt.call(func, max_instructions=100)
+        results.append(e.value.run_info.get_last_result())
+        # no limit: outer budget does not apply
+        ri = rt.run(start_pc=PROG_BASE + 0x40)
+        results.append(ri.get_last_result())
+    op = traps.trap_setup(TRAP_DEFAULT, trap_cb)
+    mem.w16(PROG_BASE, op)
+    mem.w16(PROG_BASE + 2, 0x60fe)  # bra.s *
+    ri = rt.run(max_instructions=5)
+    assert ri.get_last_result() == CPU_EVENT_BUDGET
+    assert results == [CPU_EVENT_BUDGET, CPU_EVENT_DONE]
+    assert cpu.get_budget()[2] == 0
@@ -0,0 +1,73 @@
+import pytest
+
+from bare68k.consts import *
+from bare68k.machine import *
+from bare68k.struct import StructDef, walk_list
+
+Node = StructDef("Node", [
+    ("ln_Succ", STRUCT_U32),
+    ("ln_Pred", STRUCT_U32),
+    ("ln_Type", STRUCT_U8),
+    ("ln_Pri", STRUCT_S8),
+    ("ln_Name", STRUCT_CSTR),
+])
+
+LIST = 0x100
+TAIL = LIST + 4
+
+
+def test_struct_def():
+    assert Node.size == 14
+    assert Node.get_field_names() == ["ln_Succ", "ln_Pred", "ln_Type",
+                                      "ln_Pri", "ln_Name"]
+    assert Node.get_offset("ln_Name") == 10
+    assert Node.get_type("ln_Pri") == STRUCT_S8
+    # auto alignment and explicit offsets
+    s = StructDef("Foo", [("a", STRUCT_U8), ("b", STRUCT_U16),
+                          ("c", STRUCT_U32, 8)])
+    assert s.get_offset("b") == 2
+    assert s.size == 12
+    with pytest.raises(ValueError):
+        StructDef("Bar", [("a", STRUCT_U16, 1)])
+    with pytest.raises(ValueError):
+        StructDef("Bar", [("a", STRUCT_U16), ("a", STRUCT_U8)])
+    with pytest.raises(ValueError):
+        StructDef("Bar", [("a", 99)])
+
+
+def test_struct_read_write(mach):
+    w_cstr(0x200, b"node")
+    Node.write(0x300, ln_Succ=0x400, ln_Pred=0x500, ln_Type=3, ln_Pri=-10,
+               ln_Name=0x200)
+    node = Node.read(0x300)
+    assert node.ln_Succ == 0x400
+    assert node.ln_Pred == 0x500
+    assert node.ln_Type == 3
+    assert node.ln_Pri == -10
+    assert node.ln_Name == b"node"
+    Node.write(0x300, ln_Pri=5)
+    assert Node.read(0x300) == node._replace(ln_Pri=5)
+    with pytest.raises(ValueError):
+        Node.write(0x300, foo=1)
+
+
+def test_struct_exec_list(mach):
+    # exec style list with head and tail node in list header
+    addrs = [0x400, 0x420, 0x440]
+    succ = addrs[1:] + [TAIL]
+    pred = [LIST] + addrs[:-1]
+    for i, addr in enumerate(addrs):
+        w_cstr(addr + 0x10, b"n%d" % i)
+        Node.write(addr, ln_Succ=succ[i], ln_Pred=pred[i], ln_Pri=i,
+                   ln_Name=addr + 0x10)
+    w32(LIST, addrs[0])
+    w32(TAIL, 0)
+    w32(LIST + 8, addrs[-1])
+    first = r32(LIST)
+    assert walk_list(first, 0, skip_tail=True) == addrs
+    nodes = Node.read_list(first, "ln_Succ", skip_tail=True)
+    assert [addr for addr, _ in nodes] == addrs
+    assert [n.ln_Name for _, n in nodes] == [b"n0", b"n1", b"n2"]
+    # empty list
+    w32(LIST, TAIL)
+    assert Node.read_list(r32(LIST), "ln_Succ", skip_tail=True) == []